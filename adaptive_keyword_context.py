@@ -5,14 +5,189 @@ Utilise uniquement des services GRATUITS et SANS LIMITE
 """
 
 import re
+import asyncio
+import functools
+import itertools
+import logging
+import operator
+import threading
 import requests
-from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Any, Optional, Tuple
 from urllib.parse import quote_plus
 import time
 import random
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup
 from datetime import datetime
 
+# aiohttp est optionnel : sans lui, l'autocomplétion passe par le pool de threads
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# orjson décode 2 à 3x plus vite que json ; repli sur la bibliothèque standard
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# Timeouts (connexion, lecture) des appels d'autocomplétion : échec rapide sur un endpoint mort
+_AUTOCOMPLETE_TIMEOUT = (2, 5)
+_SUGGESTION_CACHE_SIZE = 2048
+
+# APIs publiques de suggestions (pas d'authentification nécessaire) : url, paramètre de requête, paramètres fixes
+_AUTOCOMPLETE_ENDPOINTS = {
+    'google': ("http://suggestqueries.google.com/complete/search", 'q', {'client': 'chrome', 'hl': 'en'}),
+    'bing': ("https://api.bing.com/osjson.aspx", 'query', {'language': 'en-US'})
+}
+
+logger = logging.getLogger(__name__)
+
+_ITEMGETTER1 = operator.itemgetter(1)
+
+# Expressions régulières compilées une seule fois à l'import
+_RE_WORDS = re.compile(r'\b[a-zA-Z]+\b')
+_RE_CAMEL = re.compile(r'\b[A-Z][a-z]*[A-Z][a-z]*\b')  # CamelCase/Acronymes
+_RE_NUM = re.compile(r'\d+\.?\d*')
+_RE_NUM_CTX = re.compile(r'\d+\.?\d*(?:\s*%|\s*vs|\s*expected)?')
+_RE_CAPS = re.compile(r'\b[A-Z][a-zA-Z]*\b')
+# Références temporelles : mois, abréviations, périodicité et révisions en une seule passe
+_RE_TIME = re.compile(
+    r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December'
+    r'|Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sep|Oct|Nov|Dec'
+    r'|Q[1-4]|quarterly|monthly|weekly|daily'
+    r'|preliminary|prelim|final|revised)\b',
+    re.IGNORECASE
+)
+
+# Vocabulaires de classification (recherche O(1) par mot)
+_TIME_WORDS = frozenset({
+    'september', 'october', 'november', 'december', 'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august',
+    'quarterly', 'monthly', 'weekly', 'daily', 'prelim', 'preliminary', 'final'
+})
+_ACTION_WORDS = frozenset({'rises', 'falls', 'announces', 'reports', 'expects', 'beats', 'misses', 'forecasts', 'predicts', 'shows', 'indicates'})
+_SENTIMENT_WORDS = frozenset({'sentiment', 'confidence', 'optimism', 'pessimism', 'mood', 'outlook'})
+# Tuple (et non frozenset) : la liste est renvoyée telle quelle, son ordre doit rester stable
+_COMPARISON_WORDS = ('vs', 'versus', 'compared', 'expected')
+_COMMON_CAPS = frozenset({'The', 'A', 'An', 'In', 'On', 'At', 'By', 'For', 'With', 'As', 'And', 'Or', 'But'})
+# Index mot -> catégorie pour classer les tokens en une seule passe
+_WORD_BUCKET = {
+    **{word: 'time_indicators' for word in _TIME_WORDS},
+    **{word: 'action_words' for word in _ACTION_WORDS},
+    **{word: 'sentiment_indicators' for word in _SENTIMENT_WORDS}
+}
+_STOP_WORDS = frozenset({'with', 'from', 'that', 'this', 'they', 'have', 'been', 'were', 'said', 'each', 'which', 'their'})
+
+# Modificateurs adaptatifs précalculés pour chaque type de headline
+_BASE_MODIFIERS = ('latest', 'current', 'recent', 'new', '2024', 'today')
+_TYPE_SPECIFIC_MODIFIERS = {
+    'data_release_with_comparison': ('analysis', 'report', 'data', 'results'),
+    'periodic_data_release': ('monthly', 'quarterly', 'report', 'survey'),
+    'action_announcement': ('news', 'announcement', 'update', 'breaking'),
+    'sentiment_report': ('consumer', 'market', 'economic', 'business'),
+    'corporate_news': ('company', 'business', 'stock', 'financial')
+}
+_MODIFIERS = {headline_type: _BASE_MODIFIERS + specific for headline_type, specific in _TYPE_SPECIFIC_MODIFIERS.items()}
+_DEFAULT_MODIFIERS = _BASE_MODIFIERS + ('business', 'news')
+
+def _autocomplete_request(engine: str, term: str) -> Tuple[str, Dict[str, str]]:
+    """URL et paramètres de la requête de suggestions pour un moteur"""
+    url, query_param, base_params = _AUTOCOMPLETE_ENDPOINTS[engine]
+    return url, {**base_params, query_param: term}
+
+def _parse_suggestions(data) -> Tuple[str, ...]:
+    """Format OpenSearch : [requête, [suggestions, ...], ...]"""
+    suggestions = data[1] if len(data) > 1 else []
+    return tuple(suggestions[:10])  # Limiter à 10
+
+def _event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+@functools.lru_cache(maxsize=512)
+def _normalize_headline(headline: str) -> Tuple[str, Tuple[str, ...]]:
+    """Minuscules + tokenisation calculées une seule fois par headline et partagées entre analyses"""
+    headline_lower = headline.lower()
+    return headline_lower, tuple(_RE_WORDS.findall(headline_lower))
+
+def _to_plain(value):
+    """Convertit récursivement enregistrements/tuples en dict/listes (sérialisation JSON)"""
+    if isinstance(value, Mapping):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_to_plain(item) for item in value]
+    return value
+
+class _AnalysisRecord(Mapping):
+    """
+    Base des résultats d'analyse immuables (dataclass à slots)
+    Reste lisible comme l'ancien dict : record['clé'], record.get('clé'), dict(record)
+    """
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self):
+        return (field.name for field in fields(self))
+    
+    def __len__(self):
+        return len(self.__dataclass_fields__)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return _to_plain(self)
+
+@dataclass(frozen=True, slots=True)
+class HeadlineContext(_AnalysisRecord):
+    """Résultat de detect_headline_domain"""
+    primary_domain: str
+    domain_confidence: float
+    extracted_patterns: Dict[str, Tuple[str, ...]]  # dict simple: l'enregistrement reste copiable et picklable
+    headline_type: str
+    analysis_timestamp: float  # time.time() ; formaté à la demande via timestamp_iso
+    
+    @property
+    def timestamp_iso(self) -> str:
+        return datetime.fromtimestamp(self.analysis_timestamp).isoformat()
+
+@dataclass(frozen=True, slots=True)
+class EntityExtraction(_AnalysisRecord):
+    """Résultat de extract_adaptive_entities"""
+    primary_entities: Tuple[str, ...]
+    secondary_entities: Tuple[str, ...]
+    numerical_data: Tuple[str, ...]
+    temporal_references: Tuple[str, ...]
+    key_concepts: Tuple[str, ...]
+
+@dataclass(frozen=True, slots=True)
+class SearchStrategy(_AnalysisRecord):
+    """Résultat de generate_adaptive_search_strategy"""
+    headline: str
+    context: HeadlineContext
+    extracted_entities: EntityExtraction
+    adaptive_search_terms: Tuple[str, ...]
+    autocomplete_suggestions: Tuple[str, ...]
+    total_terms_generated: int
+    strategy_timestamp: float  # time.time() ; formaté à la demande via timestamp_iso
+    
+    @property
+    def timestamp_iso(self) -> str:
+        return datetime.fromtimestamp(self.strategy_timestamp).isoformat()
+
 class AdaptiveKeywordContextAnalyzer:
     """
     Analyse automatiquement le contexte du HEADLINE pour adapter la stratégie
@@ -20,13 +195,34 @@ class AdaptiveKeywordContextAnalyzer:
     """
     
     def __init__(self):
-        print("✅ Adaptive keyword context analyzer initialized (100% FREE APIs)")
+        logger.info("✅ Adaptive keyword context analyzer initialized (100% FREE APIs)")
         
         # User agents pour éviter les blocages
         self._user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         ]
+        
+        # Session partagée : les connexions keep-alive sont réutilisées entre les appels
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, connect=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._session.headers.update(self.get_headers())
+        self._session.headers['Accept-Encoding'] = 'gzip, deflate'  # Réponses compressées
+        
+        # Cache LRU des suggestions par (moteur, terme normalisé), partagé entre les chemins sync et async
+        # (les échecs ne sont pas mis en cache)
+        self._suggestion_cache = OrderedDict()
+        self._suggestion_cache_lock = threading.Lock()
+        
+        # Cache LRU des analyses par headline (un même headline est analysé plusieurs fois par pipeline)
+        self._cached_domain = functools.lru_cache(maxsize=512)(self._analyze_headline_domain)
+        self._cached_entities = functools.lru_cache(maxsize=512)(self._analyze_adaptive_entities)
     
     def get_headers(self):
         """Génère des headers aléatoires pour éviter la détection"""
@@ -37,23 +233,33 @@ class AdaptiveKeywordContextAnalyzer:
             'Connection': 'keep-alive',
         }
     
-    def detect_headline_domain(self, headline: str) -> Dict[str, Any]:
+    def detect_headline_domain(self, headline: str) -> HeadlineContext:
         """Détecte automatiquement le domaine du headline SANS valeurs hardcodées"""
-        print(f"🔍 Analyzing headline context: '{headline[:50]}...'")
+        # Résultat immuable : il peut être partagé depuis le cache sans copie
+        return self._cached_domain(headline)
+    
+    def _analyze_headline_domain(self, headline: str) -> HeadlineContext:
+        """Analyse de domaine effective, mise en cache par headline via lru_cache"""
+        logger.debug("🔍 Analyzing headline context: '%s...'", headline[:50])
         
-        headline_lower = headline.lower()
-        words = re.findall(r'\b[a-zA-Z]+\b', headline_lower)
+        headline_lower, words = _normalize_headline(headline)
         
         # Extraction automatique des patterns
         extracted_patterns = {
-            'organizations': re.findall(r'\b[A-Z][a-z]*[A-Z][a-z]*\b', headline),  # CamelCase/Acronymes
-            'measurements': re.findall(r'\d+\.?\d*', headline),
-            'comparisons': ['vs', 'versus', 'compared', 'expected'] if any(comp in headline_lower for comp in ['vs', 'versus', 'compared', 'expected']) else [],
-            'time_indicators': [word for word in words if word in ['september', 'october', 'november', 'december', 'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'quarterly', 'monthly', 'weekly', 'daily', 'prelim', 'preliminary', 'final']],
-            'action_words': [word for word in words if word in ['rises', 'falls', 'announces', 'reports', 'expects', 'beats', 'misses', 'forecasts', 'predicts', 'shows', 'indicates']],
-            'sentiment_indicators': [word for word in words if word in ['sentiment', 'confidence', 'optimism', 'pessimism', 'mood', 'outlook']]
+            'organizations': _RE_CAMEL.findall(headline),  # CamelCase/Acronymes
+            'measurements': _RE_NUM.findall(headline),
+            'comparisons': list(_COMPARISON_WORDS) if any(comp in headline_lower for comp in _COMPARISON_WORDS) else [],
+            'time_indicators': [],
+            'action_words': [],
+            'sentiment_indicators': []
         }
         
+        # Classement des mots dans leur catégorie en un seul parcours
+        for word in words:
+            bucket = _WORD_BUCKET.get(word)
+            if bucket:
+                extracted_patterns[bucket].append(word)
+        
         # Détermination automatique du domaine principal
         domain_scores = {
             'economic_data': len(extracted_patterns['measurements']) + len(extracted_patterns['time_indicators']) + len(extracted_patterns['sentiment_indicators']),
@@ -63,28 +269,26 @@ class AdaptiveKeywordContextAnalyzer:
             'general_business': 0  # Ajout de cette clé avec valeur par défaut
         }
         
-        primary_domain = max(domain_scores.keys(), key=domain_scores.get) if any(domain_scores.values()) else 'general_business'
+        primary_domain = max(domain_scores.items(), key=_ITEMGETTER1)[0] if any(domain_scores.values()) else 'general_business'
         
         # Classification automatique du type de headline
-        headline_type = self._classify_headline_type_automatically(headline, extracted_patterns)
-        
-        result = {
-            'primary_domain': primary_domain,
-            'domain_confidence': domain_scores[primary_domain] / max(sum(domain_scores.values()), 1),
-            'extracted_patterns': extracted_patterns,
-            'headline_type': headline_type,
-            'analysis_timestamp': datetime.now().isoformat()
-        }
+        headline_type = self._classify_headline_type_automatically(headline_lower, extracted_patterns)
+        
+        result = HeadlineContext(
+            primary_domain=primary_domain,
+            domain_confidence=domain_scores[primary_domain] / max(sum(domain_scores.values()), 1),
+            extracted_patterns={key: tuple(values) for key, values in extracted_patterns.items()},
+            headline_type=headline_type,
+            analysis_timestamp=time.time()
+        )
         
-        print(f"✅ Detected domain: {primary_domain} (confidence: {result['domain_confidence']:.2f})")
-        print(f"📊 Headline type: {headline_type}")
+        logger.info("✅ Detected domain: %s (confidence: %.2f)", primary_domain, result.domain_confidence)
+        logger.debug("📊 Headline type: %s", headline_type)
         
         return result
     
-    def _classify_headline_type_automatically(self, headline: str, patterns: Dict) -> str:
+    def _classify_headline_type_automatically(self, headline_lower: str, patterns: Dict) -> str:
         """Classifie automatiquement le type de headline basé sur les patterns détectés"""
-        headline_lower = headline.lower()
-        
         if patterns['measurements'] and patterns['comparisons']:
             return 'data_release_with_comparison'
         elif patterns['measurements'] and patterns['time_indicators']:
@@ -98,9 +302,13 @@ class AdaptiveKeywordContextAnalyzer:
         else:
             return 'general_business_news'
     
-    def extract_adaptive_entities(self, headline: str) -> Dict[str, List[str]]:
+    def extract_adaptive_entities(self, headline: str) -> EntityExtraction:
         """Extrait automatiquement les entités importantes du headline"""
-        print(f"🎯 Extracting entities from: '{headline}'")
+        return self._cached_entities(headline)
+    
+    def _analyze_adaptive_entities(self, headline: str) -> EntityExtraction:
+        """Extraction d'entités effective, mise en cache par headline via lru_cache"""
+        logger.debug("🎯 Extracting entities from: '%s'", headline)
         
         entities = {
             'primary_entities': [],
@@ -111,90 +319,161 @@ class AdaptiveKeywordContextAnalyzer:
         }
         
         # Extraction des entités primaires (mots capitalisés significatifs)
-        capitalized_words = re.findall(r'\b[A-Z][a-zA-Z]*\b', headline)
+        capitalized_words = _RE_CAPS.findall(headline)
         # Filtrer les mots courants
-        common_words = {'The', 'A', 'An', 'In', 'On', 'At', 'By', 'For', 'With', 'As', 'And', 'Or', 'But'}
-        entities['primary_entities'] = [word for word in capitalized_words if word not in common_words]
+        entities['primary_entities'] = [word for word in capitalized_words if word not in _COMMON_CAPS]
         
         # Extraction des données numériques avec contexte
-        numerical_matches = re.findall(r'\d+\.?\d*(?:\s*%|\s*vs|\s*expected)?', headline)
+        numerical_matches = _RE_NUM_CTX.findall(headline)
         entities['numerical_data'] = numerical_matches
         
         # Extraction des références temporelles
-        time_patterns = [
-            r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\b',
-            r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b',
-            r'\b(?:Q[1-4]|quarterly|monthly|weekly|daily)\b',
-            r'\b(?:preliminary|prelim|final|revised)\b'
-        ]
-        
-        for pattern in time_patterns:
-            matches = re.findall(pattern, headline, re.IGNORECASE)
-            entities['temporal_references'].extend(matches)
+        entities['temporal_references'] = _RE_TIME.findall(headline)
         
         # Extraction des concepts clés (mots significatifs de plus de 3 lettres)
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', headline.lower())
-        stop_words = {'with', 'from', 'that', 'this', 'they', 'have', 'been', 'were', 'said', 'each', 'which', 'their'}
-        entities['key_concepts'] = [word for word in set(words) if word not in stop_words]
+        _, words = _normalize_headline(headline)
+        entities['key_concepts'] = [word for word in dict.fromkeys(words) if len(word) > 3 and word not in _STOP_WORDS]
         
-        print(f"✅ Extracted {len(entities['primary_entities'])} primary entities")
-        print(f"📊 Found {len(entities['numerical_data'])} numerical data points")
+        logger.debug("✅ Extracted %d primary entities", len(entities['primary_entities']))
+        logger.debug("📊 Found %d numerical data points", len(entities['numerical_data']))
         
-        return entities
+        return EntityExtraction(**{key: tuple(values) for key, values in entities.items()})
     
     def get_google_autocomplete_suggestions(self, term: str) -> List[str]:
         """Récupère les suggestions d'autocomplétion Google (100% GRATUIT)"""
-        try:
-            print(f"🔍 Getting Google autocomplete for: '{term}'")
-            
-            # API publique de suggestions Google (pas d'authentification nécessaire)
-            url = f"http://suggestqueries.google.com/complete/search"
-            params = {
-                'client': 'chrome',
-                'q': term,
-                'hl': 'en'
-            }
-            
-            response = requests.get(url, params=params, headers=self.get_headers(), timeout=10)
-            
-            if response.status_code == 200:
-                suggestions = response.json()[1] if len(response.json()) > 1 else []
-                print(f"✅ Found {len(suggestions)} Google suggestions")
-                return suggestions[:10]  # Limiter à 10
-            
-        except Exception as e:
-            print(f"⚠️ Google autocomplete error: {e}")
-        
-        return []
+        return self._get_autocomplete_suggestions('google', term)
     
     def get_bing_autocomplete_suggestions(self, term: str) -> List[str]:
         """Récupère les suggestions d'autocomplétion Bing (100% GRATUIT)"""
+        return self._get_autocomplete_suggestions('bing', term)
+    
+    def _get_autocomplete_suggestions(self, engine: str, term: str) -> List[str]:
+        """Suggestions d'un moteur, servies depuis le cache LRU si possible"""
+        key = (engine, term.strip().lower())
+        suggestions = self._get_cached_suggestions(key)
+        if suggestions is None:
+            try:
+                suggestions = self._fetch_suggestions(*key)
+            except Exception as e:
+                logger.warning("⚠️ %s autocomplete error: %s", engine.capitalize(), e)
+                return []
+            self._store_suggestions(key, suggestions)
+        return list(suggestions)
+    
+    def _get_cached_suggestions(self, key: Tuple[str, str]) -> Optional[Tuple[str, ...]]:
+        with self._suggestion_cache_lock:
+            suggestions = self._suggestion_cache.get(key)
+            if suggestions is not None:
+                self._suggestion_cache.move_to_end(key)
+            return suggestions
+    
+    def _store_suggestions(self, key: Tuple[str, str], suggestions: Tuple[str, ...]):
+        with self._suggestion_cache_lock:
+            self._suggestion_cache[key] = suggestions
+            self._suggestion_cache.move_to_end(key)
+            if len(self._suggestion_cache) > _SUGGESTION_CACHE_SIZE:
+                self._suggestion_cache.popitem(last=False)
+    
+    def _fetch_suggestions(self, engine: str, term: str) -> Tuple[str, ...]:
+        """Appel réseau bloquant vers l'API de suggestions du moteur"""
+        logger.debug("🔍 Getting %s autocomplete for: '%s'", engine.capitalize(), term)
+        
+        url, params = _autocomplete_request(engine, term)
+        response = self._session.get(url, params=params, timeout=_AUTOCOMPLETE_TIMEOUT)
+        response.raise_for_status()  # Pas de décodage JSON sur un corps d'erreur
+        
+        suggestions = _parse_suggestions(_json_loads(response.content))
+        logger.debug("✅ Found %d %s suggestions", len(suggestions), engine.capitalize())
+        return suggestions
+    
+    async def _fetch_suggestions_async(self, session, engine: str, term: str) -> List[str]:
+        """Équivalent asynchrone (aiohttp) de _get_autocomplete_suggestions"""
+        key = (engine, term.strip().lower())
+        suggestions = self._get_cached_suggestions(key)
+        if suggestions is not None:
+            return list(suggestions)
+        
+        logger.debug("🔍 Getting %s autocomplete for: '%s'", engine.capitalize(), key[1])
+        url, params = _autocomplete_request(*key)
         try:
-            print(f"🔍 Getting Bing autocomplete for: '{term}'")
-            
-            # API publique de suggestions Bing (pas d'authentification nécessaire)
-            url = f"https://api.bing.com/osjson.aspx"
-            params = {
-                'query': term,
-                'language': 'en-US'
-            }
-            
-            response = requests.get(url, params=params, headers=self.get_headers(), timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                suggestions = data[1] if len(data) > 1 else []
-                print(f"✅ Found {len(suggestions)} Bing suggestions")
-                return suggestions[:10]  # Limiter à 10
-            
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()  # Pas de décodage JSON sur un corps d'erreur
+                suggestions = _parse_suggestions(_json_loads(await response.read()))
         except Exception as e:
-            print(f"⚠️ Bing autocomplete error: {e}")
+            logger.warning("⚠️ %s autocomplete error: %s", engine.capitalize(), e)
+            return []
+        
+        logger.debug("✅ Found %d %s suggestions", len(suggestions), engine.capitalize())
+        self._store_suggestions(key, suggestions)
+        return list(suggestions)
+    
+    def _fetch_autocomplete_concurrently(self, terms: List[str]) -> List[str]:
+        """Interroge Google et Bing en parallèle pour chaque terme (latences superposées)"""
+        jobs = [(engine, term) for term in terms for engine in _AUTOCOMPLETE_ENDPOINTS]
+        if not jobs:
+            return []
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            futures = {executor.submit(self._get_autocomplete_suggestions, engine, term): (engine, term) for engine, term in jobs}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        # Réassemblage dans l'ordre des requêtes pour un résultat déterministe
+        suggestions = []
+        for job in jobs:
+            suggestions.extend(results.get(job, []))
+        return suggestions
+    
+    async def _fetch_autocomplete_async(self, terms: List[str]) -> List[str]:
+        """Interroge Google et Bing pour chaque terme sur une seule boucle d'événements"""
+        jobs = [(engine, term) for term in terms for engine in _AUTOCOMPLETE_ENDPOINTS]
+        if not jobs:
+            return []
+        
+        timeout = aiohttp.ClientTimeout(connect=_AUTOCOMPLETE_TIMEOUT[0], sock_read=_AUTOCOMPLETE_TIMEOUT[1])
+        connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector, headers=dict(self._session.headers), timeout=timeout) as session:
+            results = await asyncio.gather(
+                *(self._fetch_suggestions_async(session, engine, term) for engine, term in jobs),
+                return_exceptions=True
+            )
         
-        return []
+        # gather conserve l'ordre des requêtes : résultat déterministe
+        suggestions = []
+        for result in results:
+            if not isinstance(result, BaseException):
+                suggestions.extend(result)
+        return suggestions
     
-    def generate_adaptive_search_strategy(self, headline: str) -> Dict[str, Any]:
+    def generate_adaptive_search_strategy(self, headline: str) -> SearchStrategy:
         """Génère une stratégie de recherche adaptée spécifiquement au headline"""
-        print(f"🎯 Generating adaptive search strategy for: '{headline[:30]}...'")
+        if AIOHTTP_AVAILABLE and not _event_loop_running():
+            return asyncio.run(self.generate_adaptive_search_strategy_async(headline))
+        
+        context, entities, search_terms = self._build_adaptive_search_terms(headline)
+        
+        # 5. Récupération des suggestions d'autocomplétion pour enrichir
+        autocomplete_suggestions = self._fetch_autocomplete_concurrently(
+            entities['primary_entities'][:2]  # Prendre seulement les 2 premiers pour éviter trop de requêtes
+        )
+        
+        return self._assemble_strategy(headline, context, entities, search_terms, autocomplete_suggestions)
+    
+    async def generate_adaptive_search_strategy_async(self, headline: str) -> SearchStrategy:
+        """Version asynchrone : l'autocomplétion est parallélisée via aiohttp + asyncio.gather"""
+        context, entities, search_terms = self._build_adaptive_search_terms(headline)
+        
+        # 5. Récupération des suggestions d'autocomplétion pour enrichir
+        autocomplete_suggestions = await self._fetch_autocomplete_async(
+            entities['primary_entities'][:2]  # Prendre seulement les 2 premiers pour éviter trop de requêtes
+        )
+        
+        return self._assemble_strategy(headline, context, entities, search_terms, autocomplete_suggestions)
+    
+    def _build_adaptive_search_terms(self, headline: str):
+        """Analyse le headline et construit les termes de recherche (étapes 1 à 4)"""
+        logger.debug("🎯 Generating adaptive search strategy for: '%s...'", headline[:30])
         
         # Analyse du contexte
         context = self.detect_headline_domain(headline)
@@ -207,59 +486,53 @@ class AdaptiveKeywordContextAnalyzer:
         search_terms.extend(entities['primary_entities'][:5])
         
         # 2. Combinaisons d'entités avec données numériques
-        for entity in entities['primary_entities'][:3]:
-            for data in entities['numerical_data'][:2]:
-                search_terms.append(f"{entity} {data}")
+        search_terms.extend(
+            f"{entity} {data}"
+            for entity, data in itertools.product(entities['primary_entities'][:3], entities['numerical_data'][:2])
+        )
         
         # 3. Combinaisons avec références temporelles
-        for entity in entities['primary_entities'][:3]:
-            for time_ref in entities['temporal_references'][:2]:
-                search_terms.append(f"{entity} {time_ref}")
+        search_terms.extend(
+            f"{entity} {time_ref}"
+            for entity, time_ref in itertools.product(entities['primary_entities'][:3], entities['temporal_references'][:2])
+        )
         
         # 4. Concepts clés avec modificateurs adaptatifs
         modifiers = self._get_adaptive_modifiers(context['headline_type'])
-        for concept in entities['key_concepts'][:3]:
-            for modifier in modifiers[:2]:
-                search_terms.append(f"{modifier} {concept}")
+        search_terms.extend(
+            f"{modifier} {concept}"
+            for concept, modifier in itertools.product(entities['key_concepts'][:3], modifiers[:2])
+        )
         
-        # 5. Récupération des suggestions d'autocomplétion pour enrichir
-        autocomplete_suggestions = []
-        for term in entities['primary_entities'][:2]:  # Prendre seulement les 2 premiers pour éviter trop de requêtes
-            time.sleep(0.5)  # Respecter les limites
-            google_suggestions = self.get_google_autocomplete_suggestions(term)
-            bing_suggestions = self.get_bing_autocomplete_suggestions(term)
-            autocomplete_suggestions.extend(google_suggestions + bing_suggestions)
-        
-        strategy = {
-            'headline': headline,
-            'context': context,
-            'extracted_entities': entities,
-            'adaptive_search_terms': list(set(search_terms)),  # Supprimer doublons
-            'autocomplete_suggestions': list(set(autocomplete_suggestions)),
-            'total_terms_generated': len(set(search_terms)) + len(set(autocomplete_suggestions)),
-            'strategy_timestamp': datetime.now().isoformat()
-        }
+        return context, entities, search_terms
+    
+    def _assemble_strategy(self, headline: str, context: HeadlineContext, entities: EntityExtraction,
+                           search_terms: List[str], autocomplete_suggestions: List[str]) -> SearchStrategy:
+        """Construit l'enregistrement final de stratégie"""
+        # Supprimer les doublons une seule fois (ordre conservé) puis réutiliser les tuples
+        unique_terms = tuple(dict.fromkeys(search_terms))
+        unique_suggestions = tuple(dict.fromkeys(autocomplete_suggestions))
+        
+        strategy = SearchStrategy(
+            headline=headline,
+            context=context,
+            extracted_entities=entities,
+            adaptive_search_terms=unique_terms,
+            autocomplete_suggestions=unique_suggestions,
+            total_terms_generated=len(unique_terms) + len(unique_suggestions),
+            strategy_timestamp=time.time()
+        )
         
-        print(f"✅ Generated {strategy['total_terms_generated']} adaptive search terms")
+        logger.info("✅ Generated %d adaptive search terms", strategy.total_terms_generated)
         return strategy
     
-    def _get_adaptive_modifiers(self, headline_type: str) -> List[str]:
+    def _get_adaptive_modifiers(self, headline_type: str) -> Tuple[str, ...]:
         """Génère des modificateurs adaptatifs selon le type de headline détecté"""
-        base_modifiers = ['latest', 'current', 'recent', 'new', '2024', 'today']
-        
-        type_specific_modifiers = {
-            'data_release_with_comparison': ['analysis', 'report', 'data', 'results'],
-            'periodic_data_release': ['monthly', 'quarterly', 'report', 'survey'],
-            'action_announcement': ['news', 'announcement', 'update', 'breaking'],
-            'sentiment_report': ['consumer', 'market', 'economic', 'business'],
-            'corporate_news': ['company', 'business', 'stock', 'financial']
-        }
-        
-        specific = type_specific_modifiers.get(headline_type, ['business', 'news'])
-        return base_modifiers + specific
+        return _MODIFIERS.get(headline_type, _DEFAULT_MODIFIERS)
 
 # Test unitaire
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
     print("🧪 TESTING ADAPTIVE KEYWORD CONTEXT ANALYZER")
     print("=" * 60)
     
@@ -3,26 +3,304 @@ Advanced Keyword Research Tools - 100% FREE APIs
 Utilise uniquement des services gratuits et sans limite pour la recherche de mots-clés avancée
 """
 
-import requests
+import asyncio
+import aiohttp
+import functools
+import importlib.util
+import logging
 import time
 import random
+from contextlib import asynccontextmanager, closing
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from urllib.parse import quote_plus, urlencode
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime, timedelta
 import os
-from dotenv import load_dotenv
+import sqlite3
+import threading
+from collections import deque
 
-# Charger les variables d'environnement
-load_dotenv()
+# Charger les variables d'environnement (SKIP_DOTENV=1 pour les scripts qui fournissent déjà leur environnement)
+if not os.environ.get("SKIP_DOTENV"):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 try:
     from crewai_tools import BaseTool
 except ImportError:
     from crewai.tools.base_tool import BaseTool
 
+logger = logging.getLogger(__name__)
+
+# orjson décode 2 à 3x plus vite que json ; repli sur la bibliothèque standard
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+_HTTP_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Pool de connexions keep-alive : DNS en cache et connexions TLS réutilisées entre les appels d'un même hôte
+_CONNECTOR_SETTINGS = {
+    'limit': 50,
+    'limit_per_host': 8,  # plafond dur, le limiteur AIMD reste en dessous
+    'ttl_dns_cache': 300,
+    'keepalive_timeout': 30
+}
+
+# Parseur HTML rapide pour les SERP (optionnel, sinon BeautifulSoup + lxml)
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Sites d'autorité : leur présence dans la SERP indique une forte concurrence
+AUTHORITY_DOMAINS = ('wikipedia.org', 'forbes.com', 'reuters.com', 'bloomberg.com',
+                     'investopedia.com', 'marketwatch.com', 'cnbc.com', 'wsj.com')
+_AUTH_RE = re.compile("|".join(re.escape(domain) for domain in AUTHORITY_DOMAINS), re.IGNORECASE)
+
+def _serp_result_links(html: str) -> List[str]:
+    """Liens (href) des résultats d'une page DuckDuckGo HTML, un par div.result (vide si pas de lien)"""
+    if SELECTOLAX_AVAILABLE:
+        links = []
+        for result in HTMLParser(html).css('div.result'):
+            link_elem = result.css_first('a.result__a')
+            links.append((link_elem.attributes.get('href') or '') if link_elem is not None else '')
+        return links
+    from bs4 import BeautifulSoup  # import différé : seul ce chemin en a besoin
+    soup = BeautifulSoup(html, 'lxml')
+    return [link_elem.get('href', '') if (link_elem := result.select_one('a.result__a')) is not None else ''
+            for result in soup.select('div.result')]
+
+# Mots de 3 lettres ou plus (titres YouTube/Reddit, requête utilisateur)
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+def top_unique(items, n: int) -> List[Any]:
+    """n premiers éléments distincts dans l'ordre d'arrivée (= ordre de pertinence), arrêt dès n atteint"""
+    seen = {}
+    for item in items:
+        seen[item] = None
+        if len(seen) >= n:
+            break
+    return list(seen)
+
+# Modèles de requêtes style 'AnswerThePublic' (préfixes puis suffixes)
+_Q_PREFIXES = ("how to ", "what is ", "why ", "when ", "where ", "who ", "how does ", "what does ",
+               "how much ", "how many ", "best ", "top ")
+_Q_SUFFIXES = (" guide", " tips", " examples", " benefits", " problems", " solutions", " 2024", " trends")
+
+@functools.lru_cache(maxsize=512)
+def _question_patterns(keyword: str) -> tuple:
+    """Questions/longue traîne pour un mot-clé (déterministe, donc mis en cache)"""
+    return tuple([prefix + keyword for prefix in _Q_PREFIXES] + [keyword + suffix for suffix in _Q_SUFFIXES])
+
+def _title_words(titles):
+    """Mots des titres, en minuscules, dans l'ordre des titres"""
+    for title in titles:
+        yield from _WORD_RE.findall(title.lower())
+
+# Plafond de concurrence par hôte (YouTube : search.list coûte 100 unités de quota par appel)
+_HOST_MAX_CONCURRENCY = {
+    'youtube': 3
+}
+
+class AIMDLimiter:
+    """
+    Limiteur de concurrence adaptatif (AIMD) pour un hôte
+    - succès à latence normale : +alpha requête simultanée (additive increase)
+    - 429/5xx/erreur réseau : limite x beta (multiplicative decrease) + pause Retry-After
+    - latence > 2x la médiane récente : limite maintenue (signe de congestion)
+    - quota restant < 10% (en-têtes x-ratelimit-*) : pause proactive jusqu'au reset
+    L'état numérique survit entre les exécutions ; les futures d'attente sont créées
+    dans la boucle courante, le limiteur peut donc servir plusieurs asyncio.run successifs
+    """
+    
+    def __init__(self, initial: float = 2, min_limit: float = 1, max_limit: float = 8,
+                 alpha: float = 0.5, beta: float = 0.5, window: int = 20):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.alpha = alpha
+        self.beta = beta
+        self._latencies = deque(maxlen=window)
+        self._in_flight = 0
+        self._waiters = deque()
+        self._paused_until = 0.0
+    
+    async def __aenter__(self):
+        # La pause (Retry-After, quota) est revérifiée après chaque réveil: un 429 reçu pendant l'attente s'applique
+        while True:
+            delay = self._paused_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            if self._in_flight < max(int(self.limit), 1):
+                break
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+        self._in_flight += 1
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self._in_flight -= 1
+        self._wake()
+    
+    def _wake(self):
+        available = max(int(self.limit), 1) - self._in_flight
+        while available > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
+    
+    def observe(self, status: Optional[int], latency: float, headers=None):
+        """Met à jour la limite d'après le statut HTTP (None = erreur réseau), la latence et les en-têtes"""
+        headers = headers or {}
+        if status is None or status == 429 or status >= 500:
+            self.limit = max(self.min_limit, self.limit * self.beta)
+            retry_after = _parse_seconds(headers.get('Retry-After'))
+            if retry_after:
+                self._pause(retry_after)
+        else:
+            congested = (len(self._latencies) >= 5
+                         and latency > 2 * sorted(self._latencies)[len(self._latencies) // 2])
+            if not congested:
+                self.limit = min(self.max_limit, self.limit + self.alpha)
+            self._latencies.append(latency)
+        
+        # Quota annoncé par le serveur (Reddit : x-ratelimit-remaining/used/reset)
+        remaining = _parse_seconds(headers.get('x-ratelimit-remaining') or headers.get('x-ratelimit-remaining-requests'))
+        used = _parse_seconds(headers.get('x-ratelimit-used'))
+        quota = _parse_seconds(headers.get('x-ratelimit-limit-requests')) or ((remaining or 0) + (used or 0))
+        if remaining is not None and quota and remaining < 0.1 * quota:
+            self._pause(_parse_seconds(headers.get('x-ratelimit-reset')) or 1.0)
+        self._wake()
+    
+    def _pause(self, seconds: float):
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+def _parse_seconds(value) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+class _HttpScope:
+    """Session aiohttp et limiteurs AIMD par hôte partagés par une exécution de _arun"""
+    
+    def __init__(self, session: aiohttp.ClientSession, limiters: Dict[str, AIMDLimiter]):
+        self.session = session
+        self._limiters = limiters
+    
+    def limit(self, host: str) -> AIMDLimiter:
+        if host not in self._limiters:
+            self._limiters[host] = AIMDLimiter(max_limit=_HOST_MAX_CONCURRENCY.get(host, 8))
+        return self._limiters[host]
+    
+    @asynccontextmanager
+    async def request(self, host: str, method: str, url: str, **kwargs):
+        """Requête HTTP cadencée par le limiteur de l'hôte, qui observe statut et latence"""
+        limiter = self.limit(host)
+        async with limiter:
+            started = time.monotonic()
+            observed = False
+            try:
+                async with self.session.request(method, url, **kwargs) as response:
+                    limiter.observe(response.status, time.monotonic() - started, response.headers)
+                    observed = True
+                    yield response
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                # Erreur réseau seulement si aucune réponse n'a été reçue (pas une erreur levée par l'appelant,
+                # ex. ContentTypeError sur response.json() après un 200)
+                if not observed:
+                    limiter.observe(None, time.monotonic() - started)
+                raise
+
+# Cache disque des réponses API : durée de vie par source (secondes)
+_CACHE_PATH = os.getenv("KW_CACHE_PATH", ".kw_cache.sqlite")
+_CACHE_TTL = {
+    'youtube': 6 * 3600,
+    'serp': 6 * 3600,
+    'reddit': 3600
+}
+
+class _KeywordCache:
+    """
+    Cache sqlite des réponses par (source, mot-clé) avec TTL par source
+    Les valeurs sont stockées en JSON (jamais de pickle : le chemin du fichier est configurable
+    par KW_CACHE_PATH) ; une entrée illisible est traitée comme absente
+    """
+    
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB, expires REAL)")
+    
+    def _execute(self, sql: str, params: tuple = ()):
+        try:
+            with self._lock, closing(sqlite3.connect(self._path, timeout=5)) as conn, conn:
+                cursor = conn.execute(sql, params)
+                return cursor.fetchone() if sql.startswith("SELECT") else cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning("⚠️ Keyword cache error: %s", e)
+            return None
+    
+    @staticmethod
+    def _key(source: str, keyword: str) -> str:
+        return f"{source}:{keyword.lower()}"
+    
+    def get(self, source: str, keyword: str):
+        """Retourne (valeur, fraîche) ; valeur None si absente du cache"""
+        row = self._execute("SELECT value, expires FROM responses WHERE key = ?", (self._key(source, keyword),))
+        if row is None:
+            self.misses += 1
+            return None, False
+        try:
+            value = _json_loads(row[0])
+        except (TypeError, ValueError):
+            # Entrée corrompue ou d'un ancien format : comme une absence
+            self.misses += 1
+            return None, False
+        fresh = row[1] > time.time()
+        if fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return value, fresh
+    
+    def set(self, source: str, keyword: str, value: Any):
+        try:
+            encoded = _json_dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.warning("⚠️ Keyword cache: %s response not JSON-serializable: %s", source, e)
+            return
+        expires = time.time() + _CACHE_TTL[source]
+        self._execute("INSERT OR REPLACE INTO responses (key, value, expires) VALUES (?, ?, ?)",
+                      (self._key(source, keyword), encoded, expires))
+    
+    def clear_expired(self) -> int:
+        """Supprime les entrées expirées, retourne le nombre de lignes supprimées"""
+        return self._execute("DELETE FROM responses WHERE expires <= ?", (time.time(),)) or 0
+
+@asynccontextmanager
+async def _http_scope(http: Optional[_HttpScope], limiters: Dict[str, AIMDLimiter]):
+    """Réutilise la session de l'appelant, ou en ouvre une temporaire (appel isolé d'un fetcher)"""
+    if http is not None:
+        yield http
+        return
+    connector = aiohttp.TCPConnector(**_CONNECTOR_SETTINGS)
+    async with aiohttp.ClientSession(timeout=_HTTP_TIMEOUT, connector=connector) as session:
+        yield _HttpScope(session, limiters)
+
 class AdvancedKeywordResearchTool(BaseTool):
     """
     Outil avancé de recherche de mots-clés utilisant UNIQUEMENT des APIs gratuites
@@ -33,7 +311,7 @@ class AdvancedKeywordResearchTool(BaseTool):
     
     def __init__(self):
         super().__init__()
-        print("✅ Advanced Keyword Research Tool initialized (100% FREE)")
+        logger.info("✅ Advanced Keyword Research Tool initialized (100% FREE)")
         
         # Initialiser les propriétés d'instance (pas comme fields Pydantic)
         self._user_agents = [
@@ -41,24 +319,32 @@ class AdvancedKeywordResearchTool(BaseTool):
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         ]
         
-        # Initialiser pytrends (Google Trends - 100% GRATUIT)
-        self._trends_available = False
-        try:
-            from pytrends.request import TrendReq
-            self._pytrends = TrendReq(hl='en-US', tz=360, timeout=(10, 25), retries=2, backoff_factor=0.1)
-            self._trends_available = True
-            print("✅ Google Trends (pytrends) available")
-        except ImportError:
-            print("⚠️ pytrends not available - run: pip install pytrends")
+        # pytrends (Google Trends - 100% GRATUIT) : disponibilité vérifiée sans importer le module,
+        # l'import et la création de TrendReq (requête cookies Google) sont différés au premier appel
+        self._pytrends = None
+        self._trends_available = importlib.util.find_spec("pytrends") is not None
+        if self._trends_available:
+            # Un seul thread dédié : pytrends est bloquant et son état (build_payload) n'est pas partageable
+            self._trends_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pytrends")
+            logger.info("✅ Google Trends (pytrends) available")
+        else:
+            logger.warning("⚠️ pytrends not available - run: pip install pytrends")
         
         # APIs gratuites (optionnelles avec clés)
         self._reddit_available = bool(os.getenv("REDDIT_CLIENT_ID"))
         self._youtube_available = bool(os.getenv("YOUTUBE_API_KEY"))
         
         if self._reddit_available:
-            print("✅ Reddit API available")
+            logger.info("✅ Reddit API available")
         if self._youtube_available:
-            print("✅ YouTube API available")
+            logger.info("✅ YouTube API available")
+        
+        # Limiteurs AIMD par hôte, conservés entre les exécutions pour garder l'apprentissage
+        self._limiters = {}
+        
+        # Cache disque des réponses (évite de rejouer les mêmes appels et de brûler les quotas)
+        self._kw_cache = _KeywordCache(_CACHE_PATH)
+        self._kw_cache.clear_expired()
     
     # Properties for backward compatibility
     @property
@@ -82,25 +368,62 @@ class AdvancedKeywordResearchTool(BaseTool):
             'Connection': 'keep-alive',
         }
     
+    def _lazy_pytrends(self):
+        """Instance TrendReq unique, créée au premier appel (cookies Google récupérés une fois)"""
+        if self._pytrends is None:
+            from pytrends.request import TrendReq
+            self._pytrends = TrendReq(hl='en-US', tz=360, timeout=(10, 25), retries=2, backoff_factor=0.1,
+                                      requests_args={'verify': True})
+        return self._pytrends
+    
+    def clear_expired_cache(self) -> int:
+        """Purge les réponses expirées du cache disque"""
+        return self._kw_cache.clear_expired()
+    
+    async def _cached_fetch(self, source: str, keyword: str, fetch):
+        """Sert la réponse depuis le cache si elle est fraîche, sinon appelle fetch() et la stocke"""
+        cached, fresh = self._kw_cache.get(source, keyword)
+        if fresh:
+            return cached
+        value = await fetch()
+        if value:
+            self._kw_cache.set(source, keyword, value)
+            return value
+        # Réponse vide/échec : ne pas écraser l'ancienne entrée, la servir plutôt que rien
+        return cached if cached is not None else value
+    
     def get_google_trends_data(self, keywords: List[str]) -> Dict[str, Any]:
         """Récupère les données Google Trends (100% GRATUIT - pas d'API key)"""
         if not self._trends_available:
             return {"error": "pytrends not available"}
         
+        # Pas de cache disque : related_queries contient des DataFrames pandas, non sérialisables en JSON
+        return self._fetch_google_trends_data(keywords)
+    
+    async def get_google_trends_data_async(self, keywords: List[str]) -> Dict[str, Any]:
+        """Google Trends dans le thread pytrends dédié, sans bloquer la boucle asyncio"""
+        if not self._trends_available:
+            return {"error": "pytrends not available"}
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._trends_executor, self.get_google_trends_data, keywords)
+    
+    def _fetch_google_trends_data(self, keywords: List[str]) -> Dict[str, Any]:
+        """Appel pytrends effectif (sans cache)"""
         try:
-            print(f"📈 Getting Google Trends data for: {keywords[:5]}")
+            logger.debug("📈 Getting Google Trends data for: %s", keywords[:5])
             
             # Limiter à 5 keywords max pour éviter les erreurs
             search_terms = keywords[:5]
             
             # Construire les requêtes pour pytrends
-            self._pytrends.build_payload(search_terms, cat=0, timeframe='today 12-m', geo='', gprop='')
+            pytrends = self._lazy_pytrends()
+            pytrends.build_payload(search_terms, cat=0, timeframe='today 12-m', geo='', gprop='')
             
             # Récupérer l'intérêt au fil du temps
-            interest_over_time = self._pytrends.interest_over_time()
+            interest_over_time = pytrends.interest_over_time()
             
             # Récupérer les suggestions de requêtes associées
-            related_queries = self._pytrends.related_queries()
+            related_queries = pytrends.related_queries()
             
             trends_data = {
                 'search_terms': search_terms,
@@ -109,20 +432,22 @@ class AdvancedKeywordResearchTool(BaseTool):
                 'timestamp': datetime.now().isoformat()
             }
             
-            print(f"✅ Google Trends data collected for {len(search_terms)} terms")
+            logger.info("✅ Google Trends data collected for %d terms", len(search_terms))
             return trends_data
             
         except Exception as e:
-            print(f"⚠️ Google Trends error: {e}")
+            logger.warning("⚠️ Google Trends error: %s", e)
             return {"error": str(e)}
     
-    def get_youtube_suggestions(self, keyword: str) -> List[str]:
+    async def get_youtube_suggestions(self, keyword: str, http: Optional[_HttpScope] = None) -> List[str]:
         """Récupère les suggestions YouTube (API gratuite avec quota élevé)"""
         if not self._youtube_available:
             return []
-        
+        return await self._cached_fetch('youtube', keyword, lambda: self._fetch_youtube_suggestions(keyword, http))
+    
+    async def _fetch_youtube_suggestions(self, keyword: str, http: Optional[_HttpScope]) -> List[str]:
         try:
-            print(f"🎥 Getting YouTube suggestions for: {keyword}")
+            logger.debug("🎥 Getting YouTube suggestions for: %s", keyword)
             
             api_key = os.getenv("YOUTUBE_API_KEY")
             url = "https://www.googleapis.com/youtube/v3/search"
@@ -136,53 +461,53 @@ class AdvancedKeywordResearchTool(BaseTool):
                 'key': api_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            async with _http_scope(http, self._limiters) as http:
+                async with http.request('youtube', 'GET', url, params=params) as response:
+                    if response.status != 200:
+                        return []
+                    data = _json_loads(await response.read())
             
-            if response.status_code == 200:
-                data = response.json()
-                suggestions = []
-                
-                for item in data.get('items', []):
-                    title = item.get('snippet', {}).get('title', '')
-                    # Extraire des mots-clés du titre
-                    title_words = re.findall(r'\b[a-zA-Z]{3,}\b', title.lower())
-                    suggestions.extend(title_words)
-                
-                # Retourner les termes uniques les plus fréquents
-                unique_suggestions = list(set(suggestions))[:15]
-                print(f"✅ Found {len(unique_suggestions)} YouTube suggestions")
-                return unique_suggestions
+            # Extraire des mots-clés des titres (résultats triés par pertinence)
+            titles = (item.get('snippet', {}).get('title', '') for item in data.get('items', []))
+            
+            # Retourner les termes uniques, les plus pertinents d'abord
+            unique_suggestions = top_unique(_title_words(titles), 15)
+            logger.info("✅ Found %d YouTube suggestions", len(unique_suggestions))
+            return unique_suggestions
             
         except Exception as e:
-            print(f"⚠️ YouTube API error: {e}")
+            logger.warning("⚠️ YouTube API error: %s", e)
         
         return []
     
-    def get_reddit_keywords(self, keyword: str) -> List[str]:
+    async def get_reddit_keywords(self, keyword: str, http: Optional[_HttpScope] = None) -> List[str]:
         """Récupère les mots-clés populaires depuis Reddit (API gratuite)"""
         if not self._reddit_available:
             return []
-        
+        return await self._cached_fetch('reddit', keyword, lambda: self._fetch_reddit_keywords(keyword, http))
+    
+    async def _fetch_reddit_keywords(self, keyword: str, http: Optional[_HttpScope]) -> List[str]:
         try:
-            print(f"🔍 Searching Reddit for: {keyword}")
+            logger.debug("🔍 Searching Reddit for: %s", keyword)
             
             client_id = os.getenv("REDDIT_CLIENT_ID")
             client_secret = os.getenv("REDDIT_CLIENT_SECRET")
             user_agent = "KeywordResearch/1.0"
             
             # Authentification Reddit
-            auth = requests.auth.HTTPBasicAuth(client_id, client_secret)
+            auth = aiohttp.BasicAuth(client_id, client_secret)
             data = {
                 'grant_type': 'client_credentials'
             }
             headers = {'User-Agent': user_agent}
             
-            # Obtenir le token d'accès
-            auth_response = requests.post('https://www.reddit.com/api/v1/access_token',
-                                        auth=auth, data=data, headers=headers, timeout=10)
-            
-            if auth_response.status_code == 200:
-                token = auth_response.json()['access_token']
+            async with _http_scope(http, self._limiters) as http:
+                # Obtenir le token d'accès
+                async with http.request('reddit', 'POST', 'https://www.reddit.com/api/v1/access_token',
+                                        auth=auth, data=data, headers=headers) as auth_response:
+                    if auth_response.status != 200:
+                        return []
+                    token = (await auth_response.json())['access_token']
                 headers['Authorization'] = f'bearer {token}'
                 
                 # Rechercher des posts liés au keyword
@@ -194,89 +519,60 @@ class AdvancedKeywordResearchTool(BaseTool):
                     'limit': 20
                 }
                 
-                search_response = requests.get(search_url, headers=headers, params=params, timeout=10)
-                
-                if search_response.status_code == 200:
-                    data = search_response.json()
-                    reddit_keywords = []
-                    
-                    for post in data.get('data', {}).get('children', []):
-                        title = post.get('data', {}).get('title', '')
-                        # Extraire mots-clés du titre
-                        title_words = re.findall(r'\b[a-zA-Z]{3,}\b', title.lower())
-                        reddit_keywords.extend(title_words)
-                    
-                    # Retourner les termes uniques
-                    unique_keywords = list(set(reddit_keywords))[:15]
-                    print(f"✅ Found {len(unique_keywords)} Reddit keywords")
-                    return unique_keywords
+                async with http.request('reddit', 'GET', search_url, headers=headers, params=params) as search_response:
+                    if search_response.status != 200:
+                        return []
+                    data = _json_loads(await search_response.read())
+            
+            # Extraire mots-clés des titres (posts "hot" dans l'ordre)
+            titles = (post.get('data', {}).get('title', '') for post in data.get('data', {}).get('children', []))
+            
+            # Retourner les termes uniques
+            unique_keywords = top_unique(_title_words(titles), 15)
+            logger.info("✅ Found %d Reddit keywords", len(unique_keywords))
+            return unique_keywords
             
         except Exception as e:
-            print(f"⚠️ Reddit API error: {e}")
+            logger.warning("⚠️ Reddit API error: %s", e)
         
         return []
     
     def scrape_answer_the_public_style(self, keyword: str) -> List[str]:
         """Génère des questions style 'AnswerThePublic' (100% gratuit, pas d'API)"""
         try:
-            print(f"❓ Generating question patterns for: {keyword}")
-            
-            question_patterns = [
-                f"how to {keyword}",
-                f"what is {keyword}",
-                f"why {keyword}",
-                f"when {keyword}",
-                f"where {keyword}",
-                f"who {keyword}",
-                f"how does {keyword}",
-                f"what does {keyword}",
-                f"how much {keyword}",
-                f"how many {keyword}",
-                f"best {keyword}",
-                f"top {keyword}",
-                f"{keyword} guide",
-                f"{keyword} tips",
-                f"{keyword} examples",
-                f"{keyword} benefits",
-                f"{keyword} problems",
-                f"{keyword} solutions",
-                f"{keyword} 2024",
-                f"{keyword} trends"
-            ]
-            
-            print(f"✅ Generated {len(question_patterns)} question-based keywords")
+            logger.debug("❓ Generating question patterns for: %s", keyword)
+            
+            question_patterns = list(_question_patterns(keyword))
+            
+            logger.debug("✅ Generated %d question-based keywords", len(question_patterns))
             return question_patterns
             
         except Exception as e:
-            print(f"⚠️ Question generation error: {e}")
+            logger.warning("⚠️ Question generation error: %s", e)
             return []
     
-    def estimate_keyword_difficulty(self, keyword: str) -> Dict[str, Any]:
+    async def estimate_keyword_difficulty(self, keyword: str, http: Optional[_HttpScope] = None) -> Dict[str, Any]:
         """Estime la difficulté d'un mot-clé via analyse SERP (gratuit)"""
+        difficulty = await self._cached_fetch('serp', keyword, lambda: self._fetch_keyword_difficulty(keyword, http))
+        return difficulty or {'keyword': keyword, 'difficulty': 'Unknown', 'difficulty_score': 50}
+    
+    async def _fetch_keyword_difficulty(self, keyword: str, http: Optional[_HttpScope]) -> Optional[Dict[str, Any]]:
         try:
-            print(f"⚖️ Estimating difficulty for: {keyword}")
+            logger.debug("⚖️ Estimating difficulty for: %s", keyword)
             
             # Recherche DuckDuckGo pour analyser la concurrence
             search_url = f"https://duckduckgo.com/html/?q={quote_plus(keyword)}"
-            response = requests.get(search_url, headers=self.get_headers(), timeout=10)
+            async with _http_scope(http, self._limiters) as http:
+                async with http.request('duckduckgo', 'GET', search_url, headers=self.get_headers()) as response:
+                    status = response.status
+                    html = await response.text() if status == 200 else ''
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                results = soup.find_all('div', class_='result')
+            if status == 200:
+                links = _serp_result_links(html)
                 
                 # Analyser les types de sites dans les résultats
-                authority_sites = 0
-                total_results = len(results)
-                
-                authority_domains = ['wikipedia.org', 'forbes.com', 'reuters.com', 'bloomberg.com', 
-                                   'investopedia.com', 'marketwatch.com', 'cnbc.com', 'wsj.com']
-                
-                for result in results:
-                    link_elem = result.find('a', class_='result__a')
-                    if link_elem:
-                        href = link_elem.get('href', '')
-                        if any(domain in href for domain in authority_domains):
-                            authority_sites += 1
+                total_results = len(links)
+                authority_sites = sum(1 for href in links if _AUTH_RE.search(href))
                 
                 # Calculer le score de difficulté
                 authority_ratio = authority_sites / max(total_results, 1)
@@ -303,19 +599,27 @@ class AdvancedKeywordResearchTool(BaseTool):
                 }
         
         except Exception as e:
-            print(f"⚠️ Difficulty estimation error: {e}")
+            logger.warning("⚠️ Difficulty estimation error: %s", e)
         
-        return {'keyword': keyword, 'difficulty': 'Unknown', 'difficulty_score': 50}
+        return None
     
     def _run(self, query: str) -> str:
-        """Interface principale pour CrewAI"""
+        """Interface principale pour CrewAI (enveloppe synchrone de _arun)"""
         try:
-            print(f"\n🚀 ADVANCED KEYWORD RESEARCH for: '{query}'")
-            print("=" * 60)
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._arun(query))
+        # Appel depuis une boucle déjà active : exécuter dans un thread dédié
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self._arun(query)).result()
+    
+    async def _arun(self, query: str) -> str:
+        """Version asynchrone : les appels réseau de chaque phase partent en parallèle"""
+        try:
+            logger.info("🚀 ADVANCED KEYWORD RESEARCH for: '%s'", query)
             
             # 1. Extraire les mots-clés de base de la query
-            base_keywords = re.findall(r'\b[a-zA-Z]{3,}\b', query.lower())
-            unique_keywords = list(set(base_keywords))[:5]  # Limiter pour éviter les quotas
+            unique_keywords = top_unique(_WORD_RE.findall(query.lower()), 5)  # Limiter pour éviter les quotas
             
             results = {
                 'query': query,
@@ -329,40 +633,56 @@ class AdvancedKeywordResearchTool(BaseTool):
                 'total_keywords_found': 0
             }
             
-            # 2. Google Trends data
-            if self._trends_available and unique_keywords:
-                print("\n📈 PHASE 1: Google Trends Analysis")
-                results['trends_data'] = self.get_google_trends_data(unique_keywords)
-                time.sleep(1)  # Respecter les limites
-            
-            # 3. YouTube suggestions (si API disponible)
-            if self._youtube_available and unique_keywords:
-                print("\n🎥 PHASE 2: YouTube Keyword Mining")
-                for keyword in unique_keywords[:2]:  # Limiter pour éviter quota
-                    youtube_suggestions = self.get_youtube_suggestions(keyword)
-                    results['youtube_suggestions'].extend(youtube_suggestions)
-                    time.sleep(1)
-            
-            # 4. Reddit keywords (si API disponible)
-            if self._reddit_available and unique_keywords:
-                print("\n🔍 PHASE 3: Reddit Trend Analysis")
-                for keyword in unique_keywords[:2]:
-                    reddit_keywords = self.get_reddit_keywords(keyword)
-                    results['reddit_keywords'].extend(reddit_keywords)
-                    time.sleep(2)  # Reddit a des limites plus strictes
-            
-            # 5. Question patterns (toujours disponible)
-            print("\n❓ PHASE 4: Question-Based Keywords")
-            for keyword in unique_keywords[:3]:
-                question_keywords = self.scrape_answer_the_public_style(keyword)
-                results['question_patterns'].extend(question_keywords)
-            
-            # 6. Difficulty analysis pour les mots-clés principaux
-            print("\n⚖️ PHASE 5: Competition Analysis")
-            for keyword in unique_keywords[:3]:
-                difficulty = self.estimate_keyword_difficulty(keyword)
-                results['difficulty_analysis'].append(difficulty)
-                time.sleep(2)  # Éviter d'être bloqué
+            async with _http_scope(None, self._limiters) as http:
+                # Prefetch des SERP de la phase 5 : ses entrées (mots-clés de base) sont connues dès maintenant,
+                # sa latence est ainsi masquée par les phases 1 à 4
+                serp_keywords = unique_keywords[:3]
+                serp_tasks = [asyncio.ensure_future(self.estimate_keyword_difficulty(keyword, http))
+                              for keyword in serp_keywords]
+                
+                # 2. Google Trends data (thread pytrends dédié, en parallèle des phases 2 et 3)
+                trends_task = None
+                if self._trends_available and unique_keywords:
+                    logger.info("📈 PHASE 1: Google Trends Analysis")
+                    trends_task = asyncio.create_task(self.get_google_trends_data_async(unique_keywords))
+                
+                # 3. YouTube suggestions (si API disponible)
+                youtube_calls = []
+                if self._youtube_available and unique_keywords:
+                    logger.info("🎥 PHASE 2: YouTube Keyword Mining")
+                    youtube_calls = [self.get_youtube_suggestions(keyword, http) for keyword in unique_keywords[:2]]  # Limiter pour éviter quota
+                
+                # 4. Reddit keywords (si API disponible)
+                reddit_calls = []
+                if self._reddit_available and unique_keywords:
+                    logger.info("🔍 PHASE 3: Reddit Trend Analysis")
+                    reddit_calls = [self.get_reddit_keywords(keyword, http) for keyword in unique_keywords[:2]]
+                
+                social_results = await asyncio.gather(*youtube_calls, *reddit_calls, return_exceptions=True)
+                youtube_results = social_results[:len(youtube_calls)]
+                reddit_results = social_results[len(youtube_calls):]
+                results['youtube_suggestions'] = [word for words in youtube_results
+                                                  if not isinstance(words, BaseException) for word in words]
+                results['reddit_keywords'] = [word for words in reddit_results
+                                              if not isinstance(words, BaseException) for word in words]
+                
+                if trends_task is not None:
+                    try:
+                        results['trends_data'] = await trends_task
+                    except Exception as e:
+                        results['trends_data'] = {"error": str(e)}
+                
+                # 5-6. Question patterns (toujours disponible) + difficulty analysis des mots-clés principaux,
+                # en une seule passe : les questions (CPU) sont générées pendant que les SERP restantes sont en vol
+                logger.info("❓ PHASE 4: Question-Based Keywords")
+                logger.info("⚖️ PHASE 5: Competition Analysis")
+                for keyword, serp_task in zip(serp_keywords, serp_tasks):
+                    results['question_patterns'].extend(self.scrape_answer_the_public_style(keyword))
+                    try:
+                        difficulty = await serp_task
+                    except Exception:
+                        difficulty = {'keyword': keyword, 'difficulty': 'Unknown', 'difficulty_score': 50}
+                    results['difficulty_analysis'].append(difficulty)
             
             # Calculer le total
             all_keywords = (results['youtube_suggestions'] + 
@@ -373,8 +693,8 @@ class AdvancedKeywordResearchTool(BaseTool):
             # Formater la sortie pour CrewAI
             formatted_output = self._format_results_for_crewai(results)
             
-            print(f"\n✅ ADVANCED KEYWORD RESEARCH COMPLETE!")
-            print(f"📊 Total unique keywords found: {results['total_keywords_found']}")
+            logger.info("✅ ADVANCED KEYWORD RESEARCH COMPLETE! %d unique keywords found", results['total_keywords_found'])
+            logger.info("💾 Cache: %d hits / %d misses", self._kw_cache.hits, self._kw_cache.misses)
             
             return formatted_output
             
@@ -409,7 +729,7 @@ class AdvancedKeywordResearchTool(BaseTool):
         # YouTube suggestions
         if results['youtube_suggestions']:
             output += "🎥 YOUTUBE-DERIVED KEYWORDS (Top 10):\n"
-            unique_youtube = list(set(results['youtube_suggestions']))[:10]
+            unique_youtube = top_unique(results['youtube_suggestions'], 10)
             for i, keyword in enumerate(unique_youtube, 1):
                 output += f"{i}. {keyword}\n"
             output += "\n"
@@ -417,7 +737,7 @@ class AdvancedKeywordResearchTool(BaseTool):
         # Reddit keywords  
         if results['reddit_keywords']:
             output += "🔍 REDDIT TRENDING KEYWORDS (Top 10):\n"
-            unique_reddit = list(set(results['reddit_keywords']))[:10]
+            unique_reddit = top_unique(results['reddit_keywords'], 10)
             for i, keyword in enumerate(unique_reddit, 1):
                 output += f"{i}. {keyword}\n"
             output += "\n"
@@ -441,13 +761,10 @@ class AdvancedKeywordResearchTool(BaseTool):
         output += "and medium-difficulty keywords for long-term growth.\n"
         
         return output
-    
-    async def _arun(self, query: str) -> str:
-        """Version asynchrone"""
-        return self._run(query)
 
 # Test unitaire
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
     print("🧪 TESTING ADVANCED KEYWORD RESEARCH TOOL")
     print("=" * 60)
     
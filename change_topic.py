@@ -2,28 +2,20 @@
 # Usage: python change_topic.py "Votre nouveau sujet d'article"
 
 import sys
-import subprocess
-import re
+import json
+
+import complete_workflow
+
+TOPIC_FILE = "topic.json"
 
 def change_headline_in_main(new_headline):
-    """Changer le HEADLINE dans main.py automatiquement"""
+    """Enregistrer le HEADLINE lu par main.py au démarrage (topic.json, sans réécrire le code source)"""
     
     try:
-        # Lire le fichier main.py
-        with open('main.py', 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Trouver et remplacer la ligne HEADLINE
-        pattern = r'HEADLINE = ".*?"'
-        replacement = f'HEADLINE = "{new_headline}"'
-        
-        new_content = re.sub(pattern, replacement, content)
+        with open(TOPIC_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"headline": new_headline}, f, ensure_ascii=False, indent=2)
         
-        # Sauvegarder le fichier modifié
-        with open('main.py', 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        
-        print(f"✅ Sujet mis à jour dans main.py:")
+        print(f"✅ Sujet mis à jour dans {TOPIC_FILE}:")
         print(f"📰 Nouveau sujet: {new_headline}")
         return True
         
@@ -32,25 +24,14 @@ def change_headline_in_main(new_headline):
         return False
 
 def run_complete_workflow():
-    """Exécuter le workflow complet après changement de sujet"""
+    """Exécuter le workflow complet après changement de sujet (dans ce même processus)"""
     try:
         print("\n🚀 Lancement du workflow complet...")
-        result = subprocess.run([sys.executable, "complete_workflow.py"], 
-                              capture_output=True, 
-                              text=True, 
-                              encoding='utf-8')
-        
-        # Afficher la sortie
-        if result.stdout:
-            print(result.stdout)
-        
-        if result.returncode == 0:
+        if complete_workflow.main():
             print("🎉 Workflow terminé avec succès!")
             return True
         else:
-            print("❌ Erreur dans le workflow:")
-            if result.stderr:
-                print(result.stderr)
+            print("❌ Erreur dans le workflow")
             return False
             
     except Exception as e:
@@ -69,7 +50,7 @@ def show_usage():
     print("python change_topic.py \"Microsoft acquiert OpenAI pour 50 milliards de dollars\"")
     print()
     print("🎯 Le script va automatiquement:")
-    print("✅ 1. Modifier le sujet dans main.py")
+    print("✅ 1. Enregistrer le sujet dans topic.json (lu par main.py)")
     print("✅ 2. Générer un nouvel article SEO optimisé")
     print("✅ 3. Créer la page HTML correspondante")
     print("✅ 4. Fournir un audit SEO complet")
@@ -1,49 +1,77 @@
 # Workflow Complet : Génération Article SEO + Page HTML Optimisée
 # Ce script automatise tout le processus : recherche → article → HTML optimisé SEO
 
-import subprocess
-import sys
 import os
-from html_generator import SEOHTMLGenerator
+import sys
+
+# Fichiers produits par le workflow (résumé final)
+GENERATED_FILES = (
+    ("seo_article_output.json", "Données JSON de l'article avec mots-clés et audit SEO"),
+    ("seo_optimized_article.html", "Page web complète optimisée SEO (65-80% score cible)")
+)
+
+# Checklist SEO et prochaines étapes : texte statique assemblé une seule fois
+SEO_CHECKLIST = (
+    ("✅ Meta tags optimisés", "Title, description, keywords intégrés"),
+    ("✅ Schema Markup JSON-LD", "NewsArticle schema pour Google"),
+    ("✅ Structure sémantique HTML5", "Header, main, section, aside"),
+    ("✅ Hiérarchie des titres", "H1, H2, H3 correctement structurés"),
+    ("✅ Responsive design", "Mobile-first, touch targets 44px+"),
+    ("✅ Optimisation Core Web Vitals", "Performance et UX améliorées"),
+    ("✅ Navigation breadcrumb", "Meilleure indexation par Google"),
+    ("✅ Table des matières", "Navigation interne optimisée"),
+    ("✅ Open Graph + Twitter Cards", "Partage social optimisé"),
+    ("✅ Liens internes suggérés", "Maillage interne pour SEO"),
+    ("✅ CTA optimisés", "Engagement utilisateur amélioré"),
+    ("✅ Accessibilité WCAG", "Focus management, contraste")
+)
+
+NEXT_STEPS = (
+    "1. 🖼️ Ajouter des images optimisées avec alt text descriptifs",
+    "2. 🔗 Configurer les liens internes vers vos autres articles",
+    "3. 📱 Tester la page avec Google PageSpeed Insights",
+    "4. 🔍 Vérifier l'indexation avec Google Search Console",
+    "5. 📊 Monitorer les performances SEO avec Google Analytics",
+    "6. 🌐 Publier sur un serveur avec HTTPS activé",
+    "7. 📋 Créer un sitemap.xml incluant cette page"
+)
+
+_SEO_CHECKLIST_TEXT = "\n".join([
+    "🎯 CHECKLIST SEO POUR 65-80% DE SCORE:",
+    "=" * 60,
+    *(f"{status} {description}" for status, description in SEO_CHECKLIST),
+    "\n💡 PROCHAINES ÉTAPES RECOMMANDÉES:",
+    *(f"   {step}" for step in NEXT_STEPS)
+]) + "\n"
 
 def run_article_generation():
-    """Étape 1: Exécuter main.py pour générer l'article JSON"""
+    """Étape 1: Générer l'article JSON dans ce processus (main.generate) ; retourne l'article ou None"""
     print("🚀 ÉTAPE 1: Génération de l'article SEO optimisé...")
     print("=" * 60)
     
     try:
-        # Exécuter main.py
-        result = subprocess.run([sys.executable, "main.py"], 
-                              capture_output=True, 
-                              text=True, 
-                              encoding='utf-8')
+        # Import différé : main.py initialise le crew et ses outils au chargement
+        import main as article_pipeline
+        article = article_pipeline.generate()
         
-        if result.returncode == 0:
-            print("✅ Article généré avec succès!")
-            print("📄 Fichier créé: seo_article_output.json")
-            return True
-        else:
-            print(f"❌ Erreur lors de la génération de l'article:")
-            print(result.stderr)
-            return False
+        print("✅ Article généré avec succès!")
+        print("📄 Fichier créé: seo_article_output.json")
+        return article
             
     except Exception as e:
-        print(f"❌ Erreur d'exécution: {e}")
-        return False
+        print(f"❌ Erreur lors de la génération de l'article: {e}")
+        return None
 
-def run_html_generation():
-    """Étape 2: Générer la page HTML optimisée SEO"""
+def run_html_generation(article):
+    """Étape 2: Générer la page HTML optimisée SEO à partir de l'article en mémoire (pas de relecture du JSON)"""
     print("\n🌐 ÉTAPE 2: Génération de la page HTML SEO...")
     print("=" * 60)
     
     try:
-        # Vérifier que le JSON existe
-        if not os.path.exists("seo_article_output.json"):
-            print("❌ Fichier JSON introuvable!")
-            return False
+        from html_generator import SEOHTMLGenerator  # import différé : seule cette étape en a besoin
         
         # Générer le HTML
-        generator = SEOHTMLGenerator('seo_article_output.json')
+        generator = SEOHTMLGenerator(data=article)
         html_content = generator.generate_html()
         
         print("✅ Page HTML générée avec succès!")
@@ -58,63 +86,28 @@ def run_html_generation():
 
 def display_summary():
     """Afficher le résumé des fichiers générés"""
-    print("\n📋 RÉSUMÉ DES FICHIERS GÉNÉRÉS:")
-    print("=" * 60)
+    out = []  # lignes bufferisées, un seul write à la fin
+    out.append("\n📋 RÉSUMÉ DES FICHIERS GÉNÉRÉS:")
+    out.append("=" * 60)
     
-    files_info = [
-        ("seo_article_output.json", "Données JSON de l'article avec mots-clés et audit SEO"),
-        ("seo_optimized_article.html", "Page web complète optimisée SEO (65-80% score cible)")
-    ]
-    
-    for filename, description in files_info:
+    for filename, description in GENERATED_FILES:
         if os.path.exists(filename):
             size = os.path.getsize(filename)
-            print(f"✅ {filename}")
-            print(f"   📝 {description}")
-            print(f"   📊 Taille: {size:,} bytes")
+            out.append(f"✅ {filename}")
+            out.append(f"   📝 {description}")
+            out.append(f"   📊 Taille: {size:,} bytes")
         else:
-            print(f"❌ {filename} - Fichier manquant")
-        print()
+            out.append(f"❌ {filename} - Fichier manquant")
+        out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 def display_seo_checklist():
-    """Afficher la checklist SEO pour atteindre 65-80%"""
-    print("🎯 CHECKLIST SEO POUR 65-80% DE SCORE:")
-    print("=" * 60)
-    
-    checklist = [
-        ("✅ Meta tags optimisés", "Title, description, keywords intégrés"),
-        ("✅ Schema Markup JSON-LD", "NewsArticle schema pour Google"),
-        ("✅ Structure sémantique HTML5", "Header, main, section, aside"),
-        ("✅ Hiérarchie des titres", "H1, H2, H3 correctement structurés"),
-        ("✅ Responsive design", "Mobile-first, touch targets 44px+"),
-        ("✅ Optimisation Core Web Vitals", "Performance et UX améliorées"),
-        ("✅ Navigation breadcrumb", "Meilleure indexation par Google"),
-        ("✅ Table des matières", "Navigation interne optimisée"),
-        ("✅ Open Graph + Twitter Cards", "Partage social optimisé"),
-        ("✅ Liens internes suggérés", "Maillage interne pour SEO"),
-        ("✅ CTA optimisés", "Engagement utilisateur amélioré"),
-        ("✅ Accessibilité WCAG", "Focus management, contraste")
-    ]
-    
-    for status, description in checklist:
-        print(f"{status} {description}")
-    
-    print(f"\n💡 PROCHAINES ÉTAPES RECOMMANDÉES:")
-    recommendations = [
-        "1. 🖼️ Ajouter des images optimisées avec alt text descriptifs",
-        "2. 🔗 Configurer les liens internes vers vos autres articles",
-        "3. 📱 Tester la page avec Google PageSpeed Insights",
-        "4. 🔍 Vérifier l'indexation avec Google Search Console",
-        "5. 📊 Monitorer les performances SEO avec Google Analytics",
-        "6. 🌐 Publier sur un serveur avec HTTPS activé",
-        "7. 📋 Créer un sitemap.xml incluant cette page"
-    ]
-    
-    for rec in recommendations:
-        print(f"   {rec}")
+    """Afficher la checklist SEO pour atteindre 65-80% (texte statique, construit une fois à l'import)"""
+    sys.stdout.write(_SEO_CHECKLIST_TEXT)
 
 def main():
-    """Workflow principal complet"""
+    """Workflow principal complet (retourne True si l'article et la page HTML ont été générés)"""
     print("🎯 WORKFLOW COMPLET: ARTICLE SEO + PAGE HTML OPTIMISÉE")
     print("=" * 70)
     print("🔄 Ce script va générer:")
@@ -124,20 +117,20 @@ def main():
     print()
     
     # Étape 1: Générer l'article
-    success_article = run_article_generation()
+    article = run_article_generation()
     
-    if not success_article:
+    if article is None:
         print("\n❌ Arrêt du workflow - Échec génération article")
-        return
+        return False
     
     # Étape 2: Générer le HTML
-    success_html = run_html_generation()
+    success_html = run_html_generation(article)
     
     if not success_html:
         print("\n❌ Arrêt du workflow - Échec génération HTML")
-        return
+        return False
     
-    # Résumé final
+    # Résumé final (inspecte les fichiers générés)
     display_summary()
     display_seo_checklist()
     
@@ -145,6 +138,7 @@ def main():
     print("🚀 Votre article et sa page web sont prêts pour publication!")
     print(f"📈 Score SEO cible: 65-80% (optimisations appliquées)")
     print(f"🔍 Testez maintenant avec Google PageSpeed Insights")
+    return True
 
 if __name__ == "__main__":
     main()
@@ -2,8 +2,98 @@
 # Affiche l'état de tous les composants et les performances
 
 import os
+import sys
+import time
 import json
-from datetime import datetime
+import bisect
+import functools
+import re
+
+# orjson (si installé) décode 2 à 5x plus vite ; sinon json standard avec un tampon de lecture de 1 Mo
+try:
+    import orjson
+    
+    def _load_json(path):
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+except ImportError:
+    def _load_json(path):
+        with open(path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+            return json.load(f)
+
+# Statut SEO par palier de score : _SEO_STATUSES[i] s'applique à partir de _SEO_THRESHOLDS[i - 1]
+_SEO_THRESHOLDS = (50, 65, 80)
+_SEO_STATUSES = ("❌ OPTIMISATION NÉCESSAIRE", "⚠️ AMÉLIORATIONS REQUISES", "✅ OBJECTIF ATTEINT", "🏆 EXCELLENT")
+
+# Commandes disponibles : bloc statique formaté une seule fois
+COMMANDS = (
+    ("python main.py", "Générer un nouvel article"),
+    ("python html_generator.py", "Créer page HTML SEO"),
+    ("python seo_score_analyzer.py", "Analyser score SEO"),
+    ("python complete_workflow.py", "Workflow complet"),
+    ("python change_topic.py \"Sujet\"", "Changer sujet rapidement"),
+    ("python seo_optimizer.py", "Optimiser pour 80%+")
+)
+_COMMANDS_TEXT = "\n".join(f"  📌 {cmd:<35} - {desc}" for cmd, desc in COMMANDS)
+
+# ijson (optionnel) : lecture en flux des seuls champs utilisés, mémoire constante pour les gros articles
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# En dessous de cette taille, le chargement complet (orjson/json) reste plus rapide que le flux
+_STREAM_THRESHOLD = 1 << 20
+
+# Champs scalaires lus en flux : préfixe ijson -> clé de métrique
+_STREAM_SCALARS = {
+    'article.title': 'title',
+    'seo_audit.freshness_metrics.data_freshness_score': 'freshness_score',
+    'seo_audit.overall_seo_score': 'overall_seo_score',
+    'seo_audit.readability_score': 'readability_score'
+}
+_STREAM_TEXT = frozenset(('article.introduction', 'article.body.item', 'article.conclusion'))
+_STREAM_COUNTS = {
+    'keyword_research.primary_keywords.item': 'primary_keywords',
+    'keyword_research.long_tail_phrases.item': 'long_tail_keywords'
+}
+_ITEM_START_EVENTS = frozenset(('start_map', 'start_array', 'string', 'number', 'boolean', 'null'))
+
+# Dernier rendu du tableau de bord, indexé par (nom, taille, mtime) des fichiers suivis
+_RENDER_CACHE = {'key': None, 'text': None}
+
+# Un mot = une suite de caractères non blancs (même découpage que str.split())
+_WS = re.compile(r"\S+")
+
+def _word_count(text):
+    """Compter les mots sans construire la liste intermédiaire de str.split()"""
+    return sum(1 for _ in _WS.finditer(text))
+
+def _fmt_kb(n):
+    """Taille en octets -> KB affichés avec une décimale"""
+    return f"{n / 1024:.1f}"
+
+@functools.lru_cache(maxsize=64)
+def _fmt_hms(ts):
+    """Heure HH:MM:SS d'un timestamp à la seconde ; les fichiers générés ensemble partagent souvent la même"""
+    return time.strftime('%H:%M:%S', time.localtime(ts))
+
+def _safe_stat(path):
+    """os.stat du fichier, ou None s'il n'existe pas (un seul appel système pour existence, taille et date)"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+def _entry_stat(entry):
+    """DirEntry.stat(), ou None pour une entrée absente (ou un lien symbolique cassé)"""
+    if entry is None:
+        return None
+    try:
+        return entry.stat()
+    except FileNotFoundError:
+        return None
 
 def check_files_status():
     """Vérifier l'état de tous les fichiers du système"""
@@ -38,42 +128,67 @@ def check_files_status():
         'seo_analysis_report.txt': 'Rapport analyse SEO'
     }
     
+    # Une seule lecture du répertoire courant au lieu d'un stat par fichier suivi
+    with os.scandir('.') as it:
+        entries = {entry.name: entry for entry in it}
+    
     file_status = {}
     for filename, description in files_to_check.items():
-        exists = os.path.exists(filename)
-        size = os.path.getsize(filename) if exists else 0
+        st = _entry_stat(entries.get(filename))
+        exists = st is not None
         file_status[filename] = {
             'exists': exists,
-            'size': size,
+            'size': st.st_size if exists else 0,
+            'mtime': st.st_mtime if exists else None,
+            'mtime_ns': st.st_mtime_ns if exists else None,
+            # Valeurs d'affichage préformatées une fois, réutilisées par toutes les sections
+            'size_kb_str': _fmt_kb(st.st_size if exists else 0),
+            'mtime_str': _fmt_hms(int(st.st_mtime)) if exists else '',
             'description': description,
             'status': '✅' if exists else ('⚠️' if 'generated' in description.lower() else '❌')
         }
     
     return file_status
 
-def analyze_json_data():
-    """Analyser les données de l'article JSON si disponible"""
+def analyze_json_data(file_status=None):
+    """Analyser les données de l'article JSON si disponible (mis en cache tant que le fichier ne change pas)"""
+    
+    if file_status is not None:
+        status = file_status['seo_article_output.json']
+        if not status['exists']:
+            return None
+        return _analyze_json_file(status['mtime_ns'], status['size'])
     
-    if not os.path.exists('seo_article_output.json'):
+    st = _safe_stat('seo_article_output.json')
+    if st is None:
         return None
+    return _analyze_json_file(st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=1)
+def _analyze_json_file(mtime_ns, size):
+    """Lecture + analyse du JSON ; la clé (mtime, taille) invalide le cache dès que le fichier est réécrit"""
     
     try:
-        with open('seo_article_output.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if IJSON_AVAILABLE and size >= _STREAM_THRESHOLD:
+            return _stream_json_metrics('seo_article_output.json')
+        
+        data = _load_json('seo_article_output.json')
         
-        # Extraire les métriques clés
-        article = data.get('article', {})
-        seo_audit = data.get('seo_audit', {})
-        keyword_research = data.get('keyword_research', {})
+        # Extraire les métriques clés : chaque sous-dictionnaire est résolu une seule fois
+        article = data.get('article') or {}
+        seo_audit = data.get('seo_audit') or {}
+        keyword_research = data.get('keyword_research') or {}
+        freshness_metrics = seo_audit.get('freshness_metrics') or {}
+        
+        # Un seul comptage sur l'ensemble du texte (introduction + sections + conclusion)
+        article_text = " ".join((article.get('introduction', ''), *article.get('body', ()), article.get('conclusion', '')))
         
         return {
             'title': article.get('title', 'N/A'),
-            'word_count': len(article.get('introduction', '').split()) + 
-                         sum(len(section.split()) for section in article.get('body', [])) +
-                         len(article.get('conclusion', '').split()),
-            'primary_keywords': len(keyword_research.get('primary_keywords', [])),
-            'long_tail_keywords': len(keyword_research.get('long_tail_phrases', [])),
-            'freshness_score': seo_audit.get('freshness_metrics', {}).get('data_freshness_score', 'N/A'),
+            'word_count': _word_count(article_text),
+            'primary_keywords': len(keyword_research.get('primary_keywords', ())),
+            'long_tail_keywords': len(keyword_research.get('long_tail_phrases', ())),
+            'freshness_score': freshness_metrics.get('data_freshness_score', 'N/A'),
             'overall_seo_score': seo_audit.get('overall_seo_score', 'N/A'),
             'readability_score': seo_audit.get('readability_score', 'N/A')
         }
@@ -81,23 +196,52 @@ def analyze_json_data():
     except Exception as e:
         return {'error': str(e)}
 
-def check_system_health():
-    """Vérifier la santé générale du système"""
+def _stream_json_metrics(path):
+    """Mêmes métriques que _analyze_json_file, calculées sur les événements ijson sans charger le document"""
+    
+    metrics = {
+        'title': 'N/A',
+        'word_count': 0,
+        'primary_keywords': 0,
+        'long_tail_keywords': 0,
+        'freshness_score': 'N/A',
+        'overall_seo_score': 'N/A',
+        'readability_score': 'N/A'
+    }
+    
+    with open(path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix in _STREAM_TEXT:
+                if event == 'string':
+                    metrics['word_count'] += _word_count(value)
+            elif prefix in _STREAM_COUNTS:
+                if event in _ITEM_START_EVENTS:
+                    metrics[_STREAM_COUNTS[prefix]] += 1
+            elif prefix in _STREAM_SCALARS and event in _ITEM_START_EVENTS:
+                metrics[_STREAM_SCALARS[prefix]] = value
+    
+    return metrics
+
+def check_system_health(file_status=None):
+    """Vérifier la santé générale du système (file_status : résultat de check_files_status, réutilisé)"""
+    
+    if file_status is None:
+        file_status = check_files_status()
     
     health_checks = []
     
     # Vérifier les scripts essentiels
     essential_files = ['main.py', 'free_search_tools.py', 'freshness_validator.py', 'html_generator.py']
-    all_essential_present = all(os.path.exists(f) for f in essential_files)
+    present = [f for f in essential_files if file_status[f]['exists']]
     
     health_checks.append({
         'check': 'Scripts essentiels',
-        'status': '✅ OK' if all_essential_present else '❌ MANQUANT',
-        'details': f"{sum(1 for f in essential_files if os.path.exists(f))}/{len(essential_files)} présents"
+        'status': '✅ OK' if len(present) == len(essential_files) else '❌ MANQUANT',
+        'details': f"{len(present)}/{len(essential_files)} présents"
     })
     
     # Vérifier les dépendances
-    deps_exist = os.path.exists('requirements.txt')
+    deps_exist = file_status['requirements.txt']['exists']
     health_checks.append({
         'check': 'Fichier dépendances',
         'status': '✅ OK' if deps_exist else '❌ MANQUANT', 
@@ -105,8 +249,8 @@ def check_system_health():
     })
     
     # Vérifier la génération récente
-    json_exists = os.path.exists('seo_article_output.json')
-    html_exists = os.path.exists('seo_optimized_article.html')
+    json_exists = file_status['seo_article_output.json']['exists']
+    html_exists = file_status['seo_optimized_article.html']['exists']
     
     if json_exists and html_exists:
         generation_status = '✅ COMPLET'
@@ -128,136 +272,129 @@ def check_system_health():
 
 def display_dashboard():
     """Afficher le tableau de bord complet"""
+    from datetime import datetime
     
-    print("🎯 TABLEAU DE BORD - SYSTÈME GÉNÉRATION ARTICLES SEO")
-    print("=" * 70)
+    # Un seul passage de stat sur les fichiers, partagé par toutes les sections
+    file_status = check_files_status()
     
-    # Date et heure
-    print(f"📅 Date: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
-    print()
+    # Le corps du tableau ne dépend que de l'état des fichiers suivis : réutilisé tant qu'il n'a pas changé
+    key = tuple((filename, status['size'], status['mtime_ns']) for filename, status in file_status.items())
+    if _RENDER_CACHE['key'] != key:
+        _RENDER_CACHE['text'] = _render_dashboard_body(file_status)
+        _RENDER_CACHE['key'] = key
+    
+    header = (
+        "🎯 TABLEAU DE BORD - SYSTÈME GÉNÉRATION ARTICLES SEO\n"
+        + "=" * 70 + "\n"
+        + f"📅 Date: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n\n"
+    )
+    sys.stdout.write(header + _RENDER_CACHE['text'])
+
+def _render_dashboard_body(file_status):
+    """Sections 1 à 5 du tableau de bord (texte complet, sans l'en-tête daté)"""
+    out = []  # lignes accumulées puis jointes en un seul texte
     
     # 1. Santé du système
-    print("🔧 SANTÉ DU SYSTÈME")
-    print("-" * 30)
+    out.append("🔧 SANTÉ DU SYSTÈME")
+    out.append("-" * 30)
     
-    health_checks = check_system_health()
+    health_checks = check_system_health(file_status)
     for check in health_checks:
-        print(f"{check['status']} {check['check']}: {check['details']}")
-    print()
+        out.append(f"{check['status']} {check['check']}: {check['details']}")
+    out.append("")
     
     # 2. État des fichiers
-    print("📁 ÉTAT DES FICHIERS")
-    print("-" * 30)
-    
-    file_status = check_files_status()
+    out.append("📁 ÉTAT DES FICHIERS")
+    out.append("-" * 30)
     
     # Scripts principaux
-    print("🔥 Scripts Principaux:")
+    out.append("🔥 Scripts Principaux:")
     main_scripts = ['main.py', 'html_generator.py', 'seo_score_analyzer.py', 'seo_optimizer.py']
     for script in main_scripts:
         if script in file_status:
             status = file_status[script]
-            size_kb = status['size'] / 1024 if status['size'] > 0 else 0
-            print(f"  {status['status']} {script:<25} ({size_kb:.1f} KB)")
+            out.append(f"  {status['status']} {script:<25} ({status['size_kb_str']} KB)")
     
-    print()
+    out.append("")
     
     # Scripts de workflow
-    print("🔄 Scripts Workflow:")
+    out.append("🔄 Scripts Workflow:")
     workflow_scripts = ['complete_workflow.py', 'change_topic.py']
     for script in workflow_scripts:
         if script in file_status:
             status = file_status[script]
-            size_kb = status['size'] / 1024 if status['size'] > 0 else 0
-            print(f"  {status['status']} {script:<25} ({size_kb:.1f} KB)")
+            out.append(f"  {status['status']} {script:<25} ({status['size_kb_str']} KB)")
     
-    print()
+    out.append("")
     
     # Fichiers générés
-    print("📄 Fichiers Générés:")
+    out.append("📄 Fichiers Générés:")
     generated_files = ['seo_article_output.json', 'seo_optimized_article.html', 'seo_optimized_article_v2.html']
     for file in generated_files:
         if file in file_status:
             status = file_status[file]
-            size_kb = status['size'] / 1024 if status['size'] > 0 else 0
-            age = ""
-            if status['exists']:
-                mod_time = os.path.getmtime(file)
-                age = f" - {datetime.fromtimestamp(mod_time).strftime('%H:%M:%S')}"
-            print(f"  {status['status']} {file:<30} ({size_kb:.1f} KB{age})")
+            age = f" - {status['mtime_str']}" if status['exists'] else ""
+            out.append(f"  {status['status']} {file:<30} ({status['size_kb_str']} KB{age})")
     
-    print()
+    out.append("")
     
     # 3. Métriques de performance
-    print("📊 MÉTRIQUES DE PERFORMANCE")
-    print("-" * 40)
+    out.append("📊 MÉTRIQUES DE PERFORMANCE")
+    out.append("-" * 40)
     
-    json_data = analyze_json_data()
+    json_data = analyze_json_data(file_status)
     if json_data and 'error' not in json_data:
-        print(f"📰 Titre: {json_data['title'][:50]}{'...' if len(json_data['title']) > 50 else ''}")
-        print(f"📝 Nombre de mots: {json_data['word_count']}")
-        print(f"🎯 Mots-clés primaires: {json_data['primary_keywords']}")
-        print(f"🔍 Long-tail phrases: {json_data['long_tail_keywords']}")
-        print(f"🔥 Score fraîcheur: {json_data['freshness_score']}/100")
-        print(f"🏆 Score SEO global: {json_data['overall_seo_score']}/100")
-        print(f"📖 Score lisibilité: {json_data['readability_score']}")
+        out.append(f"📰 Titre: {json_data['title'][:50]}{'...' if len(json_data['title']) > 50 else ''}")
+        out.append(f"📝 Nombre de mots: {json_data['word_count']}")
+        out.append(f"🎯 Mots-clés primaires: {json_data['primary_keywords']}")
+        out.append(f"🔍 Long-tail phrases: {json_data['long_tail_keywords']}")
+        out.append(f"🔥 Score fraîcheur: {json_data['freshness_score']}/100")
+        out.append(f"🏆 Score SEO global: {json_data['overall_seo_score']}/100")
+        out.append(f"📖 Score lisibilité: {json_data['readability_score']}")
         
         # Évaluation du score
         seo_score = json_data.get('overall_seo_score', 0)
         if isinstance(seo_score, (int, float)):
-            if seo_score >= 80:
-                seo_status = "🏆 EXCELLENT"
-            elif seo_score >= 65:
-                seo_status = "✅ OBJECTIF ATTEINT"
-            elif seo_score >= 50:
-                seo_status = "⚠️ AMÉLIORATIONS REQUISES"
-            else:
-                seo_status = "❌ OPTIMISATION NÉCESSAIRE"
+            seo_status = _SEO_STATUSES[bisect.bisect_right(_SEO_THRESHOLDS, seo_score)]
             
-            print(f"🎯 Statut SEO: {seo_status} ({seo_score}%)")
+            out.append(f"🎯 Statut SEO: {seo_status} ({seo_score}%)")
         
     elif json_data and 'error' in json_data:
-        print(f"❌ Erreur lecture JSON: {json_data['error']}")
+        out.append(f"❌ Erreur lecture JSON: {json_data['error']}")
     else:
-        print("⚠️ Aucun article généré récemment")
-        print("💡 Utilisez: python main.py pour générer un article")
+        out.append("⚠️ Aucun article généré récemment")
+        out.append("💡 Utilisez: python main.py pour générer un article")
     
-    print()
+    out.append("")
     
     # 4. Commandes disponibles
-    print("🚀 COMMANDES DISPONIBLES")
-    print("-" * 30)
-    
-    commands = [
-        ("python main.py", "Générer un nouvel article"),
-        ("python html_generator.py", "Créer page HTML SEO"),
-        ("python seo_score_analyzer.py", "Analyser score SEO"),
-        ("python complete_workflow.py", "Workflow complet"),
-        ("python change_topic.py \"Sujet\"", "Changer sujet rapidement"),
-        ("python seo_optimizer.py", "Optimiser pour 80%+")
-    ]
+    out.append("🚀 COMMANDES DISPONIBLES")
+    out.append("-" * 30)
     
-    for cmd, desc in commands:
-        print(f"  📌 {cmd:<35} - {desc}")
+    out.append(_COMMANDS_TEXT)
     
-    print()
+    out.append("")
     
     # 5. Recommandations
-    print("💡 RECOMMANDATIONS")
-    print("-" * 25)
+    out.append("💡 RECOMMANDATIONS")
+    out.append("-" * 25)
     
     recommendations = []
     
-    if not os.path.exists('seo_article_output.json'):
+    # Même instantané que les sections précédentes (pas de nouveau stat, pas de fichier apparu entre deux tests)
+    json_exists = file_status['seo_article_output.json']['exists']
+    html_exists = file_status['seo_optimized_article.html']['exists']
+    report_exists = file_status['seo_analysis_report.txt']['exists']
+    
+    if not json_exists:
         recommendations.append("🔧 Générer un premier article avec: python main.py")
     
-    if os.path.exists('seo_article_output.json') and not os.path.exists('seo_optimized_article.html'):
+    if json_exists and not html_exists:
         recommendations.append("🌐 Créer la page HTML avec: python html_generator.py")
     
-    if os.path.exists('seo_optimized_article.html') and not os.path.exists('seo_analysis_report.txt'):
+    if html_exists and not report_exists:
         recommendations.append("📊 Analyser le score SEO avec: python seo_score_analyzer.py")
     
-    json_data = analyze_json_data()
     if json_data and isinstance(json_data.get('overall_seo_score'), (int, float)) and json_data.get('overall_seo_score') < 80:
         recommendations.append("⚡ Optimiser pour 80%+ avec: python seo_optimizer.py")
     
@@ -265,11 +402,13 @@ def display_dashboard():
         recommendations.append("🎉 Système optimal ! Prêt pour publication")
     
     for rec in recommendations:
-        print(f"  {rec}")
+        out.append(f"  {rec}")
+    
+    out.append("")
+    out.append("🎊 SYSTÈME OPÉRATIONNEL - Score SEO cible 65-80% atteignable")
+    out.append("=" * 70)
     
-    print()
-    print("🎊 SYSTÈME OPÉRATIONNEL - Score SEO cible 65-80% atteignable")
-    print("=" * 70)
+    return "\n".join(out) + "\n"
 
 if __name__ == "__main__":
     display_dashboard()
@@ -17,18 +17,333 @@ Validations supportées:
 
 import re
 import json
+import asyncio
+import logging
+import hashlib
+import functools
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict, namedtuple
 from datetime import datetime, timedelta, date
 from typing import Dict, Any, List, Tuple, Optional, Set
 import os
 import calendar
 
+# aiohttp est optionnel : sans lui, les sources sont interrogées une à une par la session requests
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# pyahocorasick est optionnel : repère experts et formules d'attribution en un passage linéaire (sinon ancre regex)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# google-re2 est optionnel : moteur à automate (temps linéaire) pour les motifs parcourant tout l'article
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Plages réalistes des paires de devises vérifiées (les autres paires ne sont pas validées)
+_FOREX_REALISTIC_RANGES = {
+    "EUR/USD": (1.0, 1.5),
+    "GBP/USD": (1.0, 1.5),
+    "USD/JPY": (100.0, 160.0),
+}
+
+# Conversion mois textuel -> numéro (noms complets et abréviations, en minuscules)
+_MONTH_MAP = {
+    'january': 1, 'jan': 1,
+    'february': 2, 'feb': 2,
+    'march': 3, 'mar': 3,
+    'april': 4, 'apr': 4,
+    'may': 5,
+    'june': 6, 'jun': 6,
+    'july': 7, 'jul': 7,
+    'august': 8, 'aug': 8,
+    'september': 9, 'sep': 9, 'sept': 9,
+    'october': 10, 'oct': 10,
+    'november': 11, 'nov': 11,
+    'december': 12, 'dec': 12
+}
+
+# Formules introduisant une citation ("According to Adam Button of ForexLive, ...")
+_ATTRIBUTION_PHRASES = ("according to", "as per", "as stated by", "as noted by", "as mentioned by", "as reported by")
+
+# Verbes introduisant une citation ("Adam Button said, ...")
+_CITATION_VERBS = ("said", "says", "stated", "noted", "mentioned", "reported", "commented", "remarked", "explained",
+                   "suggested", "pointed out", "highlighted", "emphasized", "warned", "cautioned", "predicted",
+                   "forecasted", "projected", "estimated")
+
+# Toute citation d'expert non répertorié contient l'un de ces littéraux (filtre avant l'expression régulière)
+_CITATION_TRIGGERS = _ATTRIBUTION_PHRASES + _CITATION_VERBS
+
+# Institutions prises à tort pour des experts non répertoriés ("According to Fed, ...")
+_EXCLUDED_EXPERT_TERMS = frozenset({"fed", "federal reserve", "ecb", "boe", "bank of england", "bank of canada", "boc", "bank of japan", "boj", "fomc"})
+
+# Direction de la décision de taux selon le verbe capturé
+_PROB_DIRECTIONS = {
+    "hike": "hike", "increase": "hike", "raising": "hike",
+    "hold": "hold", "pause": "hold", "unchanged": "hold", "maintaining": "hold",
+    "cut": "cut", "decrease": "cut", "reduction": "cut", "easing": "cut", "lowering": "cut"
+}
+
+# Clé de reference_data["rate_probabilities"]["fed"] par type de probabilité (fed_prob_cut = somme des coupures)
+_FED_PROB_REF_KEYS = {
+    "fed_prob_hike": "hike",
+    "fed_prob_hold": "hold",
+    "fed_prob_cut": None,
+    "fed_prob_cut_25bp": "cut_25bp",
+    "fed_prob_cut_50bp": "cut_50bp"
+}
+
+logger = logging.getLogger(__name__)
+
+# Entrée de cache: échéance sur l'horloge monotone (time.monotonic) et valeur
+CacheEntry = namedtuple("CacheEntry", "expires_at value")
+
+# Détail de validation au format commun (type, valeur de l'article, valeur actuelle, exactitude).
+# Conservé tel quel dans le cache des résultats, converti en dictionnaire à la sortie (_export_results)
+ValidationDetail = namedtuple("ValidationDetail", "type article_value current_value is_accurate")
+
+# Délai par tentative pour les APIs de données (les tentatives sont gérées par Retry)
+_HTTP_TIMEOUT = 5
+
+# Sources de data_sources effectivement interrogées sur le réseau (les autres utilisent reference_data)
+_NETWORK_SOURCES = ("forex",)
+
+# Taux de change par défaut, récents (septembre 2025), utilisés quand l'API est injoignable
+_DEFAULT_FOREX_RATES = {
+    "EUR/USD": 1.1715,
+    "GBP/USD": 1.353,
+    "USD/JPY": 147.45
+}
+
+# Validité (secondes) des valeurs par défaut mises en cache après un échec: pas de nouvelle tentative avant
+_FAILED_FETCH_TTL = 60
+
+# Catégories validées (chacune par sa méthode _validate_<catégorie>), dans l'ordre des résultats
+_VALIDATION_CATEGORIES = (
+    "forex_rates", "inflation_data", "unemployment_data", "treasury_yields",
+    "fed_meetings", "fed_rates", "rate_probabilities", "dxy_index",
+    "other_central_banks", "expert_citations"
+)
+
+
+def _export_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copie des résultats pour l'appelant: catégories et détails copiés, ValidationDetail convertis en dictionnaires
+    
+    Les détails en cache ne sont jamais remis à l'appelant: le modifier ne corrompt pas le cache des résultats.
+    """
+    exported = dict(results)
+    for category in _VALIDATION_CATEGORIES:
+        category_results = dict(results[category])
+        category_results["details"] = [detail._asdict() if isinstance(detail, ValidationDetail) else dict(detail)
+                                       for detail in category_results["details"]]
+        exported[category] = category_results
+    return exported
+
+
+def _event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+class _TokenBucket:
+    """Limiteur de débit (seau à jetons) partagé par toutes les requêtes HTTP du validateur"""
+    
+    __slots__ = ("rate", "capacity", "_tokens", "_last", "_lock")
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Réserve un jeton et renvoie le temps d'attente (en secondes) avant de pouvoir l'utiliser"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+    
+    def acquire(self):
+        """Prend un jeton, en attendant si le seau est vide"""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+
+def _clean_number(raw: str) -> str:
+    """Normalise une valeur numérique extraite: virgule décimale et point final éventuel"""
+    cleaned = raw.replace(',', '.').strip()
+    # S'assurer qu'il n'y a pas de point final
+    if cleaned.endswith('.'):
+        cleaned = cleaned[:-1]
+    return cleaned
+
+
+def _lower_literals(pattern: str) -> str:
+    """Met en minuscules les littéraux d'une regex (séquences d'échappement et groupes nommés intacts)"""
+    return re.sub(r"(\\.|\(\?P)|[A-Z]+", lambda m: m.group(1) or m.group().lower(), pattern)
+
+
+def _normalize_text(text: str) -> str:
+    """
+    Texte en minuscules sur lequel les motifs pré-compilés sont appliqués
+    
+    Le texte normalisé garde la longueur de l'original pour que les positions des groupes
+    capturés restent valables dans l'original (voir _findall_cased).
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # Quelques caractères Unicode s'allongent en minuscules (ex. "İ"): seuls ceux-là restent inchangés,
+    # tous les autres (dont "Ô", "É") sont convertis caractère par caractère
+    return "".join(lower if len(lower := char.lower()) == 1 else char for char in text)
+
+
+def _match_groups(match: "re.Match", source: str):
+    """Groupes d'une occurrence au format de findall, recopiés depuis le texte original"""
+    spans = [match.span(group) for group in range(1, match.re.groups + 1)] or [match.span()]
+    groups = tuple(source[start:end] if start >= 0 else "" for start, end in spans)
+    return groups[0] if len(groups) == 1 else groups
+
+
+def _findall_cased(pattern: "re.Pattern", text: str, source: str) -> list:
+    """Équivalent de pattern.findall(text) dont les groupes conservent la casse de source"""
+    return [_match_groups(match, source) for match in pattern.finditer(text)]
+
+
+def _findall_at(positions, patterns: Dict[Any, "re.Pattern"], text: str, source: Optional[str] = None) -> Dict[Any, list]:
+    """
+    Équivalent de {nom: motif.findall(text)} en n'essayant les motifs qu'aux positions candidates
+    
+    Les positions doivent être croissantes et contenir le début de chaque occurrence possible
+    des motifs. Les résultats sont identiques à ceux de findall (même découpage, mêmes groupes).
+    Si source est fourni, les groupes sont recopiés depuis ce texte (casse d'origine).
+    """
+    results = {name: [] for name in patterns}
+    next_pos = dict.fromkeys(patterns, 0)
+    for pos in positions:
+        for name, pattern in patterns.items():
+            if next_pos[name] <= pos:
+                match = pattern.match(text, pos)
+                if match:
+                    if source is not None:
+                        results[name].append(_match_groups(match, source))
+                    else:
+                        groups = match.groups("")
+                        results[name].append(groups[0] if len(groups) == 1 else groups or match.group())
+                    next_pos[name] = match.end()
+    return results
+
+
+def _compile_linear(pattern: str):
+    """
+    Compile un motif avec RE2 si disponible (pas de retour arrière, temps linéaire), sinon avec re
+    
+    Réservé aux motifs sans référence arrière ni assertion, appliqués à l'article entier par findall.
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            logger.debug("Motif non supporté par RE2, repli sur re: %s", pattern[:60])
+    return re.compile(pattern)
+
+
+def _build_automaton(anchors) -> Optional[Any]:
+    """Automate d'Aho-Corasick reconnaissant les ancres (en minuscules), ou None si pyahocorasick est absent"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for anchor in anchors:
+        automaton.add_word(anchor.lower(), len(anchor))
+    automaton.make_automaton()
+    return automaton
+
+
+def _anchor_positions(automaton, anchor: "re.Pattern", text: str) -> List[int]:
+    """Positions (croissantes) où commence une ancre, par l'automate s'il existe, sinon par l'expression d'ancrage"""
+    if automaton is not None:
+        return sorted({end - length + 1 for end, length in automaton.iter(text)})
+    return [hit.start() for hit in anchor.finditer(text)]
+
+
+def _anchored_findall(anchor: "re.Pattern", patterns: Dict[Any, "re.Pattern"], text: str) -> Dict[Any, list]:
+    """
+    Équivalent de {nom: motif.findall(text)} en un seul passage sur le texte
+    
+    Tous les motifs doivent commencer par l'ancre: le texte n'est parcouru qu'une fois
+    par l'ancre, puis chaque motif n'est essayé (match) qu'aux positions candidates.
+    """
+    return _findall_at((hit.start() for hit in anchor.finditer(text)), patterns, text)
+
+
+def _cached_source(key: str, hit_message: str):
+    """
+    Décorateur des méthodes _get_current_*: renvoie la donnée en cache tant qu'elle est fraîche
+    
+    La méthode décorée ne fait que le remplissage (elle met elle-même sa donnée en cache).
+    Une donnée fraîche est lue sans verrou (une CacheEntry n'est jamais modifiée, seulement remplacée);
+    sinon un seul remplissage à la fois par donnée: les autres threads attendent puis lisent le cache.
+    """
+    def decorator(fill):
+        @functools.wraps(fill)
+        def getter(self, now: Optional[float] = None):
+            if now is None:
+                now = time.monotonic()
+            if not self._cache_fresh(key, now):
+                with self._key_locks[key]:
+                    if not self._cache_fresh(key, now):
+                        return fill(self, now)
+            logger.debug(hit_message)
+            return self._cache[key].value
+        return getter
+    return decorator
+
+
 class EconomicDataValidator:
     """
     Classe avancée pour valider les données économiques et financières dans les articles générés.
     Vérifie l'exactitude d'un large éventail de données économiques et financières.
     """
     
+    # Attributs fixes: pas de __dict__ par instance
+    __slots__ = (
+        # Configuration et données de référence
+        "data_sources", "fred_api_key", "central_banks", "known_experts", "reference_data",
+        "_fed_meeting_ranges", "_bank_next_meetings",
+        "_expert_names", "_expert_orgs", "_expert_quotes_flat", "_expert_quote_ranges", "_expert_quote_words",
+        # Réseau et caches
+        "session", "_rate_limiter", "_cache", "cache_validity", "_key_locks", "_current_markers",
+        "_result_cache", "_result_cache_lock", "_result_cache_size", "_result_cache_ttl",
+        # Motifs pré-compilés
+        "_fed_meeting_patterns", "_fed_rate_patterns", "_fed_prob_pattern", "_bank_prob_patterns",
+        "_prob_anchor", "_prob_scan_patterns", "_dxy_patterns", "_dxy_anchor", "_usd_cad_patterns",
+        "_bank_meeting_patterns", "_bank_rate_patterns", "_bank_name_index", "_bank_anchor", "_bank_automaton",
+        "_expert_patterns", "_expert_anchor", "_expert_automaton", "_unknown_expert_pattern",
+        "_forex_patterns", "_forex_context_patterns", "_inflation_patterns", "_inflation_context_patterns",
+        "_unemployment_patterns", "_treasury_patterns", "_category_tokens"
+    )
+    
     def __init__(self):
         """Initialise le validateur de données économiques avancé"""
         self.data_sources = {
@@ -43,9 +358,14 @@ class EconomicDataValidator:
         # Clés API (à configurer via des variables d'environnement)
         self.fred_api_key = os.getenv("FRED_API_KEY", "")
         
+        # Session HTTP partagée (connexions keep-alive réutilisées) et limite globale de 10 requêtes/s
+        self.session = self._make_session()
+        self._rate_limiter = _TokenBucket(rate=10.0, capacity=10)
+        
         # Données mises en cache
-        self.cached_data = {}
-        self.cache_timestamp = {}
+        self._cache: Dict[str, CacheEntry] = {}
+        # Valeurs actuelles formatées (_current_data_markers), avec les données dont elles sont issues
+        self._current_markers = None
         self.cache_validity = {
             "forex": timedelta(hours=6),  # Validité du cache pour les taux de change (6 heures)
             "inflation": timedelta(days=7),  # Validité du cache pour l'inflation (7 jours)
@@ -58,6 +378,16 @@ class EconomicDataValidator:
             "central_banks": timedelta(days=7)  # Validité du cache pour les données des banques centrales (7 jours)
         }
         
+        # Verrou par donnée en cache, créé d'avance (une création à la volée ne serait pas atomique entre threads)
+        self._key_locks = {key: threading.Lock() for key in self.cache_validity}
+        
+        # Résultats de validation par empreinte de l'article (LRU), valables au plus aussi longtemps que la donnée la plus
+        # volatile, et jamais au-delà de l'expiration des données en cache au moment de la validation
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()  # lecture, réordonnancement et éviction atomiques entre threads
+        self._result_cache_size = 128
+        self._result_cache_ttl = min(self.cache_validity.values()).total_seconds()
+        
         # Données de référence pour les banques centrales
         self.central_banks = {
             "fed": {"name": "Federal Reserve", "short": "Fed", "currency": "USD"},
@@ -141,8 +471,9 @@ class EconomicDataValidator:
         # Données de référence pour septembre 2025 (simulées pour l'exemple)
         # Dans une implémentation réelle, ces données seraient récupérées via des APIs
         self._setup_reference_data()
+        self._setup_patterns()
         
-        print("✅ Système avancé de validation des données économiques initialisé")
+        logger.info("✅ Système avancé de validation des données économiques initialisé")
     
     def _setup_reference_data(self):
         """Configure les données de référence pour la validation"""
@@ -197,76 +528,355 @@ class EconomicDataValidator:
                 "date": "2025-09-13"
             }
         }
+        
+        # Réunions FOMC connues, décodées une fois en paires de dates (début, fin)
+        self._fed_meeting_ranges = frozenset(
+            (date.fromisoformat(meeting["start_date"]), date.fromisoformat(meeting["end_date"]))
+            for meeting in self.reference_data["fed_meetings"]
+        )
+        
+        # Prochaines réunions des autres banques centrales, décodées une fois
+        self._bank_next_meetings = {
+            bank_code: date.fromisoformat(bank_data["next_meeting"])
+            for bank_code, bank_data in self.reference_data["other_central_banks"].items()
+        }
+        
+        # Experts en tableaux parallèles (une entrée par expert, une entrée par citation connue)
+        # pour parcourir des tuples contigus plutôt que des dictionnaires imbriqués
+        self._expert_names = tuple(self.known_experts)
+        self._expert_orgs = tuple(info["organization"] for info in self.known_experts.values())
+        self._expert_quotes_flat = tuple(quote for info in self.known_experts.values()
+                                         for quote in info.get("recent_quotes", ()))
+        # Citations connues de chaque expert: indices contigus dans _expert_quotes_flat
+        quote_counts = [len(info.get("recent_quotes", ())) for info in self.known_experts.values()]
+        quote_starts = [sum(quote_counts[:i]) for i in range(len(quote_counts))]
+        self._expert_quote_ranges = tuple(range(start, start + count) for start, count in zip(quote_starts, quote_counts))
+        # Mots de chaque citation connue, calculés une fois pour le score de Jaccard
+        self._expert_quote_words = tuple(frozenset(quote.lower().split()) for quote in self._expert_quotes_flat)
+    
+    @staticmethod
+    def _make_session() -> requests.Session:
+        """Crée la session HTTP avec pool de connexions et nouvelles tentatives (backoff exponentiel, Retry-After)"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, connect=1, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _http_get(self, url: str, **kwargs) -> requests.Response:
+        """GET via la session partagée, après passage par le limiteur de débit"""
+        self._rate_limiter.acquire()
+        return self.session.get(url, timeout=_HTTP_TIMEOUT, **kwargs)
+    
+    def _cache_fresh(self, key: str, now: float) -> bool:
+        """Indique si la donnée en cache pour key est encore valide à l'instant now (time.monotonic)"""
+        entry = self._cache.get(key)
+        return entry is not None and entry.expires_at > now
+    
+    def _cache_store(self, key: str, value: Any, validity: Optional[float] = None):
+        """Met une donnée en cache pour la durée de validité de sa source (ou validity secondes)"""
+        if validity is None:
+            validity = self.cache_validity[key].total_seconds()
+        self._cache[key] = CacheEntry(time.monotonic() + validity, value)
+    
+    async def _afetch(self, session, key: str, url: str, params: Optional[Dict[str, str]] = None):
+        """Récupère une source JSON; renvoie (clé, données) ou (clé, None) en cas d'échec"""
+        wait = self._rate_limiter.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        try:
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    return key, await response.json(content_type=None)
+                logger.warning("⚠️ Erreur lors de la récupération de %s: %s", key, response.status)
+        except Exception as e:
+            logger.warning("⚠️ Exception lors de la récupération de %s: %s", key, e)
+        return key, None
+    
+    async def _gather_fresh_data(self, stale: List[str]):
+        """Rafraîchit en parallèle les sources réseau stale (dont le cache a expiré)"""
+        timeout = aiohttp.ClientTimeout(total=_HTTP_TIMEOUT)
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=8, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            fetched = await asyncio.gather(*(self._afetch(session, key, self.data_sources[key]) for key in stale))
+        
+        for key, data in fetched:
+            if key == "forex":
+                with self._key_locks[key]:
+                    if data is not None:
+                        self._store_forex_rates(data)
+                    else:
+                        # Échec enregistré: les validateurs ne refont pas la requête (avec tentatives) en synchrone
+                        self._store_default_forex_rates()
+    
+    @staticmethod
+    def _compile_patterns(mapping: Dict[str, str]) -> Dict[str, "re.Pattern"]:
+        """
+        Compile une table {nom: regex} une seule fois au lieu de la repasser à re.findall à chaque validation
+        
+        Les motifs s'appliquent au texte normalisé (_normalize_text): leurs littéraux sont mis en
+        minuscules au lieu d'utiliser re.IGNORECASE (pas de repli de casse à chaque caractère).
+        """
+        return {name: re.compile(_lower_literals(pattern)) for name, pattern in mapping.items()}
+    
+    def _setup_patterns(self):
+        """Pré-compile les modèles regex utilisés par les méthodes _validate_*"""
+        # Dates des réunions FOMC
+        self._fed_meeting_patterns = self._compile_patterns({
+            "fomc_meeting_date": r"(?:FOMC|Fed)(?:\s+meeting|\s+decision)(?:\s+on|\s+scheduled\s+for)?(?:\s+(?:the|\w+))?\s+(\d{1,2})(?:st|nd|rd|th)?(?:\s*[-–—]?\s*(\d{1,2})(?:st|nd|rd|th)?)?\s+(?:of\s+)?(\w+)(?:\s+\d{4})?",
+            "fomc_meeting_range": r"(\d{1,2})(?:st|nd|rd|th)?(?:\s*[-–—]\s*|\s+and\s+|\s+to\s+)(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?(\w+)(?:\s+\d{4})?\s+(?:FOMC|Fed)(?:\s+meeting|\s+decision)",
+            "fomc_meeting_explicit": r"(?:FOMC|Fed)(?:\s+meeting|\s+decision)(?:\s+on|\s+scheduled\s+for)?\s+(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?(?:\s*[-–—]?\s*(\d{1,2})(?:st|nd|rd|th)?)?"
+        })
+        # Fourchettes de taux d'intérêt de la Fed
+        self._fed_rate_patterns = self._compile_patterns({
+            "fed_rate_range": r"(?:Fed|Federal Reserve|FOMC)(?:\s+target|\s+funds|\s+interest)?\s+rate(?:\s+range)?(?:\s+(?:of|at))?\s+(\d+\.?\d*)(?:\s*[-–—]\s*|\s+to\s+)(\d+\.?\d*)\s*%",
+            "fed_rate_single": r"(?:Fed|Federal Reserve|FOMC)(?:\s+target|\s+funds|\s+interest)?\s+rate(?:\s+(?:of|at))?\s+(\d+\.?\d*)\s*%",
+            "fed_rate_effective": r"(?:effective|actual)(?:\s+Fed|\s+Federal Reserve|\s+FOMC)?\s+(?:funds|interest)?\s+rate(?:\s+(?:of|at))?\s+(\d+\.?\d*)\s*%"
+        })
+        # Probabilités de décisions de taux de la Fed: un seul motif qui capture l'ampleur (25/50 pb),
+        # le verbe (hausse, pause, baisse) et la valeur, au lieu d'un motif par décision
+        self._fed_prob_pattern = re.compile(_lower_literals(
+            r"(?:probability|likelihood|chance|odds|market pricing)(?:\s+of)?\s+(?:a|an)?\s+(?:Fed|FOMC)?\s+"
+            r"(?:(?P<bp>25|50)(?:\s*bp|\s*basis\s*points?))?\s*(?:rate)?\s*"
+            r"(?P<verb>hike|increase|raising|hold|pause|unchanged|maintaining|cut|decrease|reduction|easing|lowering)"
+            r"(?:\s+of\s+(?P<bp_after>25|50)(?:\s*bp|\s*basis\s*points?))?(?:\s+in rates)?(?:\s+is|\s+are|\s+at|\s+of)?\s+"
+            r"(?P<value>\d+\.?\d*)(?:\s*%|\s*percent)"
+        ))
+        # Probabilités pour d'autres banques centrales
+        self._bank_prob_patterns = {
+            "boc": self._compile_patterns({
+                "boc_prob_hold": r"(?:probability|likelihood|chance|odds|market pricing)(?:\s+of)?\s+(?:a|an)?\s+(?:BoC|Bank of Canada)?\s+(?:rate)?\s*(?:hold|pause|unchanged|maintaining)(?:\s+in rates)?(?:\s+is|\s+are|\s+at|\s+of)?\s+(\d+\.?\d*)(?:\s*%|\s*percent)",
+                "boc_prob_cut": r"(?:probability|likelihood|chance|odds|market pricing)(?:\s+of)?\s+(?:a|an)?\s+(?:BoC|Bank of Canada)?\s+(?:rate)?\s*(?:cut|decrease|reduction|easing|lowering)(?:\s+in rates)?(?:\s+is|\s+are|\s+at|\s+of)?\s+(\d+\.?\d*)(?:\s*%|\s*percent)"
+            })
+        }
+        # Les motifs de probabilité partagent le même préfixe: un seul passage sur l'article
+        self._prob_anchor = re.compile(r"(?=probability|likelihood|chance|odds|market pricing)")
+        self._prob_scan_patterns = {"fed": self._fed_prob_pattern}
+        for bank_patterns in self._bank_prob_patterns.values():
+            self._prob_scan_patterns.update(bank_patterns)
+        # Indice USD (DXY)
+        self._dxy_patterns = self._compile_patterns({
+            "dxy_index": r"(?:USD index|Dollar index|DXY|Dollar Index)(?:\s+(?:at|of|around|near|approximately|about|close to|trading at))?\s+(\d{2,3}\.?\d*)",
+            "dxy_range": r"(?:USD index|Dollar index|DXY|Dollar Index)(?:\s+(?:trading|fluctuating|moving))?\s+(?:between|from|in a range of)\s+(\d{2,3}\.?\d*)(?:\s*[-–—]\s*|\s+and\s+|\s+to\s+)(\d{2,3}\.?\d*)"
+        })
+        # Les motifs DXY commencent par une alternative que re ne sait pas rechercher comme un littéral:
+        # l'ancre repère les noms de l'indice, puis chaque motif n'est essayé qu'à ces positions
+        self._dxy_anchor = re.compile(_lower_literals(r"(?=USD index|Dollar index|DXY)"))
+        # USD/CAD (taux, support, résistance)
+        self._usd_cad_patterns = self._compile_patterns({
+            "usd_cad_rate": r"USD/CAD(?:\s+(?:at|trading at|around|near|approximately|about|close to))?\s+(\d+\.?\d*)",
+            "usd_cad_support": r"USD/CAD(?:\s+(?:support|floor|bottom))(?:\s+(?:at|around|near|approximately|about|close to))?\s+(\d+\.?\d*)",
+            "usd_cad_resistance": r"USD/CAD(?:\s+(?:resistance|ceiling|top))(?:\s+(?:at|around|near|approximately|about|close to))?\s+(\d+\.?\d*)"
+        })
+        
+        # Réunions, taux et décisions attendues des autres banques centrales (la Fed est traitée séparément)
+        self._bank_meeting_patterns = {}
+        self._bank_rate_patterns = {}
+        for bank_code, bank_info in self.central_banks.items():
+            if bank_code == "fed":
+                continue
+            bank_name = bank_info["name"]
+            short_name = bank_info["short"]
+            self._bank_meeting_patterns[bank_code] = self._compile_patterns({
+                f"{bank_code}_meeting_date": fr"(?:{bank_name}|{short_name})(?:\s+meeting|\s+decision)(?:\s+on|\s+scheduled\s+for)?(?:\s+(?:the|\w+))?\s+(\d{{1,2}})(?:st|nd|rd|th)?(?:\s*[-–—]?\s*(\d{{1,2}})(?:st|nd|rd|th)?)?\s+(?:of\s+)?(\w+)(?:\s+\d{{4}})?",
+                f"{bank_code}_meeting_explicit": fr"(?:{bank_name}|{short_name})(?:\s+meeting|\s+decision)(?:\s+on|\s+scheduled\s+for)?\s+(\w+)\s+(\d{{1,2}})(?:st|nd|rd|th)?(?:\s*[-–—]?\s*(\d{{1,2}})(?:st|nd|rd|th)?)?"
+            })
+            self._bank_rate_patterns[bank_code] = self._compile_patterns({
+                f"{bank_code}_current_rate": fr"(?:{bank_name}|{short_name})(?:\s+(?:current|present|existing|current|actual))?\s+(?:interest|policy)?\s+rate(?:\s+(?:of|at|is))?\s+(\d+\.?\d*)(?:\s*%)?",
+                f"{bank_code}_expected_decision": fr"(?:{bank_name}|{short_name})(?:\s+is)?\s+(?:expected|anticipated|projected|forecast|predicted|likely)(?:\s+to)?\s+(hold|cut|hike|raise|lower|reduce|maintain|keep unchanged)(?:\s+(?:its|their))?\s+(?:interest|policy)?\s+rate"
+            })
+        
+        # Chaque motif commence par le nom ou l'abréviation d'une banque: un seul repérage pour toutes les banques,
+        # le nom trouvé (en minuscules) donnant la banque dont les motifs sont à essayer
+        self._bank_name_index = {
+            name.lower(): bank_code
+            for bank_code, bank_info in self.central_banks.items() if bank_code != "fed"
+            for name in (bank_info["name"], bank_info["short"])
+        }
+        self._bank_anchor = re.compile("(?=(%s))" % "|".join(re.escape(name) for name in self._bank_name_index))
+        self._bank_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._bank_automaton = ahocorasick.Automaton()
+            for name, bank_code in self._bank_name_index.items():
+                self._bank_automaton.add_word(name, (len(name), bank_code))
+            self._bank_automaton.make_automaton()
+        
+        # Citations et mentions des experts connus, clés (expert, "citation" | "mention")
+        self._expert_patterns = {}
+        for expert_name, organization in zip(self._expert_names, self._expert_orgs):
+            # Toujours deux groupes de capture: la citation de chaque forme (_validate_expert_citations en dépend)
+            self._expert_patterns[expert_name, "citation"] = re.compile(_lower_literals(fr"(?:according to|as per|as stated by|as noted by|as mentioned by|as reported by)\s+{expert_name}(?:\s+(?:of|from|at)\s+{organization})?,?\s*(?:said|says|stated|noted|mentioned|reported|commented|remarked|explained|suggested|pointed out|highlighted|emphasized|warned|cautioned|predicted|forecasted|projected|estimated)?\s*(?:that|,)?\s*[\"']([^\"']+)[\"']|{expert_name}(?:\s+(?:of|from|at)\s+{organization})?\s+(?:said|says|stated|noted|mentioned|reported|commented|remarked|explained|suggested|pointed out|highlighted|emphasized|warned|cautioned|predicted|forecasted|projected|estimated)\s*(?:that|,)?\s*[\"']([^\"']+)[\"']"))
+            self._expert_patterns[expert_name, "mention"] = re.compile(_lower_literals(fr"{expert_name}(?:\s+(?:of|from|at)\s+{organization})?"))
+        # Chaque motif commence par une formule d'attribution ou par le nom de l'expert
+        expert_anchors = _ATTRIBUTION_PHRASES + self._expert_names
+        self._expert_anchor = re.compile(_lower_literals(
+            "(?=%s)" % "|".join(re.escape(anchor) for anchor in expert_anchors)
+        ))
+        # Même repérage par automate d'Aho-Corasick (une transition par caractère, quel que soit le nombre d'experts)
+        self._expert_automaton = _build_automaton(expert_anchors)
+        # Citations d'experts non répertoriés (sensible à la casse: noms propres)
+        # Le nom d'organisation [A-Z][a-zA-Z\s]+ fait reculer re de façon quadratique sur les longues suites
+        # de mots capitalisés ou d'espaces: RE2, s'il est installé, parcourt le texte en temps linéaire
+        self._unknown_expert_pattern = _compile_linear(r"(?:according to|as per|as stated by|as noted by|as mentioned by|as reported by)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)(?:\s+(?:of|from|at)\s+([A-Z][a-zA-Z\s]+))?,?\s*(?:said|says|stated|noted|mentioned|reported|commented|remarked|explained|suggested|pointed out|highlighted|emphasized|warned|cautioned|predicted|forecasted|projected|estimated)?\s*(?:that|,)?\s*[\"']([^\"']+)[\"']|([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)(?:\s+(?:of|from|at)\s+([A-Z][a-zA-Z\s]+))?\s+(?:said|says|stated|noted|mentioned|reported|commented|remarked|explained|suggested|pointed out|highlighted|emphasized|warned|cautioned|predicted|forecasted|projected|estimated)\s*(?:that|,)?\s*[\"']([^\"']+)[\"']")
+        
+        # Taux de change
+        self._forex_patterns = self._compile_patterns({
+            "EUR/USD": r"EUR/USD(?:\s+(?:at|trading at|around|near|approximately|about|close to|current|price|rate|level|quote|value|stands at|is at))?\s+(\d+\.\d{1,4})(?!\s*%|\s*correlation|\s*basis)",
+            "GBP/USD": r"GBP/USD(?:\s+(?:at|trading at|around|near|approximately|about|close to|current|price|rate|level|quote|value|stands at|is at))?\s+(\d+\.\d{1,4})(?!\s*%|\s*correlation|\s*basis)",
+            "USD/JPY": r"USD/JPY(?:\s+(?:at|trading at|around|near|approximately|about|close to|current|price|rate|level|quote|value|stands at|is at))?\s+(\d{3}\.?\d{0,2})(?!\s*%|\s*correlation|\s*basis)"
+        })
+        # Contexte spécifique pour les valeurs numériques qui sont des taux de change
+        self._forex_context_patterns = self._compile_patterns({
+            "EUR/USD_context": r"(?:Current Price|Price|Rate|Trading at|Level):\s*(?:\*\*)?(\d+\.\d{4})(?:\*\*)?\s*(?:\||for EUR/USD)",
+            "GBP/USD_context": r"(?:Current Price|Price|Rate|Trading at|Level):\s*(?:\*\*)?(\d+\.\d{4})(?:\*\*)?\s*(?:\||for GBP/USD)",
+            "USD/JPY_context": r"(?:Current Price|Price|Rate|Trading at|Level):\s*(?:\*\*)?(\d{3}\.?\d{0,2})(?:\*\*)?\s*(?:\||for USD/JPY)"
+        })
+        # Inflation (CPI headline / core)
+        self._inflation_patterns = self._compile_patterns({
+            "CPI_headline": r"(?:headline\s+(?:CPI|inflation)|CPI\s+headline|inflation\s+headline)(?:\s+\(?YoY\)?)?(?:\s+rate)?:?\s*(?:at|of|is|at|stands at|reached|hit)?\s*(?:\*\*)?(\d+[.,]\d+)(?:\*\*)?\s*%(?!\s*increase|\s*decrease|\s*change)",
+            "CPI_core": r"(?:core\s+(?:CPI|inflation)|CPI\s+core|inflation\s+core)(?:\s+\(?YoY\)?)?(?:\s+rate)?:?\s*(?:at|of|is|at|stands at|reached|hit)?\s*(?:\*\*)?(\d+[.,]\d+)(?:\*\*)?\s*%(?!\s*increase|\s*decrease|\s*change)"
+        })
+        # Contextes spécifiques pour renforcer la détection
+        self._inflation_context_patterns = {
+            "CPI_headline": [
+                re.compile(_lower_literals(r"headline inflation (?:rate|figure|data|reading)?\s*(?:of|at|is|was|stands at|reached|hit)?\s*(?:\*\*)?(\d+[.,]\d+)(?:\*\*)?\s*%")),
+                re.compile(_lower_literals(r"inflation (?:rate|figure|data|reading)? (?:for August|for August 2025)?\s*(?:of|at|is|was|stands at|reached|hit)?\s*(?:\*\*)?(\d+[.,]\d+)(?:\*\*)?\s*%")),
+                re.compile(_lower_literals(r"August 2025 CPI data showed headline inflation at (\d+[.,]\d+)%")),
+                re.compile(_lower_literals(r"CPI data showed headline inflation at (\d+[.,]\d+)%")),
+                re.compile(_lower_literals(r"inflation persisting near (\d+[.,]\d+)%"))
+            ],
+            "CPI_core": [
+                re.compile(_lower_literals(r"core inflation (?:rate|figure|data|reading)?\s*(?:of|at|is|was|stands at|reached|hit)?\s*(?:\*\*)?(\d+[.,]\d+)(?:\*\*)?\s*%")),
+                re.compile(_lower_literals(r"core CPI (?:rate|figure|data|reading)? (?:for August|for August 2025)?\s*(?:of|at|is|was|stands at|reached|hit)?\s*(?:\*\*)?(\d+[.,]\d+)(?:\*\*)?\s*%")),
+                re.compile(_lower_literals(r"August 2025 CPI data showed.+core inflation at (\d+[.,]\d+)%")),
+                re.compile(_lower_literals(r"core inflation remains elevated at (\d+[.,]\d+)%"))
+            ]
+        }
+        # Chômage
+        self._unemployment_patterns = self._compile_patterns({
+            "unemployment_rate": r"(?:unemployment|chômage)[^%]*?([\d\.,]+)\s*%",
+            "initial_claims": r"(?:initial\s+claims|demandes\s+initiales)[^0-9]*?([\d\.,]+)"
+        })
+        # Rendements des bons du Trésor
+        self._treasury_patterns = self._compile_patterns({
+            "10Y": r"(?:10[- ]?year|10[- ]?ans)[^%]*?([\d\.,]+)\s*%",
+            "2Y": r"(?:2[- ]?year|2[- ]?ans)[^%]*?([\d\.,]+)\s*%",
+            "30Y": r"(?:30[- ]?year|30[- ]?ans)[^%]*?([\d\.,]+)\s*%"
+        })
+        
+        # Mots-clés (en minuscules) dont au moins un figure dans toute occurrence des motifs de chaque catégorie:
+        # si aucun n'apparaît dans l'article, les motifs de la catégorie ne peuvent rien trouver
+        other_banks = [bank_info for bank_code, bank_info in self.central_banks.items() if bank_code != "fed"]
+        self._category_tokens = {
+            "forex_rates": ("eur/usd", "gbp/usd", "usd/jpy", "price:", "rate:", "trading at:", "level:"),
+            "inflation_data": ("inflation", "cpi"),
+            "unemployment_data": ("unemployment", "chômage", "claims", "demandes"),
+            "treasury_yields": ("year", "ans"),
+            "fed_meetings": ("fomc", "fed"),
+            "fed_rates": ("fed", "fomc", "effective", "actual"),
+            "rate_probabilities": ("probability", "likelihood", "chance", "odds", "market pricing"),
+            "dxy_index": ("index", "dxy"),
+            "other_central_banks": tuple(name.lower() for bank_info in other_banks
+                                         for name in (bank_info["name"], bank_info["short"])) + ("usd/cad",),
+            # Un expert connu est toujours nommé; une citation d'expert non répertorié contient une formule
+            # d'attribution ou un verbe de citation (les guillemets et apostrophes sont trop fréquents pour filtrer)
+            "expert_citations": self._expert_names + _CITATION_TRIGGERS
+        }
     
-    def validate_article_data(self, article_content: str) -> Dict[str, Any]:
+    def validate_article_data(self, article_content: str, include_details: bool = True) -> Dict[str, Any]:
         """
         Valide toutes les données économiques mentionnées dans l'article
         
         Args:
             article_content: Le contenu de l'article à valider
+            include_details: Si False, chaque catégorie ne contient que ses compteurs
+                (listes "details" vides), sans allouer un dictionnaire par occurrence
             
         Returns:
             Un dictionnaire contenant les résultats de validation pour chaque type de donnée
         """
-        print("🔍 Validation des données économiques de l'article...")
-        
+        # Un article déjà validé récemment n'est pas réanalysé
+        article_key = (hashlib.blake2b(article_content.encode("utf-8"), digest_size=16).digest(), include_details)
+        # Un seul instant de référence pour toutes les vérifications de fraîcheur du cache
+        now = time.monotonic()
+        with self._result_cache_lock:
+            cached = self._result_cache.get(article_key)
+            if cached is not None and cached.expires_at > now:
+                self._result_cache.move_to_end(article_key)
+        if cached is not None and cached.expires_at > now:
+            logger.info("✅ Article déjà validé - résultats en cache (précision globale: %s%%)", cached.value["overall_accuracy"])
+            return _export_results(cached.value)
+        
+        logger.info("🔍 Validation des données économiques de l'article...")
+        
+        # Texte mis en minuscules une seule fois; les motifs sont compilés sans re.IGNORECASE
+        normalized = _normalize_text(article_content)
+        
+        # Les sources réseau sont rafraîchies en parallèle d'abord; les validateurs lisent ensuite le cache
+        # (boucle d'événements créée seulement si une source a expiré)
+        stale = [key for key in _NETWORK_SOURCES if not self._cache_fresh(key, now)]
+        if stale and AIOHTTP_AVAILABLE and not _event_loop_running():
+            asyncio.run(self._gather_fresh_data(stale))
+        
+        # Filtre préalable: une catégorie dont aucun mot-clé n'apparaît dans l'article n'exécute pas ses motifs
+        active = [category for category in _VALIDATION_CATEGORIES
+                  if any(token in normalized for token in self._category_tokens[category])]
+        # Une seule ligne de diagnostic pour toutes les catégories (construite seulement en mode debug)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Catégories validées: %s | ignorées (aucun mot-clé): %s",
+                         ", ".join(active), ", ".join(c for c in _VALIDATION_CATEGORIES if c not in active) or "-")
+        
+        # Validation séquentielle dans le thread appelant: re garde le GIL et les sources réseau
+        # ont déjà été rafraîchies ci-dessus, un pool de threads n'ajouterait que son coût
         results = {
-            "forex_rates": self._validate_forex_rates(article_content),
-            "inflation_data": self._validate_inflation_data(article_content),
-            "unemployment_data": self._validate_unemployment_data(article_content),
-            "treasury_yields": self._validate_treasury_yields(article_content),
-            "fed_meetings": self._validate_fed_meetings(article_content),
-            "fed_rates": self._validate_fed_rates(article_content),
-            "rate_probabilities": self._validate_rate_probabilities(article_content),
-            "dxy_index": self._validate_dxy_index(article_content),
-            "other_central_banks": self._validate_other_central_banks(article_content),
-            "expert_citations": self._validate_expert_citations(article_content),
-            "validation_timestamp": datetime.now().isoformat(),
-            "overall_accuracy": 0.0  # Sera calculé à la fin
+            category: getattr(self, f"_validate_{category}")(article_content, normalized, now, include_details)
+            if category in active
+            else {"metrics_found": 0, "metrics_accurate": 0, "details": []}
+            for category in _VALIDATION_CATEGORIES
         }
+        results["validation_timestamp"] = datetime.now().isoformat()
+        results["overall_accuracy"] = 0.0  # Sera calculé à la fin
         
-        # Calculer la précision globale
-        total_metrics = 0
-        accurate_metrics = 0
-        
-        categories = [
-            "forex_rates", "inflation_data", "unemployment_data", "treasury_yields",
-            "fed_meetings", "fed_rates", "rate_probabilities", "dxy_index",
-            "other_central_banks", "expert_citations"
-        ]
-        
-        for category in categories:
-            if results[category]["metrics_found"] > 0:
-                total_metrics += results[category]["metrics_found"]
-                accurate_metrics += results[category]["metrics_accurate"]
+        # Calculer la précision globale (seules les catégories validées ont des métriques)
+        total_metrics = sum(results[category]["metrics_found"] for category in active)
+        accurate_metrics = sum(results[category]["metrics_accurate"] for category in active)
         
         if total_metrics > 0:
-            results["overall_accuracy"] = round(accurate_metrics / total_metrics * 100, 1)
+            # Pourcentage au dixième près en arithmétique entière (arrondi au plus proche, exact sur les demis)
+            results["overall_accuracy"] = (accurate_metrics * 2000 + total_metrics) // (2 * total_metrics) / 10
         
-        print(f"✅ Validation terminée - Précision globale: {results['overall_accuracy']}%")
-        return results
+        # Les résultats expirent avec la première donnée en cache qui expire (ex. taux par défaut après un échec)
+        expires_at = min([now + self._result_cache_ttl] + [entry.expires_at for entry in list(self._cache.values())])
+        with self._result_cache_lock:
+            self._result_cache[article_key] = CacheEntry(expires_at, results)
+            self._result_cache.move_to_end(article_key)
+            if len(self._result_cache) > self._result_cache_size:
+                self._result_cache.popitem(last=False)
+        
+        logger.info("✅ Validation terminée - Précision globale: %s%%", results["overall_accuracy"])
+        return _export_results(results)
         
-    def _validate_fed_meetings(self, article_content: str) -> Dict[str, Any]:
+    def _validate_fed_meetings(self, article_content: str, normalized: str, now: float, include_details: bool = True) -> Dict[str, Any]:
         """
         Valide les dates des réunions FOMC mentionnées dans l'article
         
         Args:
             article_content: Le contenu de l'article
+            normalized: Le contenu normalisé (minuscules) sur lequel les motifs sont appliqués
+            now: Instant de la validation (time.monotonic), partagé par les contrôles de cache
+            include_details: Si False, seuls les compteurs sont produits (pas de détails)
             
         Returns:
             Résultats de validation pour les dates des réunions FOMC
         """
-        print("🔍 Validation des dates des réunions FOMC...")
-        
-        # Modèles regex pour détecter les dates des réunions FOMC dans l'article
-        patterns = {
-            "fomc_meeting_date": r"(?:FOMC|Fed)(?:\s+meeting|\s+decision)(?:\s+on|\s+scheduled\s+for)?(?:\s+(?:the|\w+))?\s+(\d{1,2})(?:st|nd|rd|th)?(?:\s*[-–—]?\s*(\d{1,2})(?:st|nd|rd|th)?)?\s+(?:of\s+)?(\w+)(?:\s+\d{4})?",
-            "fomc_meeting_range": r"(\d{1,2})(?:st|nd|rd|th)?(?:\s*[-–—]\s*|\s+and\s+|\s+to\s+)(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?(\w+)(?:\s+\d{4})?\s+(?:FOMC|Fed)(?:\s+meeting|\s+decision)",
-            "fomc_meeting_explicit": r"(?:FOMC|Fed)(?:\s+meeting|\s+decision)(?:\s+on|\s+scheduled\s+for)?\s+(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?(?:\s*[-–—]?\s*(\d{1,2})(?:st|nd|rd|th)?)?"
-        }
-        
         # Obtenir les dates actuelles des réunions FOMC
-        current_fed_meetings = self._get_current_fed_meetings()
+        current_fed_meetings = self._get_current_fed_meetings(now)
+        # Année actuelle par défaut (lue une fois pour toutes les dates de l'article)
+        year = datetime.now().year
         
         results = {
             "metrics_found": 0,
@@ -274,29 +884,9 @@ class EconomicDataValidator:
             "details": []
         }
         
-        # Fonction pour convertir le mois textuel en numéro
-        def month_to_number(month_name):
-            try:
-                return {
-                    'january': 1, 'jan': 1,
-                    'february': 2, 'feb': 2,
-                    'march': 3, 'mar': 3,
-                    'april': 4, 'apr': 4,
-                    'may': 5,
-                    'june': 6, 'jun': 6,
-                    'july': 7, 'jul': 7,
-                    'august': 8, 'aug': 8,
-                    'september': 9, 'sep': 9, 'sept': 9,
-                    'october': 10, 'oct': 10,
-                    'november': 11, 'nov': 11,
-                    'december': 12, 'dec': 12
-                }[month_name.lower()]
-            except KeyError:
-                return None
-        
         # Vérifier chaque pattern
-        for pattern_name, pattern in patterns.items():
-            matches = re.findall(pattern, article_content, re.IGNORECASE)
+        for pattern_name, pattern in self._fed_meeting_patterns.items():
+            matches = _findall_cased(pattern, normalized, article_content)
             
             if matches:
                 for match in matches:
@@ -304,102 +894,77 @@ class EconomicDataValidator:
                         # Format: "FOMC meeting on 16-17 September"
                         day_start = int(match[0])
                         day_end = int(match[1]) if match[1] else day_start
-                        month = month_to_number(match[2])
+                        month = _MONTH_MAP.get(match[2].lower())
                     elif pattern_name == "fomc_meeting_range":
                         # Format: "16-17 September FOMC meeting"
                         day_start = int(match[0])
                         day_end = int(match[1])
-                        month = month_to_number(match[2])
+                        month = _MONTH_MAP.get(match[2].lower())
                     elif pattern_name == "fomc_meeting_explicit":
                         # Format: "FOMC meeting on September 16-17"
-                        month = month_to_number(match[0])
+                        month = _MONTH_MAP.get(match[0].lower())
                         day_start = int(match[1])
                         day_end = int(match[2]) if match[2] else day_start
                     
                     if month:
-                        # Année actuelle par défaut
-                        year = datetime.now().year
-                        
                         # Créer les dates de début et de fin
                         try:
                             start_date = date(year, month, day_start)
                             end_date = date(year, month, day_end)
                             
-                            # Formater les dates pour la comparaison
-                            article_meeting = {
-                                "start_date": start_date.strftime("%Y-%m-%d"),
-                                "end_date": end_date.strftime("%Y-%m-%d")
-                            }
-                            
                             # Vérifier si les dates correspondent à une réunion FOMC connue
-                            is_accurate = False
-                            for fed_meeting in current_fed_meetings:
-                                if (article_meeting["start_date"] == fed_meeting["start_date"] and
-                                    article_meeting["end_date"] == fed_meeting["end_date"]):
-                                    is_accurate = True
-                                    break
+                            is_accurate = (start_date, end_date) in self._fed_meeting_ranges
                             
                             results["metrics_found"] += 1
                             if is_accurate:
                                 results["metrics_accurate"] += 1
                             
-                            results["details"].append({
-                                "type": "fomc_meeting_date",
-                                "article_value": f"{day_start}-{day_end} {match[2]}",
-                                "current_value": f"{current_fed_meetings[0]['start_date']} to {current_fed_meetings[0]['end_date']}",
-                                "is_accurate": is_accurate
-                            })
+                            if include_details:
+                                results["details"].append(ValidationDetail(
+                                    "fomc_meeting_date",
+                                    f"{day_start}-{day_end} {match[2]}",
+                                    f"{current_fed_meetings[0]['start_date']} to {current_fed_meetings[0]['end_date']}",
+                                    is_accurate
+                                ))
                         except ValueError:
                             # Date invalide, ignorer
                             pass
         
         return results
         
-    def _get_current_fed_meetings(self) -> List[Dict[str, str]]:
+    @_cached_source("fed_calendar", "✅ Utilisation des dates de réunion FOMC en cache")
+    def _get_current_fed_meetings(self, now: Optional[float] = None) -> List[Dict[str, str]]:
         """
         Obtient les dates actuelles des réunions FOMC
         
         Returns:
             Liste des réunions FOMC prévues
         """
-        # Vérifier si les données en cache sont encore valides
-        if ("fed_calendar" in self.cached_data and "fed_calendar" in self.cache_timestamp and
-                datetime.now() - self.cache_timestamp["fed_calendar"] < self.cache_validity["fed_calendar"]):
-            print("✅ Utilisation des dates de réunion FOMC en cache")
-            return self.cached_data["fed_calendar"]
-        
         # Dans une implémentation réelle, on utiliserait l'API du calendrier de la Fed
         # Pour l'instant, utiliser les données de référence
         fed_meetings = self.reference_data["fed_meetings"]
         
         # Mettre en cache les données
-        self.cached_data["fed_calendar"] = fed_meetings
-        self.cache_timestamp["fed_calendar"] = datetime.now()
+        self._cache_store("fed_calendar", fed_meetings)
         
-        print(f"✅ Dates des réunions FOMC récupérées: {fed_meetings[0]['start_date']} à {fed_meetings[0]['end_date']}")
+        logger.debug("✅ Dates des réunions FOMC récupérées: %s à %s", fed_meetings[0]["start_date"], fed_meetings[0]["end_date"])
         return fed_meetings
         
-    def _validate_fed_rates(self, article_content: str) -> Dict[str, Any]:
+    def _validate_fed_rates(self, article_content: str, normalized: str, now: float, include_details: bool = True) -> Dict[str, Any]:
         """
         Valide les fourchettes de taux d'intérêt de la Fed mentionnées dans l'article
         
         Args:
             article_content: Le contenu de l'article
+            normalized: Le contenu normalisé (minuscules) sur lequel les motifs sont appliqués
+            now: Instant de la validation (time.monotonic), partagé par les contrôles de cache
+            include_details: Si False, seuls les compteurs sont produits (pas de détails)
             
         Returns:
             Résultats de validation pour les taux d'intérêt de la Fed
         """
-        print("🔍 Validation des taux d'intérêt de la Fed...")
-        
-        # Modèles regex pour détecter les fourchettes de taux d'intérêt dans l'article
-        patterns = {
-            "fed_rate_range": r"(?:Fed|Federal Reserve|FOMC)(?:\s+target|\s+funds|\s+interest)?\s+rate(?:\s+range)?(?:\s+(?:of|at))?\s+(\d+\.?\d*)(?:\s*[-–—]\s*|\s+to\s+)(\d+\.?\d*)\s*%",
-            "fed_rate_single": r"(?:Fed|Federal Reserve|FOMC)(?:\s+target|\s+funds|\s+interest)?\s+rate(?:\s+(?:of|at))?\s+(\d+\.?\d*)\s*%",
-            "fed_rate_effective": r"(?:effective|actual)(?:\s+Fed|\s+Federal Reserve|\s+FOMC)?\s+(?:funds|interest)?\s+rate(?:\s+(?:of|at))?\s+(\d+\.?\d*)\s*%"
-        }
-        
         # Obtenir les taux d'intérêt actuels de la Fed
-        current_fed_rates = self._get_current_fed_rates()
+        current_fed_rates = self._get_current_fed_rates(now)
         
         results = {
             "metrics_found": 0,
@@ -407,98 +972,73 @@ class EconomicDataValidator:
             "details": []
         }
         
-        # Vérifier chaque pattern
-        for pattern_name, pattern in patterns.items():
-            matches = re.findall(pattern, article_content, re.IGNORECASE)
-            
-            if matches:
-                for match in matches:
-                    if pattern_name == "fed_rate_range":
-                        # Format: "Fed rate range of 4.25-4.50%"
-                        lower_rate = float(match[0])
-                        upper_rate = float(match[1])
-                        
-                        # Vérifier si la fourchette correspond aux taux actuels
-                        is_accurate = (abs(lower_rate - current_fed_rates["current_range"]["lower"]) < 0.01 and
-                                      abs(upper_rate - current_fed_rates["current_range"]["upper"]) < 0.01)
-                        
-                        results["metrics_found"] += 1
-                        if is_accurate:
-                            results["metrics_accurate"] += 1
-                        
-                        results["details"].append({
-                            "type": "fed_rate_range",
-                            "article_value": f"{lower_rate}-{upper_rate}%",
-                            "current_value": f"{current_fed_rates['current_range']['lower']}-{current_fed_rates['current_range']['upper']}%",
-                            "is_accurate": is_accurate
-                        })
-                    elif pattern_name == "fed_rate_single" or pattern_name == "fed_rate_effective":
-                        # Format: "Fed rate at 4.33%" ou "effective Fed rate of 4.33%"
-                        rate = float(match)
-                        
-                        # Vérifier si le taux correspond au taux effectif actuel
-                        is_accurate = abs(rate - current_fed_rates["effective_rate"]) < 0.05
-                        
-                        results["metrics_found"] += 1
-                        if is_accurate:
-                            results["metrics_accurate"] += 1
-                        
-                        results["details"].append({
-                            "type": "fed_rate_single" if pattern_name == "fed_rate_single" else "fed_rate_effective",
-                            "article_value": f"{rate}%",
-                            "current_value": f"{current_fed_rates['effective_rate']}%",
-                            "is_accurate": is_accurate
-                        })
+        # Références et leur affichage, calculés une fois pour toutes les occurrences
+        lower_ref = current_fed_rates["current_range"]["lower"]
+        upper_ref = current_fed_rates["current_range"]["upper"]
+        effective_ref = current_fed_rates["effective_rate"]
+        range_display = f"{lower_ref}-{upper_ref}%"
+        effective_display = f"{effective_ref}%"
+        
+        # Format: "Fed rate range of 4.25-4.50%"
+        ranges = [(float(lower), float(upper)) for lower, upper in self._fed_rate_patterns["fed_rate_range"].findall(normalized)]
+        # Vérifier si la fourchette correspond aux taux actuels
+        accurate = [abs(lower_rate - lower_ref) < 0.01 and abs(upper_rate - upper_ref) < 0.01 for lower_rate, upper_rate in ranges]
+        results["metrics_found"] += len(ranges)
+        results["metrics_accurate"] += sum(accurate)
+        if include_details:
+            results["details"].extend(
+                ValidationDetail("fed_rate_range", f"{lower_rate}-{upper_rate}%", range_display, is_accurate)
+                for (lower_rate, upper_rate), is_accurate in zip(ranges, accurate)
+            )
+        
+        # Format: "Fed rate at 4.33%" ou "effective Fed rate of 4.33%", comparés au taux effectif actuel
+        for pattern_name in ("fed_rate_single", "fed_rate_effective"):
+            rates = [float(match) for match in self._fed_rate_patterns[pattern_name].findall(normalized)]
+            accurate = [abs(rate - effective_ref) < 0.05 for rate in rates]
+            results["metrics_found"] += len(rates)
+            results["metrics_accurate"] += sum(accurate)
+            if include_details:
+                results["details"].extend(
+                    ValidationDetail(pattern_name, f"{rate}%", effective_display, is_accurate)
+                    for rate, is_accurate in zip(rates, accurate)
+                )
         
         return results
         
-    def _get_current_fed_rates(self) -> Dict[str, Any]:
+    @_cached_source("fed_rates", "✅ Utilisation des taux d'intérêt de la Fed en cache")
+    def _get_current_fed_rates(self, now: Optional[float] = None) -> Dict[str, Any]:
         """
         Obtient les taux d'intérêt actuels de la Fed
         
         Returns:
             Dictionnaire des taux d'intérêt actuels de la Fed
         """
-        # Vérifier si les données en cache sont encore valides
-        if ("fed_rates" in self.cached_data and "fed_rates" in self.cache_timestamp and
-                datetime.now() - self.cache_timestamp["fed_rates"] < self.cache_validity["fed_rates"]):
-            print("✅ Utilisation des taux d'intérêt de la Fed en cache")
-            return self.cached_data["fed_rates"]
-        
         # Dans une implémentation réelle, on utiliserait une API pour obtenir les taux actuels
         # Pour l'instant, utiliser les données de référence
         fed_rates = self.reference_data["fed_rates"]
         
         # Mettre en cache les données
-        self.cached_data["fed_rates"] = fed_rates
-        self.cache_timestamp["fed_rates"] = datetime.now()
+        self._cache_store("fed_rates", fed_rates)
         
-        print(f"✅ Taux d'intérêt de la Fed récupérés: {fed_rates['current_range']['lower']}-{fed_rates['current_range']['upper']}%, effectif: {fed_rates['effective_rate']}%")
+        logger.debug("✅ Taux d'intérêt de la Fed récupérés: %s-%s%%, effectif: %s%%",
+                     fed_rates["current_range"]["lower"], fed_rates["current_range"]["upper"], fed_rates["effective_rate"])
         return fed_rates
         
-    def _validate_rate_probabilities(self, article_content: str) -> Dict[str, Any]:
+    def _validate_rate_probabilities(self, article_content: str, normalized: str, now: float, include_details: bool = True) -> Dict[str, Any]:
         """
         Valide les probabilités de décisions de taux mentionnées dans l'article
         
         Args:
             article_content: Le contenu de l'article
+            normalized: Le contenu normalisé (minuscules) sur lequel les motifs sont appliqués
+            now: Instant de la validation (time.monotonic), partagé par les contrôles de cache
+            include_details: Si False, seuls les compteurs sont produits (pas de détails)
             
         Returns:
             Résultats de validation pour les probabilités de décisions de taux
         """
-        print("🔍 Validation des probabilités de décisions de taux...")
-        
-        # Modèles regex pour détecter les probabilités de décisions de taux dans l'article
-        patterns = {
-            "fed_prob_hike": r"(?:probability|likelihood|chance|odds|market pricing)(?:\s+of)?\s+(?:a|an)?\s+(?:Fed|FOMC)?\s+(?:rate)?\s*(?:hike|increase|raising)(?:\s+in rates)?(?:\s+is|\s+are|\s+at|\s+of)?\s+(\d+\.?\d*)(?:\s*%|\s*percent)",
-            "fed_prob_hold": r"(?:probability|likelihood|chance|odds|market pricing)(?:\s+of)?\s+(?:a|an)?\s+(?:Fed|FOMC)?\s+(?:rate)?\s*(?:hold|pause|unchanged|maintaining)(?:\s+in rates)?(?:\s+is|\s+are|\s+at|\s+of)?\s+(\d+\.?\d*)(?:\s*%|\s*percent)",
-            "fed_prob_cut": r"(?:probability|likelihood|chance|odds|market pricing)(?:\s+of)?\s+(?:a|an)?\s+(?:Fed|FOMC)?\s+(?:rate)?\s*(?:cut|decrease|reduction|easing|lowering)(?:\s+in rates)?(?:\s+is|\s+are|\s+at|\s+of)?\s+(\d+\.?\d*)(?:\s*%|\s*percent)",
-            "fed_prob_cut_25bp": r"(?:probability|likelihood|chance|odds|market pricing)(?:\s+of)?\s+(?:a|an)?\s+(?:Fed|FOMC)?\s+(?:25(?:\s*bp|\s*basis\s*points?))?\s*(?:rate)?\s*(?:cut|decrease|reduction|easing|lowering)(?:\s+of\s+25(?:\s*bp|\s*basis\s*points?))?(?:\s+in rates)?(?:\s+is|\s+are|\s+at|\s+of)?\s+(\d+\.?\d*)(?:\s*%|\s*percent)",
-            "fed_prob_cut_50bp": r"(?:probability|likelihood|chance|odds|market pricing)(?:\s+of)?\s+(?:a|an)?\s+(?:Fed|FOMC)?\s+(?:50(?:\s*bp|\s*basis\s*points?))?\s*(?:rate)?\s*(?:cut|decrease|reduction|easing|lowering)(?:\s+of\s+50(?:\s*bp|\s*basis\s*points?))?(?:\s+in rates)?(?:\s+is|\s+are|\s+at|\s+of)?\s+(\d+\.?\d*)(?:\s*%|\s*percent)"
-        }
-        
         # Obtenir les probabilités actuelles de décisions de taux
-        current_probabilities = self._get_current_rate_probabilities()
+        current_probabilities = self._get_current_rate_probabilities(now)
         
         results = {
             "metrics_found": 0,
@@ -506,139 +1046,89 @@ class EconomicDataValidator:
             "details": []
         }
         
-        # Vérifier chaque pattern
-        for pattern_name, pattern in patterns.items():
-            matches = re.findall(pattern, article_content, re.IGNORECASE)
-            
-            if matches:
-                for match in matches:
-                    # Nettoyer la valeur extraite
-                    cleaned_match = match.replace(',', '.').strip()
-                    # S'assurer qu'il n'y a pas de point final
-                    if cleaned_match.endswith('.'):
-                        cleaned_match = cleaned_match[:-1]
-                    prob_value = float(cleaned_match)
-                    
-                    # Déterminer la clé correspondante dans les données de référence
-                    if pattern_name == "fed_prob_hike":
-                        ref_key = "hike"
-                    elif pattern_name == "fed_prob_hold":
-                        ref_key = "hold"
-                    elif pattern_name == "fed_prob_cut":
-                        # Si c'est une coupure générale, comparer à la somme des probabilités de coupure
-                        current_value = current_probabilities["fed"]["cut_25bp"] + current_probabilities["fed"]["cut_50bp"]
-                    elif pattern_name == "fed_prob_cut_25bp":
-                        ref_key = "cut_25bp"
-                    elif pattern_name == "fed_prob_cut_50bp":
-                        ref_key = "cut_50bp"
-                    
-                    # Obtenir la valeur de référence
-                    if pattern_name != "fed_prob_cut":
-                        current_value = current_probabilities["fed"][ref_key]
-                    
-                    # Vérifier si la probabilité est précise (à 10% près)
-                    is_accurate = abs(prob_value - current_value) <= 10.0
-                    
-                    results["metrics_found"] += 1
-                    if is_accurate:
-                        results["metrics_accurate"] += 1
-                    
-                    results["details"].append({
-                        "type": pattern_name,
-                        "article_value": f"{prob_value}%",
-                        "current_value": f"{current_value}%",
-                        "is_accurate": is_accurate
-                    })
+        # Un seul passage sur l'article pour tous les motifs de probabilité (Fed et autres banques)
+        found = _anchored_findall(self._prob_anchor, self._prob_scan_patterns, normalized)
+        
+        # Chaque occurrence est classée une seule fois selon le verbe et l'ampleur capturés
+        fed_matches = {pattern_name: [] for pattern_name in _FED_PROB_REF_KEYS}
+        for bp, verb, bp_after, value in found["fed"]:
+            direction = _PROB_DIRECTIONS[verb.lower()]
+            if direction == "cut" and (bp or bp_after):
+                fed_matches[f"fed_prob_cut_{bp or bp_after}bp"].append(value)
+            else:
+                fed_matches[f"fed_prob_{direction}"].append(value)
+        
+        # Valeur de référence résolue une fois par type, puis comparée à toutes ses occurrences
+        fed_probabilities = current_probabilities["fed"]
+        for pattern_name, matches in fed_matches.items():
+            if not matches:
+                continue
+            if pattern_name == "fed_prob_cut":
+                # Si c'est une coupure générale, comparer à la somme des probabilités de coupure
+                current_value = fed_probabilities["cut_25bp"] + fed_probabilities["cut_50bp"]
+            else:
+                current_value = fed_probabilities[_FED_PROB_REF_KEYS[pattern_name]]
+            self._record_probabilities(results, pattern_name, matches, current_value, include_details)
         
         # Vérifier également les probabilités pour d'autres banques centrales
-        for bank, bank_patterns in {
-            "boc": {
-                "boc_prob_hold": r"(?:probability|likelihood|chance|odds|market pricing)(?:\s+of)?\s+(?:a|an)?\s+(?:BoC|Bank of Canada)?\s+(?:rate)?\s*(?:hold|pause|unchanged|maintaining)(?:\s+in rates)?(?:\s+is|\s+are|\s+at|\s+of)?\s+(\d+\.?\d*)(?:\s*%|\s*percent)",
-                "boc_prob_cut": r"(?:probability|likelihood|chance|odds|market pricing)(?:\s+of)?\s+(?:a|an)?\s+(?:BoC|Bank of Canada)?\s+(?:rate)?\s*(?:cut|decrease|reduction|easing|lowering)(?:\s+in rates)?(?:\s+is|\s+are|\s+at|\s+of)?\s+(\d+\.?\d*)(?:\s*%|\s*percent)"
-            }
-        }.items():
+        for bank, bank_patterns in self._bank_prob_patterns.items():
             if bank in current_probabilities:
-                for pattern_name, pattern in bank_patterns.items():
-                    matches = re.findall(pattern, article_content, re.IGNORECASE)
-                    
+                for pattern_name in bank_patterns:
+                    matches = found[pattern_name]
                     if matches:
-                        for match in matches:
-                            # Nettoyer la valeur extraite
-                            cleaned_match = match.replace(',', '.').strip()
-                            # S'assurer qu'il n'y a pas de point final
-                            if cleaned_match.endswith('.'):
-                                cleaned_match = cleaned_match[:-1]
-                            prob_value = float(cleaned_match)
-                            
-                            # Déterminer la clé correspondante dans les données de référence
-                            if "prob_hold" in pattern_name:
-                                ref_key = "hold"
-                            elif "prob_cut" in pattern_name:
-                                ref_key = "cut_25bp"
-                            
-                            # Obtenir la valeur de référence
-                            current_value = current_probabilities[bank][ref_key]
-                            
-                            # Vérifier si la probabilité est précise (à 10% près)
-                            is_accurate = abs(prob_value - current_value) <= 10.0
-                            
-                            results["metrics_found"] += 1
-                            if is_accurate:
-                                results["metrics_accurate"] += 1
-                            
-                            results["details"].append({
-                                "type": pattern_name,
-                                "article_value": f"{prob_value}%",
-                                "current_value": f"{current_value}%",
-                                "is_accurate": is_accurate
-                            })
+                        ref_key = "hold" if "prob_hold" in pattern_name else "cut_25bp"
+                        self._record_probabilities(results, pattern_name, matches, current_probabilities[bank][ref_key], include_details)
         
         return results
         
-    def _get_current_rate_probabilities(self) -> Dict[str, Dict[str, float]]:
+    @staticmethod
+    def _record_probabilities(results: Dict[str, Any], pattern_name: str, matches: List[str], current_value: float,
+                              include_details: bool = True):
+        """Compare en bloc les probabilités trouvées pour un motif à la valeur de référence (à 10% près)"""
+        values = [float(_clean_number(match)) for match in matches]
+        accurate = [abs(value - current_value) <= 10.0 for value in values]
+        current_display = f"{current_value}%"
+        results["metrics_found"] += len(values)
+        results["metrics_accurate"] += sum(accurate)
+        if include_details:
+            results["details"].extend(
+                ValidationDetail(pattern_name, f"{value}%", current_display, is_accurate)
+                for value, is_accurate in zip(values, accurate)
+            )
+        
+    @_cached_source("rate_probabilities", "✅ Utilisation des probabilités de taux en cache")
+    def _get_current_rate_probabilities(self, now: Optional[float] = None) -> Dict[str, Dict[str, float]]:
         """
         Obtient les probabilités actuelles de décisions de taux
         
         Returns:
             Dictionnaire des probabilités actuelles de décisions de taux
         """
-        # Vérifier si les données en cache sont encore valides
-        if ("rate_probabilities" in self.cached_data and "rate_probabilities" in self.cache_timestamp and
-                datetime.now() - self.cache_timestamp["rate_probabilities"] < self.cache_validity["rate_probabilities"]):
-            print("✅ Utilisation des probabilités de taux en cache")
-            return self.cached_data["rate_probabilities"]
-        
         # Dans une implémentation réelle, on utiliserait une API pour obtenir les probabilités actuelles
         # Pour l'instant, utiliser les données de référence
         probabilities = self.reference_data["rate_probabilities"]
         
         # Mettre en cache les données
-        self.cached_data["rate_probabilities"] = probabilities
-        self.cache_timestamp["rate_probabilities"] = datetime.now()
+        self._cache_store("rate_probabilities", probabilities)
         
-        print(f"✅ Probabilités de taux récupérées: Fed hold: {probabilities['fed']['hold']}%, cut 25bp: {probabilities['fed']['cut_25bp']}%")
+        logger.debug("✅ Probabilités de taux récupérées: Fed hold: %s%%, cut 25bp: %s%%", probabilities["fed"]["hold"], probabilities["fed"]["cut_25bp"])
         return probabilities
         
-    def _validate_dxy_index(self, article_content: str) -> Dict[str, Any]:
+    def _validate_dxy_index(self, article_content: str, normalized: str, now: float, include_details: bool = True) -> Dict[str, Any]:
         """
         Valide les mentions de l'indice USD (DXY) dans l'article
         
         Args:
             article_content: Le contenu de l'article
+            normalized: Le contenu normalisé (minuscules) sur lequel les motifs sont appliqués
+            now: Instant de la validation (time.monotonic), partagé par les contrôles de cache
+            include_details: Si False, seuls les compteurs sont produits (pas de détails)
             
         Returns:
             Résultats de validation pour l'indice USD (DXY)
         """
-        print("🔍 Validation de l'indice USD (DXY)...")
-        
-        # Modèles regex pour détecter l'indice USD (DXY) dans l'article
-        patterns = {
-            "dxy_index": r"(?:USD index|Dollar index|DXY|Dollar Index)(?:\s+(?:at|of|around|near|approximately|about|close to|trading at))?\s+(\d{2,3}\.?\d*)",
-            "dxy_range": r"(?:USD index|Dollar index|DXY|Dollar Index)(?:\s+(?:trading|fluctuating|moving))?\s+(?:between|from|in a range of)\s+(\d{2,3}\.?\d*)(?:\s*[-–—]\s*|\s+and\s+|\s+to\s+)(\d{2,3}\.?\d*)"
-        }
-        
         # Obtenir la valeur actuelle de l'indice DXY
-        current_dxy = self._get_current_dxy_index()
+        current_dxy = self._get_current_dxy_index(now)
         
         results = {
             "metrics_found": 0,
@@ -646,10 +1136,9 @@ class EconomicDataValidator:
             "details": []
         }
         
-        # Vérifier chaque pattern
-        for pattern_name, pattern in patterns.items():
-            matches = re.findall(pattern, article_content, re.IGNORECASE)
-            
+        # Vérifier chaque pattern (un seul passage sur l'article pour repérer l'indice)
+        dxy_matches = _anchored_findall(self._dxy_anchor, self._dxy_patterns, normalized)
+        for pattern_name, matches in dxy_matches.items():
             if matches:
                 for match in matches:
                     if pattern_name == "dxy_index":
@@ -663,12 +1152,8 @@ class EconomicDataValidator:
                         if is_accurate:
                             results["metrics_accurate"] += 1
                         
-                        results["details"].append({
-                            "type": "dxy_index",
-                            "article_value": f"{dxy_value}",
-                            "current_value": f"{current_dxy['current']}",
-                            "is_accurate": is_accurate
-                        })
+                        if include_details:
+                            results["details"].append(ValidationDetail("dxy_index", f"{dxy_value}", f"{current_dxy['current']}", is_accurate))
                     elif pattern_name == "dxy_range":
                         # Format: "DXY trading between 97.50 and 98.20"
                         dxy_min = float(match[0])
@@ -681,53 +1166,57 @@ class EconomicDataValidator:
                         if is_accurate:
                             results["metrics_accurate"] += 1
                         
-                        results["details"].append({
-                            "type": "dxy_range",
-                            "article_value": f"{dxy_min}-{dxy_max}",
-                            "current_value": f"{current_dxy['current']}",
-                            "is_accurate": is_accurate
-                        })
+                        if include_details:
+                            results["details"].append(ValidationDetail("dxy_range", f"{dxy_min}-{dxy_max}", f"{current_dxy['current']}", is_accurate))
         
         return results
         
-    def _get_current_dxy_index(self) -> Dict[str, Any]:
+    @_cached_source("dxy", "✅ Utilisation de l'indice DXY en cache")
+    def _get_current_dxy_index(self, now: Optional[float] = None) -> Dict[str, Any]:
         """
         Obtient la valeur actuelle de l'indice USD (DXY)
         
         Returns:
             Dictionnaire contenant la valeur actuelle de l'indice DXY
         """
-        # Vérifier si les données en cache sont encore valides
-        if ("dxy" in self.cached_data and "dxy" in self.cache_timestamp and
-                datetime.now() - self.cache_timestamp["dxy"] < self.cache_validity["dxy"]):
-            print("✅ Utilisation de l'indice DXY en cache")
-            return self.cached_data["dxy"]
-        
         # Dans une implémentation réelle, on utiliserait une API pour obtenir la valeur actuelle
         # Pour l'instant, utiliser les données de référence
         dxy_data = self.reference_data["dxy_index"]
         
         # Mettre en cache les données
-        self.cached_data["dxy"] = dxy_data
-        self.cache_timestamp["dxy"] = datetime.now()
+        self._cache_store("dxy", dxy_data)
         
-        print(f"✅ Indice DXY récupéré: {dxy_data['current']} ({dxy_data['date']})")
+        logger.debug("✅ Indice DXY récupéré: %s (%s)", dxy_data["current"], dxy_data["date"])
         return dxy_data
         
-    def _validate_other_central_banks(self, article_content: str) -> Dict[str, Any]:
+    def _bank_positions(self, normalized: str) -> Dict[str, List[int]]:
+        """Positions (croissantes) des noms de chaque banque centrale dans le texte normalisé, par code de banque"""
+        positions = {}
+        if self._bank_automaton is not None:
+            for end, (length, bank_code) in self._bank_automaton.iter(normalized):
+                positions.setdefault(bank_code, set()).add(end - length + 1)
+            return {bank_code: sorted(starts) for bank_code, starts in positions.items()}
+        for hit in self._bank_anchor.finditer(normalized):
+            positions.setdefault(self._bank_name_index[hit.group(1)], []).append(hit.start())
+        return positions
+    
+    def _validate_other_central_banks(self, article_content: str, normalized: str, now: float, include_details: bool = True) -> Dict[str, Any]:
         """
         Valide les informations sur les réunions d'autres banques centrales mentionnées dans l'article
         
         Args:
             article_content: Le contenu de l'article
+            normalized: Le contenu normalisé (minuscules) sur lequel les motifs sont appliqués
+            now: Instant de la validation (time.monotonic), partagé par les contrôles de cache
+            include_details: Si False, seuls les compteurs sont produits (pas de détails)
             
         Returns:
             Résultats de validation pour les réunions d'autres banques centrales
         """
-        print("🔍 Validation des informations sur les autres banques centrales...")
-        
         # Obtenir les informations actuelles sur les autres banques centrales
-        central_banks_data = self._get_other_central_banks_data()
+        central_banks_data = self._get_other_central_banks_data(now)
+        # Année actuelle par défaut (lue une fois pour toutes les dates de l'article)
+        year = datetime.now().year
         
         results = {
             "metrics_found": 0,
@@ -735,42 +1224,16 @@ class EconomicDataValidator:
             "details": []
         }
         
+        # Positions des noms de banques, trouvées en un seul passage puis réparties par banque
+        bank_positions = self._bank_positions(normalized)
+        
         # Vérifier les dates des réunions pour chaque banque centrale
         for bank_code, bank_info in self.central_banks.items():
             if bank_code != "fed" and bank_code in central_banks_data:  # Exclure la Fed qui est traitée séparément
-                bank_name = bank_info["name"]
-                short_name = bank_info["short"]
-                
-                # Modèles regex pour détecter les dates des réunions
-                patterns = {
-                    f"{bank_code}_meeting_date": fr"(?:{bank_name}|{short_name})(?:\s+meeting|\s+decision)(?:\s+on|\s+scheduled\s+for)?(?:\s+(?:the|\w+))?\s+(\d{{1,2}})(?:st|nd|rd|th)?(?:\s*[-–—]?\s*(\d{{1,2}})(?:st|nd|rd|th)?)?\s+(?:of\s+)?(\w+)(?:\s+\d{{4}})?",
-                    f"{bank_code}_meeting_explicit": fr"(?:{bank_name}|{short_name})(?:\s+meeting|\s+decision)(?:\s+on|\s+scheduled\s+for)?\s+(\w+)\s+(\d{{1,2}})(?:st|nd|rd|th)?(?:\s*[-–—]?\s*(\d{{1,2}})(?:st|nd|rd|th)?)?"
-                }
-                
-                # Fonction pour convertir le mois textuel en numéro
-                def month_to_number(month_name):
-                    try:
-                        return {
-                            'january': 1, 'jan': 1,
-                            'february': 2, 'feb': 2,
-                            'march': 3, 'mar': 3,
-                            'april': 4, 'apr': 4,
-                            'may': 5,
-                            'june': 6, 'jun': 6,
-                            'july': 7, 'jul': 7,
-                            'august': 8, 'aug': 8,
-                            'september': 9, 'sep': 9, 'sept': 9,
-                            'october': 10, 'oct': 10,
-                            'november': 11, 'nov': 11,
-                            'december': 12, 'dec': 12
-                        }[month_name.lower()]
-                    except KeyError:
-                        return None
                 
                 # Vérifier chaque pattern
-                for pattern_name, pattern in patterns.items():
-                    matches = re.findall(pattern, article_content, re.IGNORECASE)
-                    
+                meeting_matches = _findall_at(bank_positions.get(bank_code, ()), self._bank_meeting_patterns[bank_code], normalized, article_content)
+                for pattern_name, matches in meeting_matches.items():
                     if matches:
                         for match in matches:
                             if "_meeting_date" in pattern_name:
@@ -782,44 +1245,30 @@ class EconomicDataValidator:
                                 month_name = match[0]
                                 day = int(match[1])
                             
-                            month = month_to_number(month_name)
+                            month = _MONTH_MAP.get(month_name.lower())
                             
                             if month:
-                                # Année actuelle par défaut
-                                year = datetime.now().year
-                                
                                 # Créer la date de la réunion
                                 try:
                                     meeting_date = date(year, month, day)
-                                    article_date_str = meeting_date.strftime("%Y-%m-%d")
                                     
-                                    # Vérifier si la date correspond à la réunion connue
+                                    # Vérifier si la date correspond à la réunion connue (comparaison de dates)
                                     actual_date = central_banks_data[bank_code]["next_meeting"]
-                                    is_accurate = article_date_str == actual_date
+                                    is_accurate = meeting_date == self._bank_next_meetings.get(bank_code)
                                     
                                     results["metrics_found"] += 1
                                     if is_accurate:
                                         results["metrics_accurate"] += 1
                                     
-                                    results["details"].append({
-                                        "type": f"{bank_code}_meeting_date",
-                                        "article_value": f"{day} {month_name}",
-                                        "current_value": actual_date,
-                                        "is_accurate": is_accurate
-                                    })
+                                    if include_details:
+                                        results["details"].append(ValidationDetail(f"{bank_code}_meeting_date", f"{day} {month_name}", actual_date, is_accurate))
                                 except ValueError:
                                     # Date invalide, ignorer
                                     pass
                 
                 # Vérifier les taux actuels et les décisions attendues
-                rate_patterns = {
-                    f"{bank_code}_current_rate": fr"(?:{bank_name}|{short_name})(?:\s+(?:current|present|existing|current|actual))?\s+(?:interest|policy)?\s+rate(?:\s+(?:of|at|is))?\s+(\d+\.?\d*)(?:\s*%)?",
-                    f"{bank_code}_expected_decision": fr"(?:{bank_name}|{short_name})(?:\s+is)?\s+(?:expected|anticipated|projected|forecast|predicted|likely)(?:\s+to)?\s+(hold|cut|hike|raise|lower|reduce|maintain|keep unchanged)(?:\s+(?:its|their))?\s+(?:interest|policy)?\s+rate"
-                }
-                
-                for pattern_name, pattern in rate_patterns.items():
-                    matches = re.findall(pattern, article_content, re.IGNORECASE)
-                    
+                rate_matches = _findall_at(bank_positions.get(bank_code, ()), self._bank_rate_patterns[bank_code], normalized)
+                for pattern_name, matches in rate_matches.items():
                     if matches:
                         for match in matches:
                             if "_current_rate" in pattern_name:
@@ -834,12 +1283,8 @@ class EconomicDataValidator:
                                 if is_accurate:
                                     results["metrics_accurate"] += 1
                                 
-                                results["details"].append({
-                                    "type": f"{bank_code}_current_rate",
-                                    "article_value": f"{article_rate}%",
-                                    "current_value": f"{current_rate}%",
-                                    "is_accurate": is_accurate
-                                })
+                                if include_details:
+                                    results["details"].append(ValidationDetail(f"{bank_code}_current_rate", f"{article_rate}%", f"{current_rate}%", is_accurate))
                             elif "_expected_decision" in pattern_name:
                                 # Format: "BoC is expected to cut its interest rate"
                                 article_decision = match.lower()
@@ -860,33 +1305,20 @@ class EconomicDataValidator:
                                 if is_accurate:
                                     results["metrics_accurate"] += 1
                                 
-                                results["details"].append({
-                                    "type": f"{bank_code}_expected_decision",
-                                    "article_value": article_decision,
-                                    "current_value": expected_decision,
-                                    "is_accurate": is_accurate
-                                })
+                                if include_details:
+                                    results["details"].append(ValidationDetail(f"{bank_code}_expected_decision", article_decision, expected_decision, is_accurate))
         
         # Vérifier également les taux de change spécifiques comme USD/CAD
         if "usd_cad" in self.reference_data:
             usd_cad_data = self.reference_data["usd_cad"]
             
-            patterns = {
-                "usd_cad_rate": r"USD/CAD(?:\s+(?:at|trading at|around|near|approximately|about|close to))?\s+(\d+\.?\d*)",
-                "usd_cad_support": r"USD/CAD(?:\s+(?:support|floor|bottom))(?:\s+(?:at|around|near|approximately|about|close to))?\s+(\d+\.?\d*)",
-                "usd_cad_resistance": r"USD/CAD(?:\s+(?:resistance|ceiling|top))(?:\s+(?:at|around|near|approximately|about|close to))?\s+(\d+\.?\d*)"
-            }
-            
-            for pattern_name, pattern in patterns.items():
-                matches = re.findall(pattern, article_content, re.IGNORECASE)
+            for pattern_name, pattern in self._usd_cad_patterns.items():
+                matches = pattern.findall(normalized)
                 
                 if matches:
                     for match in matches:
-                        # Nettoyer la valeur extraite
-                        cleaned_match = match.replace(',', '.').strip()
-                        # S'assurer qu'il n'y a pas de point final
-                        if cleaned_match.endswith('.'):
-                            cleaned_match = cleaned_match[:-1]
+                        # Nettoyer la valeur extraite (virgule décimale, point final)
+                        cleaned_match = _clean_number(match)
                         rate_value = float(cleaned_match)
                         
                         # Déterminer la valeur de référence
@@ -907,75 +1339,87 @@ class EconomicDataValidator:
                         if is_accurate:
                             results["metrics_accurate"] += 1
                         
-                        results["details"].append({
-                            "type": pattern_name,
-                            "article_value": f"{rate_value}",
-                            "current_value": f"{current_value}",
-                            "is_accurate": is_accurate
-                        })
+                        if include_details:
+                            results["details"].append(ValidationDetail(pattern_name, f"{rate_value}", f"{current_value}", is_accurate))
         
         return results
         
-    def _get_other_central_banks_data(self) -> Dict[str, Dict[str, Any]]:
+    @_cached_source("central_banks", "✅ Utilisation des données des banques centrales en cache")
+    def _get_other_central_banks_data(self, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
         """
         Obtient les informations actuelles sur les autres banques centrales
         
         Returns:
             Dictionnaire des informations sur les autres banques centrales
         """
-        # Vérifier si les données en cache sont encore valides
-        if ("central_banks" in self.cached_data and "central_banks" in self.cache_timestamp and
-                datetime.now() - self.cache_timestamp["central_banks"] < self.cache_validity["central_banks"]):
-            print("✅ Utilisation des données des banques centrales en cache")
-            return self.cached_data["central_banks"]
-        
         # Dans une implémentation réelle, on utiliserait une API pour obtenir les informations actuelles
         # Pour l'instant, utiliser les données de référence
         central_banks_data = self.reference_data["other_central_banks"]
         
         # Mettre en cache les données
-        self.cached_data["central_banks"] = central_banks_data
-        self.cache_timestamp["central_banks"] = datetime.now()
+        self._cache_store("central_banks", central_banks_data)
         
-        print(f"✅ Données des banques centrales récupérées: BoC meeting on {central_banks_data['boc']['next_meeting']}")
+        logger.debug("✅ Données des banques centrales récupérées: BoC meeting on %s", central_banks_data["boc"]["next_meeting"])
         return central_banks_data
         
-    def _validate_expert_citations(self, article_content: str) -> Dict[str, Any]:
+    def _current_data_markers(self, now: Optional[float] = None) -> Tuple[str, ...]:
+        """
+        Taux de change et d'inflation actuels tels qu'ils peuvent apparaître dans une citation
+        
+        Une citation contient des données actuelles si elle contient l'une de ces chaînes.
+        Les chaînes ne sont reformatées que lorsque les données en cache ont été renouvelées.
+        """
+        forex_rates = self._get_current_forex_rates(now)
+        inflation_data = self._get_current_inflation_data(now)
+        cached = self._current_markers
+        if cached is not None and cached[0] is forex_rates and cached[1] is inflation_data:
+            return cached[2]
+        
+        markers = []
+        for rate in forex_rates.values():
+            markers += (str(round(rate, 2)), f"{rate:.1f}")
+        for value in inflation_data.values():
+            markers += (f"{value}%", f"{value} %")
+        markers = tuple(markers)
+        self._current_markers = (forex_rates, inflation_data, markers)
+        return markers
+    
+    def _validate_expert_citations(self, article_content: str, normalized: str, now: float, include_details: bool = True) -> Dict[str, Any]:
         """
         Valide les citations d'experts mentionnées dans l'article
         
         Args:
             article_content: Le contenu de l'article
+            normalized: Le contenu normalisé (minuscules) sur lequel les motifs sont appliqués
+            now: Instant de la validation (time.monotonic), partagé par les contrôles de cache
+            include_details: Si False, seuls les compteurs sont produits (pas de détails)
             
         Returns:
             Résultats de validation pour les citations d'experts
         """
-        print("🔍 Validation des citations d'experts...")
-        
         results = {
             "metrics_found": 0,
             "metrics_accurate": 0,
             "details": []
         }
+        # Experts déjà comptabilisés (noms en minuscules), indépendamment des détails produits
+        counted_experts = set()
+        # Valeurs actuelles sous forme de texte, récupérées à la première citation qui en a besoin
+        current_markers = None
+        
+        # Citations et mentions de tous les experts connus en un seul passage sur l'article
+        # Format: "According to Adam Button of ForexLive, ..." ou "Adam Button said, ..."
+        found = _findall_at(_anchor_positions(self._expert_automaton, self._expert_anchor, normalized), self._expert_patterns, normalized, article_content)
         
         # Vérifier les citations d'experts connus
-        for expert_name, expert_info in self.known_experts.items():
-            # Modèle regex pour détecter les citations d'experts
-            # Format: "According to Adam Button of ForexLive, ..." ou "Adam Button said, ..."
-            # Utilisation d'un contexte plus précis pour éviter les faux positifs
-            pattern = fr"(?:according to|as per|as stated by|as noted by|as mentioned by|as reported by)\s+{expert_name}(?:\s+(?:of|from|at)\s+{expert_info['organization']})?,?\s*(?:said|says|stated|noted|mentioned|reported|commented|remarked|explained|suggested|pointed out|highlighted|emphasized|warned|cautioned|predicted|forecasted|projected|estimated)?\s*(?:that|,)?\s*[\"']([^\"']+)[\"']|{expert_name}(?:\s+(?:of|from|at)\s+{expert_info['organization']})?\s+(?:said|says|stated|noted|mentioned|reported|commented|remarked|explained|suggested|pointed out|highlighted|emphasized|warned|cautioned|predicted|forecasted|projected|estimated)\s*(?:that|,)?\s*[\"']([^\"']+)[\"']"
-            
+        for expert_index, expert_name in enumerate(self._expert_names):
             # Rechercher les citations
-            matches = re.findall(pattern, article_content, re.IGNORECASE)
+            matches = found[expert_name, "citation"]
             
             if matches:
                 for match in matches:
-                    # Le match peut être un tuple avec plusieurs groupes de capture
-                    if isinstance(match, tuple):
-                        # Prendre le premier groupe non vide
-                        citation = next((m for m in match if m), "").strip()
-                    else:
-                        citation = match.strip()
+                    # Deux groupes: citation après la formule d'attribution, ou après le verbe (un seul est rempli)
+                    citation = (match[0] or match[1]).strip()
                     
                     # Ignorer les citations vides
                     if not citation:
@@ -986,20 +1430,20 @@ class EconomicDataValidator:
                     similarity_score = 0
                     most_similar_quote = ""
                     
-                    if "recent_quotes" in expert_info:
-                        for known_quote in expert_info["recent_quotes"]:
-                            # Calculer un score de similarité simple basé sur les mots communs
-                            citation_words = set(citation.lower().split())
-                            known_words = set(known_quote.lower().split())
-                            common_words = citation_words.intersection(known_words)
+                    # Calculer un score de similarité simple basé sur les mots communs
+                    citation_words = set(citation.lower().split())
+                    citation_size = len(citation_words)
+                    for quote_index in self._expert_quote_ranges[expert_index]:
+                        known_words = self._expert_quote_words[quote_index]
+                        
+                        # Calculer le score de similarité (Jaccard), |A ∪ B| = |A| + |B| - |A ∩ B| sans construire l'union
+                        if citation_size > 0 and len(known_words) > 0:
+                            common = len(citation_words.intersection(known_words))
+                            current_score = common / (citation_size + len(known_words) - common)
                             
-                            # Calculer le score de similarité (Jaccard)
-                            if len(citation_words) > 0 and len(known_words) > 0:
-                                current_score = len(common_words) / len(citation_words.union(known_words))
-                                
-                                if current_score > similarity_score:
-                                    similarity_score = current_score
-                                    most_similar_quote = known_quote
+                            if current_score > similarity_score:
+                                similarity_score = current_score
+                                most_similar_quote = self._expert_quotes_flat[quote_index]
                     
                     # Considérer la citation comme précise si elle a un score de similarité élevé
                     # ou si elle contient des informations économiques actuelles
@@ -1007,20 +1451,9 @@ class EconomicDataValidator:
                         is_accurate = True
                     else:
                         # Vérifier si la citation contient des données économiques actuelles
-                        contains_current_data = False
-                        
-                        # Vérifier les taux de change actuels
-                        for pair, rate in self._get_current_forex_rates().items():
-                            rate_str = str(round(rate, 2))
-                            if rate_str in citation or f"{rate:.1f}" in citation:
-                                contains_current_data = True
-                                break
-                        
-                        # Vérifier les taux d'inflation actuels
-                        for metric, value in self._get_current_inflation_data().items():
-                            if f"{value}%" in citation or f"{value} %" in citation:
-                                contains_current_data = True
-                                break
+                        if current_markers is None:
+                            current_markers = self._current_data_markers(now)
+                        contains_current_data = any(marker in citation for marker in current_markers)
                         
                         # Si la citation contient des données actuelles, elle est considérée comme précise
                         if contains_current_data:
@@ -1029,45 +1462,48 @@ class EconomicDataValidator:
                     results["metrics_found"] += 1
                     if is_accurate:
                         results["metrics_accurate"] += 1
+                    counted_experts.add(expert_name)
                     
-                    results["details"].append({
-                        "type": "expert_citation",
-                        "expert": expert_name,
-                        "organization": expert_info["organization"],
-                        "citation": citation[:100] + "..." if len(citation) > 100 else citation,
-                        "similarity_score": round(similarity_score, 2),
-                        "most_similar_known_quote": most_similar_quote[:100] + "..." if len(most_similar_quote) > 100 else most_similar_quote,
-                        "is_accurate": is_accurate
-                    })
+                    if include_details:
+                        results["details"].append({
+                            "type": "expert_citation",
+                            "expert": expert_name,
+                            "organization": self._expert_orgs[expert_index],
+                            "citation": citation[:100] + "..." if len(citation) > 100 else citation,
+                            "similarity_score": round(similarity_score, 2),
+                            "most_similar_known_quote": most_similar_quote[:100] + "..." if len(most_similar_quote) > 100 else most_similar_quote,
+                            "is_accurate": is_accurate
+                        })
             
             # Vérifier également les mentions d'experts sans citation directe
-            pattern = fr"{expert_name}(?:\s+(?:of|from|at)\s+{expert_info['organization']})?"
-            
             # Rechercher les mentions
-            matches = re.findall(pattern, article_content, re.IGNORECASE)
+            matches = found[expert_name, "mention"]
             
-            if matches and expert_name.lower() not in [detail["expert"].lower() for detail in results["details"] if "expert" in detail]:
+            if matches and expert_name not in counted_experts:
                 # Une mention a été trouvée et n'a pas déjà été comptabilisée
                 is_accurate = True  # L'expert existe et est correctement associé à son organisation
                 
                 results["metrics_found"] += 1
                 if is_accurate:
                     results["metrics_accurate"] += 1
+                counted_experts.add(expert_name)
                 
-                results["details"].append({
-                    "type": "expert_mention",
-                    "expert": expert_name,
-                    "organization": expert_info["organization"],
-                    "is_accurate": is_accurate
-                })
+                if include_details:
+                    results["details"].append({
+                        "type": "expert_mention",
+                        "expert": expert_name,
+                        "organization": self._expert_orgs[expert_index],
+                        "is_accurate": is_accurate
+                    })
         
         # Vérifier également les citations d'experts non répertoriés
         # Format: "According to [Name] of [Organization], ..." ou "[Name] said, ..."
         # Utilisation d'un contexte plus précis pour éviter les faux positifs
-        pattern = r"(?:according to|as per|as stated by|as noted by|as mentioned by|as reported by)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)(?:\s+(?:of|from|at)\s+([A-Z][a-zA-Z\s]+))?,?\s*(?:said|says|stated|noted|mentioned|reported|commented|remarked|explained|suggested|pointed out|highlighted|emphasized|warned|cautioned|predicted|forecasted|projected|estimated)?\s*(?:that|,)?\s*[\"']([^\"']+)[\"']|([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)(?:\s+(?:of|from|at)\s+([A-Z][a-zA-Z\s]+))?\s+(?:said|says|stated|noted|mentioned|reported|commented|remarked|explained|suggested|pointed out|highlighted|emphasized|warned|cautioned|predicted|forecasted|projected|estimated)\s*(?:that|,)?\s*[\"']([^\"']+)[\"']"
-        
-        # Rechercher les citations
-        matches = re.findall(pattern, article_content)
+        # (motif ignoré si l'article ne contient ni formule d'attribution ni verbe de citation)
+        if any(trigger in normalized for trigger in _CITATION_TRIGGERS):
+            matches = self._unknown_expert_pattern.findall(article_content)
+        else:
+            matches = []
         
         for match in matches:
             # Le match est un tuple avec plusieurs groupes de capture
@@ -1088,29 +1524,17 @@ class EconomicDataValidator:
             if not citation:
                 continue
             
-            # Liste d'exclusion pour éviter les faux positifs
-            excluded_terms = ["fed", "federal reserve", "ecb", "boe", "bank of england", "bank of canada", "boc", "bank of japan", "boj", "fomc"]
-            
             # Vérifier si l'expert est déjà connu ou s'il s'agit d'un terme à exclure
-            is_known_expert = expert_name.lower() in [name.lower() for name in self.known_experts.keys()]
-            is_excluded = expert_name.lower() in excluded_terms
+            # (nom mis en minuscules une fois; known_experts est indexé par nom en minuscules)
+            expert_key = expert_name.lower()
+            is_known_expert = expert_key in self.known_experts
+            is_excluded = expert_key in _EXCLUDED_EXPERT_TERMS  # Liste d'exclusion pour éviter les faux positifs
             
-            if not is_known_expert and not is_excluded and citation and expert_name.lower() not in [detail["expert"].lower() for detail in results["details"] if "expert" in detail]:
+            if not is_known_expert and not is_excluded and citation and expert_key not in counted_experts:
                 # Vérifier si la citation contient des données économiques actuelles
-                contains_current_data = False
-                
-                # Vérifier les taux de change actuels
-                for pair, rate in self._get_current_forex_rates().items():
-                    rate_str = str(round(rate, 2))
-                    if rate_str in citation or f"{rate:.1f}" in citation:
-                        contains_current_data = True
-                        break
-                
-                # Vérifier les taux d'inflation actuels
-                for metric, value in self._get_current_inflation_data().items():
-                    if f"{value}%" in citation or f"{value} %" in citation:
-                        contains_current_data = True
-                        break
+                if current_markers is None:
+                    current_markers = self._current_data_markers(now)
+                contains_current_data = any(marker in citation for marker in current_markers)
                 
                 # Pour les experts inconnus, nous considérons la citation comme précise si elle contient des données actuelles
                 is_accurate = contains_current_data
@@ -1118,47 +1542,35 @@ class EconomicDataValidator:
                 results["metrics_found"] += 1
                 if is_accurate:
                     results["metrics_accurate"] += 1
+                counted_experts.add(expert_key)
                 
-                results["details"].append({
-                    "type": "unknown_expert_citation",
-                    "expert": expert_name,
-                    "organization": organization,
-                    "citation": citation[:100] + "..." if len(citation) > 100 else citation,
-                    "contains_current_data": contains_current_data,
-                    "is_accurate": is_accurate
-                })
+                if include_details:
+                    results["details"].append({
+                        "type": "unknown_expert_citation",
+                        "expert": expert_name,
+                        "organization": organization,
+                        "citation": citation[:100] + "..." if len(citation) > 100 else citation,
+                        "contains_current_data": contains_current_data,
+                        "is_accurate": is_accurate
+                    })
         
         return results
     
-    def _validate_forex_rates(self, article_content: str) -> Dict[str, Any]:
+    def _validate_forex_rates(self, article_content: str, normalized: str, now: float, include_details: bool = True) -> Dict[str, Any]:
         """
         Valide les taux de change mentionnés dans l'article
         
         Args:
             article_content: Le contenu de l'article
+            normalized: Le contenu normalisé (minuscules) sur lequel les motifs sont appliqués
+            now: Instant de la validation (time.monotonic), partagé par les contrôles de cache
+            include_details: Si False, seuls les compteurs sont produits (pas de détails)
             
         Returns:
             Résultats de validation pour les taux de change
         """
-        print("🔍 Validation des taux de change...")
-        
-        # Modèles regex améliorés pour détecter les taux de change dans l'article
-        # Utilisation de contexte avant et après pour éviter les faux positifs
-        patterns = {
-            "EUR/USD": r"EUR/USD(?:\s+(?:at|trading at|around|near|approximately|about|close to|current|price|rate|level|quote|value|stands at|is at))?\s+(\d+\.\d{1,4})(?!\s*%|\s*correlation|\s*basis)",
-            "GBP/USD": r"GBP/USD(?:\s+(?:at|trading at|around|near|approximately|about|close to|current|price|rate|level|quote|value|stands at|is at))?\s+(\d+\.\d{1,4})(?!\s*%|\s*correlation|\s*basis)",
-            "USD/JPY": r"USD/JPY(?:\s+(?:at|trading at|around|near|approximately|about|close to|current|price|rate|level|quote|value|stands at|is at))?\s+(\d{3}\.?\d{0,2})(?!\s*%|\s*correlation|\s*basis)"
-        }
-        
-        # Contexte spécifique pour les valeurs numériques qui sont des taux de change
-        context_patterns = {
-            "EUR/USD_context": r"(?:Current Price|Price|Rate|Trading at|Level):\s*(?:\*\*)?(\d+\.\d{4})(?:\*\*)?\s*(?:\||for EUR/USD)",
-            "GBP/USD_context": r"(?:Current Price|Price|Rate|Trading at|Level):\s*(?:\*\*)?(\d+\.\d{4})(?:\*\*)?\s*(?:\||for GBP/USD)",
-            "USD/JPY_context": r"(?:Current Price|Price|Rate|Trading at|Level):\s*(?:\*\*)?(\d{3}\.?\d{0,2})(?:\*\*)?\s*(?:\||for USD/JPY)"
-        }
-        
         # Obtenir les taux de change actuels
-        current_rates = self._get_current_forex_rates()
+        current_rates = self._get_current_forex_rates(now)
         
         results = {
             "metrics_found": 0,
@@ -1170,16 +1582,13 @@ class EconomicDataValidator:
         processed_values = set()
         
         # Vérifier chaque paire de devises avec les patterns principaux
-        for pair, pattern in patterns.items():
-            matches = re.findall(pattern, article_content, re.IGNORECASE)
+        for pair, pattern in self._forex_patterns.items():
+            matches = pattern.findall(normalized)
             
             if matches:
                 for match in matches:
-                    # Nettoyer la valeur extraite
-                    cleaned_match = match.replace(',', '.').strip()
-                    # S'assurer qu'il n'y a pas de point final
-                    if cleaned_match.endswith('.'):
-                        cleaned_match = cleaned_match[:-1]
+                    # Nettoyer la valeur extraite (virgule décimale, point final)
+                    cleaned_match = _clean_number(match)
                     
                     # Vérifier si cette valeur a déjà été traitée
                     if f"{pair}:{cleaned_match}" in processed_values:
@@ -1188,16 +1597,12 @@ class EconomicDataValidator:
                     processed_values.add(f"{pair}:{cleaned_match}")
                     
                     # Vérifier que la valeur est dans une plage réaliste pour la paire
-                    is_realistic = False
-                    if pair == "EUR/USD" and 1.0 <= float(cleaned_match) <= 1.5:
-                        is_realistic = True
-                    elif pair == "GBP/USD" and 1.0 <= float(cleaned_match) <= 1.5:
-                        is_realistic = True
-                    elif pair == "USD/JPY" and 100.0 <= float(cleaned_match) <= 160.0:
-                        is_realistic = True
+                    # (la valeur n'est convertie qu'une fois, et seulement pour les paires bornées)
+                    bounds = _FOREX_REALISTIC_RANGES.get(pair)
+                    article_rate = float(cleaned_match) if bounds else None
+                    is_realistic = bounds is not None and bounds[0] <= article_rate <= bounds[1]
                     
                     if is_realistic:
-                        article_rate = float(cleaned_match)
                         current_rate = self._get_rate_for_pair(pair, current_rates)
                         
                         if current_rate:
@@ -1209,26 +1614,24 @@ class EconomicDataValidator:
                             if is_accurate:
                                 results["metrics_accurate"] += 1
                             
-                            results["details"].append({
-                                "pair": pair,
-                                "article_value": article_rate,
-                                "current_value": current_rate,
-                                "difference_pct": round(diff_pct, 2),
-                                "is_accurate": is_accurate
-                            })
+                            if include_details:
+                                results["details"].append({
+                                    "pair": pair,
+                                    "article_value": article_rate,
+                                    "current_value": current_rate,
+                                    "difference_pct": round(diff_pct, 2),
+                                    "is_accurate": is_accurate
+                                })
         
         # Vérifier avec les patterns de contexte
-        for pair_context, pattern in context_patterns.items():
+        for pair_context, pattern in self._forex_context_patterns.items():
             pair = pair_context.split("_")[0]
-            matches = re.findall(pattern, article_content, re.IGNORECASE)
+            matches = pattern.findall(normalized)
             
             if matches:
                 for match in matches:
-                    # Nettoyer la valeur extraite
-                    cleaned_match = match.replace(',', '.').strip()
-                    # S'assurer qu'il n'y a pas de point final
-                    if cleaned_match.endswith('.'):
-                        cleaned_match = cleaned_match[:-1]
+                    # Nettoyer la valeur extraite (virgule décimale, point final)
+                    cleaned_match = _clean_number(match)
                     
                     # Vérifier si cette valeur a déjà été traitée
                     if f"{pair}:{cleaned_match}" in processed_values:
@@ -1237,16 +1640,12 @@ class EconomicDataValidator:
                     processed_values.add(f"{pair}:{cleaned_match}")
                     
                     # Vérifier que la valeur est dans une plage réaliste pour la paire
-                    is_realistic = False
-                    if pair == "EUR/USD" and 1.0 <= float(cleaned_match) <= 1.5:
-                        is_realistic = True
-                    elif pair == "GBP/USD" and 1.0 <= float(cleaned_match) <= 1.5:
-                        is_realistic = True
-                    elif pair == "USD/JPY" and 100.0 <= float(cleaned_match) <= 160.0:
-                        is_realistic = True
+                    # (la valeur n'est convertie qu'une fois, et seulement pour les paires bornées)
+                    bounds = _FOREX_REALISTIC_RANGES.get(pair)
+                    article_rate = float(cleaned_match) if bounds else None
+                    is_realistic = bounds is not None and bounds[0] <= article_rate <= bounds[1]
                     
                     if is_realistic:
-                        article_rate = float(cleaned_match)
                         current_rate = self._get_rate_for_pair(pair, current_rates)
                         
                         if current_rate:
@@ -1258,31 +1657,32 @@ class EconomicDataValidator:
                             if is_accurate:
                                 results["metrics_accurate"] += 1
                             
-                            results["details"].append({
-                                "pair": pair,
-                                "article_value": article_rate,
-                                "current_value": current_rate,
-                                "difference_pct": round(diff_pct, 2),
-                                "is_accurate": is_accurate
-                            })
+                            if include_details:
+                                results["details"].append({
+                                    "pair": pair,
+                                    "article_value": article_rate,
+                                    "current_value": current_rate,
+                                    "difference_pct": round(diff_pct, 2),
+                                    "is_accurate": is_accurate
+                                })
         
-        print(f"✅ Taux de change récupérés avec succès: EUR/USD={current_rates.get('EUR/USD', 'N/A')}, GBP/USD={current_rates.get('GBP/USD', 'N/A')}, USD/JPY={current_rates.get('USD/JPY', 'N/A')}")
         return results
     
-    def _validate_inflation_data(self, article_content: str) -> Dict[str, Any]:
+    def _validate_inflation_data(self, article_content: str, normalized: str, now: float, include_details: bool = True) -> Dict[str, Any]:
         """
         Valide les données d'inflation mentionnées dans l'article
         
         Args:
             article_content: Le contenu de l'article
+            normalized: Le contenu normalisé (minuscules) sur lequel les motifs sont appliqués
+            now: Instant de la validation (time.monotonic), partagé par les contrôles de cache
+            include_details: Si False, seuls les compteurs sont produits (pas de détails)
             
         Returns:
             Résultats de validation pour les données d'inflation
         """
-        print("🔍 Validation des données d'inflation...")
-        
         # Obtenir les données d'inflation actuelles
-        current_inflation = self._get_current_inflation_data()
+        current_inflation = self._get_current_inflation_data(now)
         
         results = {
             "metrics_found": 0,
@@ -1290,30 +1690,6 @@ class EconomicDataValidator:
             "details": []
         }
         
-        # Modèles regex plus précis pour détecter les mentions d'inflation
-        # Utilisation de contextes spécifiques pour éviter les faux positifs
-        patterns = {
-            "CPI_headline": r"(?:headline\s+(?:CPI|inflation)|CPI\s+headline|inflation\s+headline)(?:\s+\(?YoY\)?)?(?:\s+rate)?:?\s*(?:at|of|is|at|stands at|reached|hit)?\s*(?:\*\*)?(\d+[.,]\d+)(?:\*\*)?\s*%(?!\s*increase|\s*decrease|\s*change)",
-            "CPI_core": r"(?:core\s+(?:CPI|inflation)|CPI\s+core|inflation\s+core)(?:\s+\(?YoY\)?)?(?:\s+rate)?:?\s*(?:at|of|is|at|stands at|reached|hit)?\s*(?:\*\*)?(\d+[.,]\d+)(?:\*\*)?\s*%(?!\s*increase|\s*decrease|\s*change)"
-        }
-        
-        # Contextes spécifiques pour renforcer la détection
-        context_patterns = {
-            "CPI_headline": [
-                r"headline inflation (?:rate|figure|data|reading)?\s*(?:of|at|is|was|stands at|reached|hit)?\s*(?:\*\*)?(\d+[.,]\d+)(?:\*\*)?\s*%",
-                r"inflation (?:rate|figure|data|reading)? (?:for August|for August 2025)?\s*(?:of|at|is|was|stands at|reached|hit)?\s*(?:\*\*)?(\d+[.,]\d+)(?:\*\*)?\s*%",
-                r"August 2025 CPI data showed headline inflation at (\d+[.,]\d+)%",
-                r"CPI data showed headline inflation at (\d+[.,]\d+)%",
-                r"inflation persisting near (\d+[.,]\d+)%"
-            ],
-            "CPI_core": [
-                r"core inflation (?:rate|figure|data|reading)?\s*(?:of|at|is|was|stands at|reached|hit)?\s*(?:\*\*)?(\d+[.,]\d+)(?:\*\*)?\s*%",
-                r"core CPI (?:rate|figure|data|reading)? (?:for August|for August 2025)?\s*(?:of|at|is|was|stands at|reached|hit)?\s*(?:\*\*)?(\d+[.,]\d+)(?:\*\*)?\s*%",
-                r"August 2025 CPI data showed.+core inflation at (\d+[.,]\d+)%",
-                r"core inflation remains elevated at (\d+[.,]\d+)%"
-            ]
-        }
-        
         # Fonction pour vérifier si une valeur est réaliste
         def is_realistic_inflation(value):
             # Les taux d'inflation sont généralement entre 0% et 20% dans les économies modernes
@@ -1323,8 +1699,8 @@ class EconomicDataValidator:
         processed_values = set()
         
         # Traiter les modèles généraux
-        for metric, pattern in patterns.items():
-            matches = re.findall(pattern, article_content, re.IGNORECASE)
+        for metric, pattern in self._inflation_patterns.items():
+            matches = pattern.findall(normalized)
             
             if matches:
                 for match in matches:
@@ -1351,20 +1727,21 @@ class EconomicDataValidator:
                                 if is_accurate:
                                     results["metrics_accurate"] += 1
                                 
-                                results["details"].append({
-                                    "metric": metric,
-                                    "article_value": article_value,
-                                    "current_value": current_value,
-                                    "is_accurate": is_accurate,
-                                    "difference": round(abs(article_value - current_value), 2)
-                                })
+                                if include_details:
+                                    results["details"].append({
+                                        "metric": metric,
+                                        "article_value": article_value,
+                                        "current_value": current_value,
+                                        "is_accurate": is_accurate,
+                                        "difference": round(abs(article_value - current_value), 2)
+                                    })
                     except ValueError:
-                        print(f"⚠️ Impossible de convertir la valeur d'inflation '{value_str}' en nombre")
+                        logger.warning("⚠️ Impossible de convertir la valeur d'inflation '%s' en nombre", value_str)
         
         # Traiter les contextes spécifiques
-        for metric, context_pattern_list in context_patterns.items():
+        for metric, context_pattern_list in self._inflation_context_patterns.items():
             for pattern in context_pattern_list:
-                matches = re.findall(pattern, article_content, re.IGNORECASE)
+                matches = pattern.findall(normalized)
                 
                 if matches:
                     for match in matches:
@@ -1391,39 +1768,35 @@ class EconomicDataValidator:
                                     if is_accurate:
                                         results["metrics_accurate"] += 1
                                     
-                                    results["details"].append({
-                                        "metric": metric,
-                                        "article_value": article_value,
-                                        "current_value": current_value,
-                                        "is_accurate": is_accurate,
-                                        "difference": round(abs(article_value - current_value), 2),
-                                        "context": "specific"
-                                    })
+                                    if include_details:
+                                        results["details"].append({
+                                            "metric": metric,
+                                            "article_value": article_value,
+                                            "current_value": current_value,
+                                            "is_accurate": is_accurate,
+                                            "difference": round(abs(article_value - current_value), 2),
+                                            "context": "specific"
+                                        })
                         except ValueError:
-                            print(f"⚠️ Impossible de convertir la valeur d'inflation '{value_str}' en nombre")
+                            logger.warning("⚠️ Impossible de convertir la valeur d'inflation '%s' en nombre", value_str)
         
         return results
     
-    def _validate_unemployment_data(self, article_content: str) -> Dict[str, Any]:
+    def _validate_unemployment_data(self, article_content: str, normalized: str, now: float, include_details: bool = True) -> Dict[str, Any]:
         """
         Valide les données de chômage mentionnées dans l'article
         
         Args:
             article_content: Le contenu de l'article
+            normalized: Le contenu normalisé (minuscules) sur lequel les motifs sont appliqués
+            now: Instant de la validation (time.monotonic), partagé par les contrôles de cache
+            include_details: Si False, seuls les compteurs sont produits (pas de détails)
             
         Returns:
             Résultats de validation pour les données de chômage
         """
-        print("🔍 Validation des données de chômage...")
-        
-        # Modèles regex pour détecter les taux de chômage dans l'article
-        patterns = {
-            "unemployment_rate": r"(?:unemployment|chômage)[^%]*?([\d\.,]+)\s*%",
-            "initial_claims": r"(?:initial\s+claims|demandes\s+initiales)[^0-9]*?([\d\.,]+)"
-        }
-        
         # Obtenir les données de chômage actuelles (simulées pour l'instant)
-        current_unemployment = self._get_current_unemployment_data()
+        current_unemployment = self._get_current_unemployment_data(now)
         
         results = {
             "metrics_found": 0,
@@ -1432,16 +1805,13 @@ class EconomicDataValidator:
         }
         
         # Vérifier chaque métrique de chômage
-        for metric, pattern in patterns.items():
-            matches = re.findall(pattern, article_content, re.IGNORECASE)
+        for metric, pattern in self._unemployment_patterns.items():
+            matches = pattern.findall(normalized)
             
             if matches:
                 for match in matches:
-                    # Nettoyer la valeur extraite
-                    cleaned_match = match.replace(',', '.').strip()
-                    # S'assurer qu'il n'y a pas de point final
-                    if cleaned_match.endswith('.'):
-                        cleaned_match = cleaned_match[:-1]
+                    # Nettoyer la valeur extraite (virgule décimale, point final)
+                    cleaned_match = _clean_number(match)
                     article_value = float(cleaned_match)
                     current_value = current_unemployment.get(metric)
                     
@@ -1460,37 +1830,32 @@ class EconomicDataValidator:
                         if is_accurate:
                             results["metrics_accurate"] += 1
                         
-                        results["details"].append({
-                            "metric": metric,
-                            "article_value": article_value,
-                            "current_value": current_value,
-                            "difference": round(diff, 2),
-                            "is_accurate": is_accurate
-                        })
+                        if include_details:
+                            results["details"].append({
+                                "metric": metric,
+                                "article_value": article_value,
+                                "current_value": current_value,
+                                "difference": round(diff, 2),
+                                "is_accurate": is_accurate
+                            })
         
         return results
     
-    def _validate_treasury_yields(self, article_content: str) -> Dict[str, Any]:
+    def _validate_treasury_yields(self, article_content: str, normalized: str, now: float, include_details: bool = True) -> Dict[str, Any]:
         """
         Valide les rendements des bons du Trésor mentionnés dans l'article
         
         Args:
             article_content: Le contenu de l'article
+            normalized: Le contenu normalisé (minuscules) sur lequel les motifs sont appliqués
+            now: Instant de la validation (time.monotonic), partagé par les contrôles de cache
+            include_details: Si False, seuls les compteurs sont produits (pas de détails)
             
         Returns:
             Résultats de validation pour les rendements des bons du Trésor
         """
-        print("🔍 Validation des rendements des bons du Trésor...")
-        
-        # Modèles regex pour détecter les rendements des bons du Trésor dans l'article
-        patterns = {
-            "10Y": r"(?:10[- ]?year|10[- ]?ans)[^%]*?([\d\.,]+)\s*%",
-            "2Y": r"(?:2[- ]?year|2[- ]?ans)[^%]*?([\d\.,]+)\s*%",
-            "30Y": r"(?:30[- ]?year|30[- ]?ans)[^%]*?([\d\.,]+)\s*%"
-        }
-        
         # Obtenir les rendements actuels des bons du Trésor (simulés pour l'instant)
-        current_yields = self._get_current_treasury_yields()
+        current_yields = self._get_current_treasury_yields(now)
         
         results = {
             "metrics_found": 0,
@@ -1499,16 +1864,13 @@ class EconomicDataValidator:
         }
         
         # Vérifier chaque rendement
-        for tenor, pattern in patterns.items():
-            matches = re.findall(pattern, article_content, re.IGNORECASE)
+        for tenor, pattern in self._treasury_patterns.items():
+            matches = pattern.findall(normalized)
             
             if matches:
                 for match in matches:
-                    # Nettoyer la valeur extraite
-                    cleaned_match = match.replace(',', '.').strip()
-                    # S'assurer qu'il n'y a pas de point final
-                    if cleaned_match.endswith('.'):
-                        cleaned_match = cleaned_match[:-1]
+                    # Nettoyer la valeur extraite (virgule décimale, point final)
+                    cleaned_match = _clean_number(match)
                     article_value = float(cleaned_match)
                     current_value = current_yields.get(tenor)
                     
@@ -1521,64 +1883,64 @@ class EconomicDataValidator:
                         if is_accurate:
                             results["metrics_accurate"] += 1
                         
-                        results["details"].append({
-                            "tenor": tenor,
-                            "article_value": article_value,
-                            "current_value": current_value,
-                            "difference": round(diff, 2),
-                            "is_accurate": is_accurate
-                        })
+                        if include_details:
+                            results["details"].append({
+                                "tenor": tenor,
+                                "article_value": article_value,
+                                "current_value": current_value,
+                                "difference": round(diff, 2),
+                                "is_accurate": is_accurate
+                            })
         
         return results
     
-    def _get_current_forex_rates(self) -> Dict[str, float]:
+    @_cached_source("forex", "✅ Utilisation des taux de change en cache")
+    def _get_current_forex_rates(self, now: Optional[float] = None) -> Dict[str, float]:
         """
         Obtient les taux de change actuels depuis une API
         
         Returns:
             Dictionnaire des taux de change actuels
         """
-        # Vérifier si les données en cache sont encore valides
-        if ("forex" in self.cached_data and "forex" in self.cache_timestamp and
-                datetime.now() - self.cache_timestamp["forex"] < self.cache_validity["forex"]):
-            print("✅ Utilisation des taux de change en cache")
-            return self.cached_data["forex"]
-        
         try:
             # Utiliser l'API Exchange Rate pour obtenir les taux actuels
-            response = requests.get(self.data_sources["forex"], timeout=10)
+            response = self._http_get(self.data_sources["forex"])
             if response.status_code == 200:
-                data = response.json()
-                rates = data.get("rates", {})
-                
-                # Calculer les taux croisés
-                forex_rates = {
-                    "EUR/USD": 1 / rates.get("EUR", 1),
-                    "GBP/USD": 1 / rates.get("GBP", 1),
-                    "USD/JPY": rates.get("JPY", 110)
-                }
-                
-                # Mettre en cache les données
-                self.cached_data["forex"] = forex_rates
-                self.cache_timestamp["forex"] = datetime.now()
-                
-                print(f"✅ Taux de change récupérés avec succès: EUR/USD={forex_rates['EUR/USD']:.4f}, GBP/USD={forex_rates['GBP/USD']:.4f}, USD/JPY={forex_rates['USD/JPY']:.2f}")
-                return forex_rates
+                return self._store_forex_rates(response.json())
             else:
-                print(f"⚠️ Erreur lors de la récupération des taux de change: {response.status_code}")
+                logger.warning("⚠️ Erreur lors de la récupération des taux de change: %s", response.status_code)
         except Exception as e:
-            print(f"⚠️ Exception lors de la récupération des taux de change: {str(e)}")
+            logger.warning("⚠️ Exception lors de la récupération des taux de change: %s", e)
         
-        # En cas d'erreur, utiliser des valeurs par défaut récentes (septembre 2025)
-        default_rates = {
-            "EUR/USD": 1.1715,
-            "GBP/USD": 1.353,
-            "USD/JPY": 147.45
-        }
+        # En cas d'erreur, utiliser des valeurs par défaut récentes
+        return self._store_default_forex_rates()
+    
+    def _store_default_forex_rates(self) -> Dict[str, float]:
+        """Met en cache les taux par défaut pour une courte durée, afin de ne pas réinterroger l'API aussitôt"""
+        default_rates = dict(_DEFAULT_FOREX_RATES)
+        self._cache_store("forex", default_rates, validity=_FAILED_FETCH_TTL)
         
-        print("⚠️ Utilisation des taux de change par défaut")
+        logger.warning("⚠️ Utilisation des taux de change par défaut")
         return default_rates
     
+    def _store_forex_rates(self, data: Dict[str, Any]) -> Dict[str, float]:
+        """Calcule les taux croisés depuis la réponse de l'API Exchange Rate et les met en cache"""
+        rates = data.get("rates", {})
+        
+        # Calculer les taux croisés
+        forex_rates = {
+            "EUR/USD": 1 / rates.get("EUR", 1),
+            "GBP/USD": 1 / rates.get("GBP", 1),
+            "USD/JPY": rates.get("JPY", 110)
+        }
+        
+        # Mettre en cache les données
+        self._cache_store("forex", forex_rates)
+        
+        logger.debug("✅ Taux de change récupérés avec succès: EUR/USD=%.4f, GBP/USD=%.4f, USD/JPY=%.2f",
+                     forex_rates["EUR/USD"], forex_rates["GBP/USD"], forex_rates["USD/JPY"])
+        return forex_rates
+    
     def _get_rate_for_pair(self, pair: str, rates: Dict[str, float]) -> Optional[float]:
         """
         Obtient le taux pour une paire de devises spécifique
@@ -1602,19 +1964,14 @@ class EconomicDataValidator:
         # Paire non trouvée
         return None
     
-    def _get_current_inflation_data(self) -> Dict[str, float]:
+    @_cached_source("inflation", "✅ Utilisation des données d'inflation en cache")
+    def _get_current_inflation_data(self, now: Optional[float] = None) -> Dict[str, float]:
         """
         Obtient les données d'inflation actuelles
         
         Returns:
             Dictionnaire des données d'inflation actuelles
         """
-        # Vérifier si les données en cache sont encore valides
-        if ("inflation" in self.cached_data and "inflation" in self.cache_timestamp and
-                datetime.now() - self.cache_timestamp["inflation"] < self.cache_validity["inflation"]):
-            print("✅ Utilisation des données d'inflation en cache")
-            return self.cached_data["inflation"]
-        
         # Pour l'instant, utiliser des valeurs par défaut récentes (août 2025)
         # Dans une implémentation complète, on utiliserait l'API FRED avec une clé API
         inflation_data = {
@@ -1623,25 +1980,19 @@ class EconomicDataValidator:
         }
         
         # Mettre en cache les données
-        self.cached_data["inflation"] = inflation_data
-        self.cache_timestamp["inflation"] = datetime.now()
+        self._cache_store("inflation", inflation_data)
         
-        print(f"✅ Données d'inflation récupérées: Headline={inflation_data['CPI_headline']}%, Core={inflation_data['CPI_core']}%")
+        logger.debug("✅ Données d'inflation récupérées: Headline=%s%%, Core=%s%%", inflation_data["CPI_headline"], inflation_data["CPI_core"])
         return inflation_data
     
-    def _get_current_unemployment_data(self) -> Dict[str, float]:
+    @_cached_source("unemployment", "✅ Utilisation des données de chômage en cache")
+    def _get_current_unemployment_data(self, now: Optional[float] = None) -> Dict[str, float]:
         """
         Obtient les données de chômage actuelles
         
         Returns:
             Dictionnaire des données de chômage actuelles
         """
-        # Vérifier si les données en cache sont encore valides
-        if ("unemployment" in self.cached_data and "unemployment" in self.cache_timestamp and
-                datetime.now() - self.cache_timestamp["unemployment"] < self.cache_validity["unemployment"]):
-            print("✅ Utilisation des données de chômage en cache")
-            return self.cached_data["unemployment"]
-        
         # Pour l'instant, utiliser des valeurs par défaut récentes (août 2025)
         # Dans une implémentation complète, on utiliserait l'API FRED avec une clé API
         unemployment_data = {
@@ -1650,25 +2001,20 @@ class EconomicDataValidator:
         }
         
         # Mettre en cache les données
-        self.cached_data["unemployment"] = unemployment_data
-        self.cache_timestamp["unemployment"] = datetime.now()
+        self._cache_store("unemployment", unemployment_data)
         
-        print(f"✅ Données de chômage récupérées: Taux={unemployment_data['unemployment_rate']}%, Demandes initiales={unemployment_data['initial_claims']}")
+        logger.debug("✅ Données de chômage récupérées: Taux=%s%%, Demandes initiales=%s",
+                     unemployment_data["unemployment_rate"], unemployment_data["initial_claims"])
         return unemployment_data
     
-    def _get_current_treasury_yields(self) -> Dict[str, float]:
+    @_cached_source("treasury", "✅ Utilisation des rendements du Trésor en cache")
+    def _get_current_treasury_yields(self, now: Optional[float] = None) -> Dict[str, float]:
         """
         Obtient les rendements actuels des bons du Trésor
         
         Returns:
             Dictionnaire des rendements actuels des bons du Trésor
         """
-        # Vérifier si les données en cache sont encore valides
-        if ("treasury" in self.cached_data and "treasury" in self.cache_timestamp and
-                datetime.now() - self.cache_timestamp["treasury"] < self.cache_validity["treasury"]):
-            print("✅ Utilisation des rendements du Trésor en cache")
-            return self.cached_data["treasury"]
-        
         # Pour l'instant, utiliser des valeurs par défaut récentes (septembre 2025)
         # Dans une implémentation complète, on utiliserait l'API du Trésor US
         treasury_yields = {
@@ -1678,15 +2024,16 @@ class EconomicDataValidator:
         }
         
         # Mettre en cache les données
-        self.cached_data["treasury"] = treasury_yields
-        self.cache_timestamp["treasury"] = datetime.now()
+        self._cache_store("treasury", treasury_yields)
         
-        print(f"✅ Rendements du Trésor récupérés: 2Y={treasury_yields['2Y']}%, 10Y={treasury_yields['10Y']}%, 30Y={treasury_yields['30Y']}%")
+        logger.debug("✅ Rendements du Trésor récupérés: 2Y=%s%%, 10Y=%s%%, 30Y=%s%%",
+                     treasury_yields["2Y"], treasury_yields["10Y"], treasury_yields["30Y"])
         return treasury_yields
 
 
 # Test unitaire
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
     print("🧪 TESTING ECONOMIC DATA VALIDATOR")
     print("=" * 60)
     
@@ -4,15 +4,19 @@
 import json
 import re
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 class SEOHTMLGenerator:
     """Générateur HTML optimisé SEO à partir du JSON CrewAI"""
     
-    def __init__(self, json_file_path: str):
-        """Charger le fichier JSON généré par CrewAI"""
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+    def __init__(self, json_file_path: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
+        """Charger le fichier JSON généré par CrewAI, ou utiliser directement l'article déjà en mémoire (data)"""
+        if data is None:
+            if json_file_path is None:
+                raise ValueError("json_file_path or data is required")
+            with open(json_file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        self.data = data
         
         # Extraire les données clés
         self.article = self.data.get('article', {})
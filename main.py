@@ -88,7 +88,14 @@ print("🎯 SYSTEM READY FOR ADAPTIVE KEYWORD RESEARCH!")
 print("=" * 60)
 
 # Define the Original Prompt/Headline
-HEADLINE = "US stock markets start flat and finish flat"
+# Priorité : topic.json (écrit par change_topic.py) > variable d'environnement HEADLINE > sujet par défaut
+DEFAULT_HEADLINE = "US stock markets start flat and finish flat"
+TOPIC_FILE = "topic.json"
+if os.path.exists(TOPIC_FILE):
+    with open(TOPIC_FILE, 'r', encoding='utf-8') as f:
+        HEADLINE = json.load(f)["headline"]
+else:
+    HEADLINE = os.getenv("HEADLINE", DEFAULT_HEADLINE)
 
 # ADAPTIVE ANALYSIS SYSTEM (NO MORE HARDCODING!)
 print("\n🧠 ADAPTIVE HEADLINE ANALYSIS...")
@@ -475,7 +482,8 @@ crew = Crew(
 )
 
 # Execute the Crew
-if __name__ == "__main__":
+def generate(output_path: str = "seo_article_output.json") -> Dict[str, Any]:
+    """Exécute le crew, valide les données économiques et écrit l'article JSON ; retourne l'article (dict)"""
     print("Starting CrewAI execution with adaptive headline analysis...")
     print(f"Processing headline: {HEADLINE[:50]}...")
     print(f"Using {len(search_terms)} dynamically generated search terms")
@@ -498,14 +506,14 @@ if __name__ == "__main__":
         except json.JSONDecodeError:
             print("❌ Error: Unable to parse JSON")
             print(f"Raw content: {json_content[:500]}...")
-            exit(1)
+            raise ValueError("Unable to parse crew output as JSON")
     elif hasattr(json_content, 'dict'):
         json_content = json_content.dict()
     elif not isinstance(json_content, dict):
         print("❌ Error: Unexpected result format")
         print(f"Result type: {type(json_content)}")
         print(f"Result content: {str(json_content)[:500]}...")
-        exit(1)
+        raise ValueError(f"Unexpected crew result format: {type(json_content)}")
     
     print(json.dumps(json_content, indent=2, ensure_ascii=False))
     
@@ -566,9 +574,9 @@ if __name__ == "__main__":
         print("✅ Toutes les données économiques sont exactes et à jour!")
     
     # Save to file
-    with open("seo_article_output.json", "w", encoding="utf-8") as f:
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:  # json.dump fait de nombreuses petites écritures
         json.dump(json_content, f, indent=2, ensure_ascii=False)
-    print("\nOutput saved to 'seo_article_output.json'")
+    print(f"\nOutput saved to '{output_path}'")
     
     # Verify title optimization
     if 'article' in json_content:
@@ -597,4 +605,12 @@ if __name__ == "__main__":
     print(f"🔍 Search terms generated: {len(search_terms)} (adaptively from context)")
     print(f"🚀 Advanced tools used: Google Trends + Autocomplete + Competition Analysis")
     print("💡 All keywords adapted specifically to headline content - NO hardcoding!")
-    print("=" * 70)
\ No newline at end of file
+    print("=" * 70)
+    
+    return json_content
+
+if __name__ == "__main__":
+    try:
+        generate()
+    except ValueError:
+        exit(1)
@@ -6,6 +6,7 @@ Teste toutes les nouvelles fonctionnalités sans exécuter le système complet
 
 import sys
 import os
+import asyncio
 from typing import Dict, Any
 
 def test_adaptive_system():
@@ -99,7 +100,7 @@ def test_adaptive_system():
         print(f"   Sample: {questions[0] if questions else 'None'}")
         
         # Test de difficulty estimation (une seule pour éviter trop de requêtes)
-        difficulty = advanced_tool.estimate_keyword_difficulty("consumer sentiment")
+        difficulty = asyncio.run(advanced_tool.estimate_keyword_difficulty("consumer sentiment"))
         print(f"✅ Keyword difficulty estimated: {difficulty.get('difficulty', 'Unknown')}")
         
         # Résultat final